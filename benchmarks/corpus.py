@@ -0,0 +1,57 @@
+# benchmarks/corpus.py
+
+# Benchmark corpora
+# -----------------
+# Fixed inputs so runs are comparable with each other and with the stored
+# baseline. Do not edit the puzzles without regenerating baseline.json.
+# The unit tests keep their own copy in tests/board_corpus.py.
+# -----------------
+import random
+from core.generator import string_to_grid
+from core.solver import solve
+
+# Well-known hard puzzles (all with a unique solution)
+HARD_PUZZLES = [
+    # "AI Escargot" (Arto Inkala, 2006)
+    "100007090030020008009600500005300900010080002600004000300000010040000007007000300",
+    # Arto Inkala, 2010 ("world's hardest sudoku")
+    "800000000003600000070090200050007000000045700000100030001000068008500010090000400",
+    # "Easter Monster"
+    "100000002090400050006000700050903000000070000000850040700000600030009080002000001",
+    # "Golden Nugget"
+    "000000039000001005003050800008090006070002000100400000009080050020000600400700000",
+    # "Platinum Blonde"
+    "000000012000000003002300400001800005060070800000009000008500000900040500470006000",
+    # 17-clue puzzles
+    "000000001000000023004005000000100000000030600007000580000067000010004000520000000",
+    "000000010400000000020000000000050407008000300001090000300400200050100000000806000",
+    "000000012003600000000007000410020000000500300700000600280000040000300500000000000",
+]
+
+MID_GAME_SEED = 894
+MID_GAME_FILL = 0.5  # fraction of a puzzle's empty cells filled in from its solution
+
+
+#
+# Mid-game boards: each hard puzzle with half of its empty cells filled in
+# correctly (same cells every run), so the heuristics see realistic
+# candidate grids rather than nearly empty ones.
+#
+# Returns:
+#    list of 9x9 grids (0 = empty)
+#
+def mid_game_boards():
+    rng = random.Random(MID_GAME_SEED)
+    boards = []
+    for text in HARD_PUZZLES:
+        puzzle = string_to_grid(text)
+        solution = solve(puzzle)
+        empty = [(r, c) for r in range(9) for c in range(9) if puzzle[r][c] == 0]
+        for r, c in rng.sample(empty, int(len(empty) * MID_GAME_FILL)):
+            puzzle[r][c] = solution[r][c]
+        boards.append(puzzle)
+    return boards
+
+
+def hard_puzzles():
+    return [string_to_grid(text) for text in HARD_PUZZLES]
@@ -0,0 +1,249 @@
+# benchmarks/run.py
+
+# Headless benchmark suite
+# ------------------------
+# Times the generator, the solver, the hint context and the hint heuristics on
+# fixed corpora (benchmarks/corpus.py) and compares the results with a stored
+# baseline.
+#
+# Run from the repository root:
+#    PYTHONPATH=src python -m benchmarks.run                   # compare with baseline.json
+#    PYTHONPATH=src python -m benchmarks.run --save-baseline   # record a new baseline
+#    PYTHONPATH=src python -m benchmarks.run -k hint --quick   # subset, fewer repeats
+#
+# Every benchmark is a list of cases (zero-argument callables); each case is
+# timed `repeat` times. A benchmark regresses when its median latency is
+# more than `threshold` (default 25%) above the baseline median, and the
+# process then exits with status 1. Baselines are machine-specific - record
+# one on the machine you compare on.
+# ------------------------
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")  # Board needs no window
+
+import argparse
+import json
+import random
+import sys
+import time
+
+from core.generator import generate_sudoku
+from core.solver import solve, count_solutions
+from core.profiler import percentile
+from core.tables import CELL_COUNT, ROW_OF, COL_OF, POPCOUNT, DIGIT_OF_BIT
+from hints.engine.hint_engine import HintEngine
+from hints.heuristics.subsets import find_naked_subsets
+from hints.utils.context import HintContext
+from hints.utils.links import LinkIndex
+from hints.utils.elimination_utils import find_eliminations
+from ui.board import Board
+from benchmarks.corpus import hard_puzzles, mid_game_boards
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+DEFAULT_THRESHOLD = 0.25
+DEFAULT_REPEAT = 5
+QUICK_REPEAT = 1
+DIFFICULTIES = ("easy", "medium", "hard", "expert")
+GENERATE_SEEDS = range(5)
+
+
+# ------------------- Cases -------------------
+def _generate_cases(difficulty):
+    return [lambda seed=seed: generate_sudoku(difficulty, random.Random(seed)) for seed in GENERATE_SEEDS]
+
+
+def _solver_cases(func):
+    return [lambda grid=grid: func(grid) for grid in hard_puzzles()]
+
+
+def _mid_game_contexts():
+    # (board, context) per mid-game board; the context and its lazily built
+    # tables are built up front so the heuristics are timed on their own and
+    # the first repeat costs the same as the rest (see the context.* cases)
+    contexts = []
+    for grid in mid_game_boards():
+        board = Board(size=9, puzzle=grid)
+        context = HintContext(board)
+        context.candidate_cells
+        context.links
+        contexts.append((board, context))
+    return contexts
+
+
+def _context_cases():
+    # A hint pass's own context: candidate grid and per-digit cell bitsets
+    def build(board):
+        context = HintContext(board)
+        context.candidate_cells
+    return [lambda board=board: build(board) for board, _ in _mid_game_contexts()]
+
+
+def _link_cases():
+    return [lambda context=context: LinkIndex(context) for _, context in _mid_game_contexts()]
+
+
+def _heuristic_cases(func):
+    return [lambda board=board, context=context: func(board, context)
+            for board, context in _mid_game_contexts()]
+
+
+def _single_elimination_cases():
+    # Every cell with one candidate left, eliminated from its peers
+    cases = []
+    for board, context in _mid_game_contexts():
+        confirmed = [(ROW_OF[i], COL_OF[i], DIGIT_OF_BIT[context.masks[i]])
+                     for i in range(CELL_COUNT) if not context.values[i] and POPCOUNT[context.masks[i]] == 1]
+        cases.append(lambda board=board, context=context, confirmed=confirmed:
+                     find_eliminations(board, confirmed, "Naked Singles", context))
+    return cases
+
+
+def _naked_pair_cases():
+    # The subset engine on its own, pairs being the size the hint pass asks for first
+    return [lambda board=board, context=context: find_naked_subsets(board, 2, context)
+            for board, context in _mid_game_contexts()]
+
+
+#
+# Benchmark name -> function building its cases. Built lazily so `-k`
+# only pays for the benchmarks it selects.
+#
+def benchmark_suite():
+    suite = {}
+    for difficulty in DIFFICULTIES:
+        suite[f"generate.{difficulty}"] = lambda difficulty=difficulty: _generate_cases(difficulty)
+    suite["solve.hard"] = lambda: _solver_cases(solve)
+    suite["count_solutions.hard"] = lambda: _solver_cases(lambda grid: count_solutions(grid, 2))
+    suite["context.build"] = _context_cases
+    suite["context.links"] = _link_cases
+    for name, func in HintEngine.FUNCTIONS.items():
+        suite[f"hint.{name}"] = lambda func=func: _heuristic_cases(func)
+    suite["find_eliminations.singles"] = _single_elimination_cases
+    suite["find_naked_subsets.pairs"] = _naked_pair_cases
+    return suite
+
+
+# ------------------- Measuring -------------------
+#
+# Time every case `repeat` times.
+#
+# Returns:
+#    list of per-call latencies in seconds
+#
+def measure(cases, repeat=DEFAULT_REPEAT):
+    samples = []
+    for _ in range(repeat):
+        for case in cases:
+            start = time.perf_counter()
+            case()
+            samples.append(time.perf_counter() - start)
+    return samples
+
+
+#
+# Throughput and latency percentiles (milliseconds) for one benchmark.
+#
+def summarize(samples):
+    ordered = sorted(samples)
+    total = sum(ordered)
+    return {
+        "calls": len(ordered),
+        "ops_per_s": len(ordered) / total if total else None,
+        "p50_ms": percentile(ordered, 50) * 1000 if ordered else None,
+        "p95_ms": percentile(ordered, 95) * 1000 if ordered else None,
+        "p99_ms": percentile(ordered, 99) * 1000 if ordered else None,
+    }
+
+
+def run_suite(names=None, repeat=DEFAULT_REPEAT):
+    # {name: summary} for the selected benchmarks (all when names is None)
+    results = {}
+    for name, build in benchmark_suite().items():
+        if names is None or name in names:
+            results[name] = summarize(measure(build(), repeat))
+    return results
+
+
+#
+# Compare results with a baseline.
+#
+# Returns:
+#    list of (name, baseline p50, current p50, ratio) for every benchmark
+#    whose median got more than `threshold` slower. Benchmarks missing from
+#    either side are ignored.
+#
+def find_regressions(results, baseline, threshold=DEFAULT_THRESHOLD):
+    regressions = []
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if not previous or not previous.get("p50_ms") or current["p50_ms"] is None:
+            continue
+        ratio = current["p50_ms"] / previous["p50_ms"]
+        if ratio > 1 + threshold:
+            regressions.append((name, previous["p50_ms"], current["p50_ms"], ratio))
+    return regressions
+
+
+def load_baseline(path=BASELINE_PATH):
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        return json.load(f)["benchmarks"]
+
+
+def save_baseline(results, path=BASELINE_PATH):
+    with open(path, "w") as f:
+        json.dump({"python": sys.version.split()[0], "benchmarks": results}, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def format_table(results, baseline):
+    lines = [f"{'benchmark':<28} {'ops/s':>10} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'vs base':>8}"]
+    for name, r in results.items():
+        previous = baseline.get(name, {}).get("p50_ms")
+        change = f"{r['p50_ms'] / previous - 1:+.0%}" if previous else "-"
+        lines.append(f"{name:<28} {r['ops_per_s']:>10.1f} {r['p50_ms']:>9.3f} "
+                     f"{r['p95_ms']:>9.3f} {r['p99_ms']:>9.3f} {change:>8}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the Sudoku Trainer benchmarks.")
+    parser.add_argument("-k", "--keyword", default=None,
+                        help="only run benchmarks whose name contains this text")
+    parser.add_argument("-r", "--repeat", type=int, default=None,
+                        help=f"timed runs per case (default {DEFAULT_REPEAT})")
+    parser.add_argument("--quick", action="store_true", help=f"shorthand for --repeat {QUICK_REPEAT}")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="baseline JSON file")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="allowed median slowdown before failing (0.25 = 25%%)")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="write the results as the new baseline instead of comparing")
+    parser.add_argument("-o", "--output", default=None, help="also write the results as JSON here")
+    args = parser.parse_args(argv)
+
+    repeat = args.repeat or (QUICK_REPEAT if args.quick else DEFAULT_REPEAT)
+    names = None
+    if args.keyword:
+        names = [name for name in benchmark_suite() if args.keyword in name]
+
+    results = run_suite(names, repeat)
+    baseline = load_baseline(args.baseline)
+    print(format_table(results, baseline))
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+
+    if args.save_baseline:
+        save_baseline(results, args.baseline)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    regressions = find_regressions(results, baseline, args.threshold)
+    for name, before, after, ratio in regressions:
+        print(f"REGRESSION {name}: p50 {before:.3f} ms -> {after:.3f} ms ({ratio - 1:+.0%})")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
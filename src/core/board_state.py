@@ -0,0 +1,363 @@
+# src/core/board_state.py
+
+# Compact board state
+# -------------------
+# One object holds everything that changes while a puzzle is played:
+#    - values:  81-byte bytearray (0 = empty)
+#    - notes:   81 9-bit pencil-mark masks in an array('H')
+#    - givens / locked: 81-bit integer bitsets
+#    - per-house digit counts and 9-bit digit masks, per-digit totals and
+#      per-digit cell bitsets, all updated incrementally on every set_value()
+#    - a candidate mask per cell, refreshed for the changed cell and its
+#      20 peers only
+#
+# Candidate queries become a couple of ORs, and a board costs well under
+# a kilobyte instead of dozens of nested lists and sets.
+#
+# The *Grid view classes further down expose the state through the old
+# 9x9 list-of-lists interface (board.user_board[r][c], board.notes[r][c],
+# ...) so existing callers keep working.
+# -------------------
+from array import array
+from collections.abc import MutableSet, Sequence
+from core.profiler import profiler
+from core.tables import (GRID_SIZE, CELL_COUNT, ROW_OF, COL_OF, BOX_OF, PEERS,
+                         PEER_MASKS, POPCOUNT, ALL_DIGITS, iter_bits)
+
+
+class BoardState:
+    __slots__ = ("values", "notes", "givens", "locked",
+                 "row_counts", "col_counts", "box_counts",
+                 "row_masks", "col_masks", "box_masks",
+                 "digit_counts", "digit_cells", "cands", "version", "value_version",
+                 "_candidate_sets", "_candidate_sets_version",
+                 "_conflicts", "_conflicts_version")
+
+    def __init__(self):
+        self.values = bytearray(CELL_COUNT)
+        self.notes = array("H", bytes(2 * CELL_COUNT))
+        self.givens = 0
+        self.locked = 0
+
+        # Count of digit d in house h lives at [h * 9 + d - 1]; duplicates are
+        # allowed because players can enter conflicting numbers
+        self.row_counts = bytearray(CELL_COUNT)
+        self.col_counts = bytearray(CELL_COUNT)
+        self.box_counts = bytearray(CELL_COUNT)
+        self.row_masks = array("H", bytes(2 * GRID_SIZE))
+        self.col_masks = array("H", bytes(2 * GRID_SIZE))
+        self.box_masks = array("H", bytes(2 * GRID_SIZE))
+
+        # How many of each digit (index 1-9) are on the board
+        self.digit_counts = array("B", bytes(GRID_SIZE + 1))
+
+        # Cells holding each digit (index 1-9) as an 81-bit bitset
+        self.digit_cells = [0] * (GRID_SIZE + 1)
+
+        # Candidate mask per cell (0 for filled cells); starts as "anything goes"
+        self.cands = array("H", [ALL_DIGITS]) * CELL_COUNT
+
+        # Bumped on every change, so caches can tell when they are stale.
+        # value_version only moves when a value changes (candidates depend on nothing else).
+        self.version = 0
+        self.value_version = 0
+
+        # Shared 9x9 list-of-sets copy of cands, see candidate_sets()
+        self._candidate_sets = None
+        self._candidate_sets_version = -1
+
+        # cell -> conflicting cells, cleared on every value change, see conflicts()
+        self._conflicts = {}
+        self._conflicts_version = -1
+
+    @classmethod
+    def from_grid(cls, grid, givens=True):
+        #
+        # Build a state from a 9x9 list of lists.
+        # givens: mark every non-zero cell as a given
+        #
+        state = cls()
+        for r in range(GRID_SIZE):
+            row = grid[r]
+            for c in range(GRID_SIZE):
+                if row[c]:
+                    i = r * GRID_SIZE + c
+                    state.set_value(i, row[c])
+                    if givens:
+                        state.givens |= 1 << i
+        return state
+
+    # ------------------- Values -------------------
+    def set_value(self, i, digit):
+        # Place digit (1-9) in cell i, or clear it with 0
+        old = self.values[i]
+        if old == digit:
+            return
+        r, c, b = ROW_OF[i], COL_OF[i], BOX_OF[i]
+
+        if old:
+            k = old - 1
+            self.digit_counts[old] -= 1
+            self.digit_cells[old] &= ~(1 << i)
+            self.row_counts[r * GRID_SIZE + k] -= 1
+            if not self.row_counts[r * GRID_SIZE + k]:
+                self.row_masks[r] &= ~(1 << k)
+            self.col_counts[c * GRID_SIZE + k] -= 1
+            if not self.col_counts[c * GRID_SIZE + k]:
+                self.col_masks[c] &= ~(1 << k)
+            self.box_counts[b * GRID_SIZE + k] -= 1
+            if not self.box_counts[b * GRID_SIZE + k]:
+                self.box_masks[b] &= ~(1 << k)
+
+        if digit:
+            k = digit - 1
+            self.digit_counts[digit] += 1
+            self.digit_cells[digit] |= 1 << i
+            self.row_counts[r * GRID_SIZE + k] += 1
+            self.row_masks[r] |= 1 << k
+            self.col_counts[c * GRID_SIZE + k] += 1
+            self.col_masks[c] |= 1 << k
+            self.box_counts[b * GRID_SIZE + k] += 1
+            self.box_masks[b] |= 1 << k
+
+        self.values[i] = digit
+        self.version += 1
+        self.value_version += 1
+
+        # Only this cell and its peers can see a different candidate set
+        self._refresh_candidates(i)
+        for j in PEERS[i]:
+            self._refresh_candidates(j)
+
+    def _refresh_candidates(self, i):
+        if self.values[i]:
+            self.cands[i] = 0
+        else:
+            self.cands[i] = ALL_DIGITS & ~(self.row_masks[ROW_OF[i]]
+                                          | self.col_masks[COL_OF[i]]
+                                          | self.box_masks[BOX_OF[i]])
+
+    def candidates(self, i):
+        # Candidate mask for cell i (bit d-1 = digit d), 0 for filled cells
+        return self.cands[i]
+
+    def candidate_sets(self):
+        #
+        # 9x9 list of candidate sets, rebuilt at most once per value change
+        # and shared by every caller - treat it as read-only.
+        #
+        stale = self._candidate_sets_version != self.value_version
+        profiler.hit("candidates", not stale)
+        if stale:
+            cands = self.cands
+            self._candidate_sets = [
+                [{d for d in range(1, GRID_SIZE + 1) if cands[r * GRID_SIZE + c] >> (d - 1) & 1}
+                 for c in range(GRID_SIZE)]
+                for r in range(GRID_SIZE)]
+            self._candidate_sets_version = self.value_version
+        return self._candidate_sets
+
+    def candidate_count(self, i):
+        return POPCOUNT[self.candidates(i)]
+
+    def conflicts(self, i):
+        #
+        # Cells (flat indices, ascending) that share a house with cell i and
+        # hold the same value. Cached until the next value change.
+        #
+        if self._conflicts_version != self.value_version:
+            self._conflicts.clear()
+            self._conflicts_version = self.value_version
+        result = self._conflicts.get(i)
+        profiler.hit("conflicts", result is not None)
+        if result is None:
+            digit = self.values[i]
+            result = tuple(iter_bits(self.digit_cells[digit] & PEER_MASKS[i])) if digit else ()
+            self._conflicts[i] = result
+        return result
+
+    # ------------------- Flags -------------------
+    def is_given(self, i):
+        return bool(self.givens >> i & 1)
+
+    def is_locked(self, i):
+        return bool(self.locked >> i & 1)
+
+    def set_given(self, i, flag):
+        self.givens = self.givens | (1 << i) if flag else self.givens & ~(1 << i)
+        self.version += 1
+
+    def set_locked(self, i, flag):
+        self.locked = self.locked | (1 << i) if flag else self.locked & ~(1 << i)
+        self.version += 1
+
+    # ------------------- Notes -------------------
+    def toggle_note(self, i, digit):
+        self.notes[i] ^= 1 << (digit - 1)
+        self.version += 1
+
+    def set_notes(self, i, mask):
+        self.notes[i] = mask & ALL_DIGITS
+        self.version += 1
+
+    def to_grid(self):
+        values = self.values
+        return [list(values[r * GRID_SIZE:(r + 1) * GRID_SIZE]) for r in range(GRID_SIZE)]
+
+
+# ------------------- List-of-lists views -------------------
+
+class _GridRow(Sequence):
+    # One row of a grid view; reads and writes go straight to the state
+    __slots__ = ("_grid", "_offset")
+
+    def __init__(self, grid, row):
+        self._grid = grid
+        self._offset = row * GRID_SIZE
+
+    def __len__(self):
+        return GRID_SIZE
+
+    def __getitem__(self, col):
+        if isinstance(col, slice):
+            return [self._grid._get(self._offset + c) for c in range(GRID_SIZE)[col]]
+        if col < 0:
+            col += GRID_SIZE
+        if not 0 <= col < GRID_SIZE:
+            raise IndexError("column index out of range")
+        return self._grid._get(self._offset + col)
+
+    def __setitem__(self, col, value):
+        if col < 0:
+            col += GRID_SIZE
+        if not 0 <= col < GRID_SIZE:
+            raise IndexError("column index out of range")
+        self._grid._set(self._offset + col, value)
+
+    def __eq__(self, other):
+        try:
+            return list(self) == list(other)
+        except TypeError:
+            return NotImplemented
+
+    def __repr__(self):
+        return repr(list(self))
+
+
+class _GridView(Sequence):
+    # 9x9 view over a BoardState; subclasses choose what a cell means
+    __slots__ = ("_state",)
+
+    def __init__(self, state):
+        self._state = state
+
+    def __len__(self):
+        return GRID_SIZE
+
+    def __getitem__(self, row):
+        if isinstance(row, slice):
+            return [_GridRow(self, r) for r in range(GRID_SIZE)[row]]
+        if row < 0:
+            row += GRID_SIZE
+        if not 0 <= row < GRID_SIZE:
+            raise IndexError("row index out of range")
+        return _GridRow(self, row)
+
+    def __eq__(self, other):
+        try:
+            return [list(row) for row in self] == [list(row) for row in other]
+        except TypeError:
+            return NotImplemented
+
+    def __repr__(self):
+        return repr([list(row) for row in self])
+
+
+class ValueGrid(_GridView):
+    # Current values (givens + player entries)
+    __slots__ = ()
+
+    def _get(self, i):
+        return self._state.values[i]
+
+    def _set(self, i, value):
+        self._state.set_value(i, int(value))
+
+
+class GivenGrid(_GridView):
+    # The original puzzle: values of given cells, 0 elsewhere
+    __slots__ = ()
+
+    def _get(self, i):
+        return self._state.values[i] if self._state.givens >> i & 1 else 0
+
+    def _set(self, i, value):
+        self._state.set_value(i, int(value))
+        self._state.set_given(i, bool(value))
+
+
+class GivenFlags(_GridView):
+    # 1 where a cell is a given, else 0
+    __slots__ = ()
+
+    def _get(self, i):
+        return self._state.givens >> i & 1
+
+    def _set(self, i, value):
+        self._state.set_given(i, bool(value))
+
+
+class LockedFlags(_GridView):
+    # 1 where a cell holds a correct (locked) player entry, else 0
+    __slots__ = ()
+
+    def _get(self, i):
+        return self._state.locked >> i & 1
+
+    def _set(self, i, value):
+        self._state.set_locked(i, bool(value))
+
+
+class NoteSet(MutableSet):
+    # Set-like view of one cell's pencil marks
+    __slots__ = ("_state", "_i")
+
+    def __init__(self, state, i):
+        self._state = state
+        self._i = i
+
+    def __contains__(self, digit):
+        return isinstance(digit, int) and 1 <= digit <= GRID_SIZE \
+            and bool(self._state.notes[self._i] >> (digit - 1) & 1)
+
+    def __iter__(self):
+        mask = self._state.notes[self._i]
+        return (d for d in range(1, GRID_SIZE + 1) if mask >> (d - 1) & 1)
+
+    def __len__(self):
+        return POPCOUNT[self._state.notes[self._i]]
+
+    def add(self, digit):
+        if digit not in self:
+            self._state.toggle_note(self._i, digit)
+
+    def discard(self, digit):
+        if digit in self:
+            self._state.toggle_note(self._i, digit)
+
+    def __repr__(self):
+        return repr(set(self))
+
+
+class NotesGrid(_GridView):
+    # notes[r][c] is a NoteSet; assigning any iterable of digits replaces it
+    __slots__ = ()
+
+    def _get(self, i):
+        return NoteSet(self._state, i)
+
+    def _set(self, i, digits):
+        mask = 0
+        for d in digits:
+            mask |= 1 << (d - 1)
+        self._state.set_notes(i, mask)
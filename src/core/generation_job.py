@@ -0,0 +1,60 @@
+# src/core/generation_job.py
+
+# Background puzzle generation
+# ----------------------------
+# Runs generate_sudoku on a worker thread so the pygame main thread keeps
+# rendering. The main loop polls `done` / `progress` once per frame and can
+# call `cancel()` at any time.
+# ----------------------------
+import threading
+from core.generator import generate_sudoku, GenerationCancelled
+
+
+class GenerationJob:
+    #
+    # Args:
+    #    difficulty: difficulty passed to generate_sudoku
+    #    generate: generator function, generate(difficulty, progress=..., cancel=...)
+    #
+    def __init__(self, difficulty, generate=generate_sudoku):
+        self.difficulty = difficulty
+        self.generate = generate
+
+        self.progress = 0.0     # 0.0 - 1.0, updated from the worker thread
+        self.result = None      # (puzzle, solution) once finished
+        self.error = None       # exception raised by the generator, if any
+        self.cancelled = False
+
+        self._cancel = threading.Event()
+        self._done = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="GenerationJob", daemon=True)
+        self._thread.start()
+
+    @property
+    def done(self):
+        # True once the worker has finished (successfully, with an error, or cancelled)
+        return self._done.is_set()
+
+    def cancel(self):
+        # Ask the worker to stop at its next removal step
+        self._cancel.set()
+
+    def wait(self, timeout=None):
+        # Block until the worker finishes - used by tests, never by the UI
+        return self._done.wait(timeout)
+
+    def _set_progress(self, fraction):
+        self.progress = min(1.0, max(self.progress, fraction))
+
+    def _run(self):
+        try:
+            self.result = self.generate(self.difficulty,
+                                        progress=self._set_progress,
+                                        cancel=self._cancel)
+        except GenerationCancelled:
+            self.cancelled = True
+        except Exception as e:
+            print(f"Error generating {self.difficulty} puzzle: {e}")
+            self.error = e
+        finally:
+            self._done.set()
@@ -1,92 +1,99 @@
+import argparse
+import os
 import random
 import copy
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from core import solver
 
 GRID_SIZE = 9
 BOX_SIZE = 3
 
-def valid(board, row, col, num):
-    # Check row & col
-    if num in board[row]: return False
-    if num in [board[r][col] for r in range(GRID_SIZE)]: return False
-    
-    # Check 3x3 box
-    start_row, start_col = (row // BOX_SIZE) * BOX_SIZE, (col // BOX_SIZE) * BOX_SIZE
-    for r in range(start_row, start_row + BOX_SIZE):
-        for c in range(start_col, start_col + BOX_SIZE):
-            if board[r][c] == num:
-                return False
-    return True
+class GenerationCancelled(Exception):
+    # Raised when a caller cancels generation through its cancel event
+    pass
 
 def solve(board):
+    # Solve board in place using the shared bitmask solver
+    solution = solver.solve(board)
+    if solution is None:
+        return False
     for row in range(GRID_SIZE):
-        for col in range(GRID_SIZE):
-            if board[row][col] == 0:
-                for num in range(1, GRID_SIZE+1):
-                    if valid(board, row, col, num):
-                        board[row][col] = num
-                        if solve(board):
-                            return True
-                        board[row][col] = 0
-                return False
+        board[row][:] = solution[row]
     return True
 
-def fill_board(board):
-    numbers = list(range(1, GRID_SIZE+1))
+#
+# Fill an (empty or partial) board in place with a random valid solution.
+# rng: random.Random (or the random module) used to shuffle digit order
+#
+def fill_board(board, rng=random):
+    solution = solver.solve(board, rng=rng)
+    if solution is None:
+        return False
     for row in range(GRID_SIZE):
-        for col in range(GRID_SIZE):
-            if board[row][col] == 0:
-                random.shuffle(numbers)
-                for num in numbers:
-                    if valid(board, row, col, num):
-                        board[row][col] = num
-                        if fill_board(board):
-                            return True
-                        board[row][col] = 0
-                return False
+        board[row][:] = solution[row]
     return True
 
-def remove_numbers(board, clues_target):
-    #Remove numbers until only clues_target remain, guarentees unique solution."""
+#
+# Remove numbers until only clues_target remain, guarantees unique solution.
+#
+# The solver state (house masks) is kept across removals instead of being
+# rebuilt for every attempt. Since the board is known to have a unique
+# solution before a removal, any second solution must differ in the cell
+# that was just emptied - so only the other candidates of that cell are
+# searched. The clue count is tracked as a running counter, and removal
+# stops as soon as the remaining cells can no longer bring it down to
+# clues_target.
+#
+# Args:
+#    progress: optional callback, called with a 0.0-1.0 fraction as removal advances
+#    cancel: optional threading.Event - raises GenerationCancelled once set
+#
+def remove_numbers(board, clues_target, rng=random, progress=None, cancel=None):
     cells = [(r, c) for r in range(GRID_SIZE) for c in range(GRID_SIZE)]
-    random.shuffle(cells)
+    rng.shuffle(cells)
+
+    state = solver.SolverState(board)
+    clue_count = sum(cell != 0 for row in board for cell in row)
+
+    # Progress is whichever is further along: clues removed or cells tried
+    start_count = clue_count
+    total_cells = len(cells)
+    to_remove = max(1, start_count - clues_target)
+
+    while clue_count > clues_target and cells:
+        if cancel is not None and cancel.is_set():
+            raise GenerationCancelled()
+        if progress is not None:
+            progress(max((start_count - clue_count) / to_remove,
+                         (total_cells - len(cells)) / total_cells))
+
+        # Unrecoverable - even removing every remaining cell misses the target
+        if clue_count - len(cells) > clues_target:
+            break
 
-    while sum(cell != 0 for row in board for cell in row) > clues_target and cells:
         row, col = cells.pop()
         if board[row][col] == 0:
             continue
 
+        index = row * GRID_SIZE + col
         backup = board[row][col]
-        board[row][col] = 0
-
-        # Copy for solver
-        board_copy = [r[:] for r in board]
-        solutions = [0]
-        
-        def count_solutions(b, solutions, limit=2):
-            if solutions[0] >= limit:
-                return
-            for r in range(GRID_SIZE):
-                for c in range(GRID_SIZE):
-                    if b[r][c] == 0:
-                        for n in range(1, GRID_SIZE+1):
-                            if valid(b, r, c, n):
-                                b[r][c] = n
-                                count_solutions(b, solutions, limit)
-                                b[r][c] = 0
-                        return
-            solutions[0] += 1
-            
-        count_solutions(board_copy, solutions)
-
-        # If not unique, undo removal
-        if solutions[0] != 1:
-            board[row][col] = backup
-        
+        state.clear(index)
+
+        # If another digit fits here, the puzzle is no longer unique - undo
+        if state.has_solution_without(index, backup):
+            state.place(index, backup)
+        else:
+            board[row][col] = 0
+            clue_count -= 1
+
+    if progress is not None:
+        progress(1.0)
     return board
 
-def generate_sudoku(difficulty="easy"):
+def generate_sudoku(difficulty="easy", rng=random, progress=None, cancel=None):
     board = [[0]*GRID_SIZE for _ in range(GRID_SIZE)]
-    fill_board(board)
+    fill_board(board, rng)
 
     # keep copy of the fully solved board
     solution = copy.deepcopy(board)
@@ -99,10 +106,84 @@ def generate_sudoku(difficulty="easy"):
     }
 
     clues_target = difficulty_map.get(difficulty, 40)  # default = easy
-    puzzle = remove_numbers(board, clues_target)
+    puzzle = remove_numbers(board, clues_target, rng, progress, cancel)
     return puzzle, solution
 
+# ------------------- Batch generation -------------------
+
+# Serialize a 9x9 grid as an 81-character digit string (0 = empty)
+def grid_to_string(grid):
+    return "".join(str(cell) for row in grid for cell in row)
+
+# Parse an 81-character digit string back into a 9x9 grid
+def string_to_grid(text):
+    if len(text) != GRID_SIZE * GRID_SIZE:
+        raise ValueError(f"Expected {GRID_SIZE * GRID_SIZE} digits, got {len(text)}")
+    return [[int(ch) for ch in text[r * GRID_SIZE:(r + 1) * GRID_SIZE]] for r in range(GRID_SIZE)]
+
+def _generate_chunk(difficulty, seeded_indices):
+    # Worker entry point: one independent RNG per puzzle, seeded by the parent
+    return [(index, *generate_sudoku(difficulty, random.Random(seed)))
+            for index, seed in seeded_indices]
+
+#
+# Generate n puzzles across a process pool.
+#
+# Args:
+#    n: number of puzzles
+#    difficulty: "easy", "medium", "hard" or "expert"
+#    workers: number of processes (default: os.cpu_count()). 1 runs inline.
+#    seed: master seed. Every puzzle gets its own RNG seeded from it, so the
+#          same seed yields the same puzzles regardless of worker count.
+#
+# Yields:
+#    (index, puzzle, solution) tuples in completion order
+#
+def generate_batch(n, difficulty="easy", workers=None, seed=None):
+    master = random.Random(seed)
+    seeded = [(index, master.getrandbits(64)) for index in range(n)]
+    workers = max(1, workers or os.cpu_count() or 1)
+
+    if workers == 1 or n <= 1:
+        for index, seed_value in seeded:
+            yield (index, *generate_sudoku(difficulty, random.Random(seed_value)))
+        return
+
+    # Several puzzles per task keeps IPC overhead low for large batches
+    chunk_size = max(1, min(64, n // (workers * 4)))
+    chunks = [seeded[i:i + chunk_size] for i in range(0, n, chunk_size)]
+
+    pool = ProcessPoolExecutor(max_workers=workers)
+    try:
+        futures = [pool.submit(_generate_chunk, difficulty, chunk) for chunk in chunks]
+        for future in as_completed(futures):
+            yield from future.result()
+    finally:
+        # Also runs if the caller stops iterating early
+        pool.shutdown(wait=True, cancel_futures=True)
+
+def main(argv=None):
+    # Command line entry point: python -m core.generator -n 1000 -d hard
+    parser = argparse.ArgumentParser(description="Generate Sudoku puzzles in bulk.")
+    parser.add_argument("-n", "--count", type=int, default=1, help="number of puzzles")
+    parser.add_argument("-d", "--difficulty", default="easy",
+                        choices=["easy", "medium", "hard", "expert"])
+    parser.add_argument("-w", "--workers", type=int, default=None,
+                        help="worker processes (default: all cores)")
+    parser.add_argument("-s", "--seed", type=int, default=None, help="master RNG seed")
+    parser.add_argument("-o", "--output", default=None,
+                        help="output file (default: stdout)")
+    args = parser.parse_args(argv)
+
+    out = open(args.output, "w") if args.output else sys.stdout
+    try:
+        # One line per puzzle: index,puzzle,solution
+        for index, puzzle, solution in generate_batch(
+                args.count, args.difficulty, args.workers, args.seed):
+            out.write(f"{index},{grid_to_string(puzzle)},{grid_to_string(solution)}\n")
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
 if __name__ == "__main__":
-    puzzle = generate_sudoku()
-    for row in puzzle:
-        print(row)
+    main()
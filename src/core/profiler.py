@@ -0,0 +1,183 @@
+# src/core/profiler.py
+
+# Lightweight profiling counters
+# ------------------------------
+# One process-wide `profiler` collects:
+#
+#    timings:  name -> durations of timed sections ("frame", "draw.Board",
+#              "hint.Naked Singles", ...). Totals cover the whole session,
+#              percentiles a rolling window of the most recent samples.
+#    counters: name -> int, e.g. "candidates.hit" / "candidates.miss" for
+#              cache hit rates (see hit_rate)
+#
+# Everything is a no-op while `enabled` is False, so the instrumented hot
+# paths cost one attribute check. Pure Python - no pygame - so it also runs
+# in headless sessions and tests; snapshot() / dump() write the same numbers
+# the F3 overlay shows as a JSON trace.
+# ------------------------------
+import json
+import time
+from collections import deque
+
+TRACE_VERSION = 1
+DEFAULT_WINDOW = 240        # samples kept per timing for percentiles (~4s at 60 FPS)
+PERCENTILES = (50, 95, 99)
+
+
+#
+# Nearest-rank percentile of an already sorted list (None when empty).
+#
+def percentile(sorted_values, pct):
+    if not sorted_values:
+        return None
+    rank = max(1, -(-pct * len(sorted_values) // 100))  # ceil(pct/100 * n)
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+class _Timing:
+    __slots__ = ("count", "total", "max", "samples")
+
+    def __init__(self, window):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.samples = deque(maxlen=window)
+
+    def add(self, seconds):
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+        self.samples.append(seconds)
+
+
+class _Section:
+    # Context manager returned by Profiler.timed while enabled
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler.record(self.name, time.perf_counter() - self.start)
+        return False
+
+
+class _NullSection:
+    # Shared do-nothing context manager for a disabled profiler
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SECTION = _NullSection()
+
+
+class Profiler:
+    #
+    # Args:
+    #    window: number of recent samples kept per timing for percentiles
+    #    enabled: start collecting immediately
+    #
+    def __init__(self, window=DEFAULT_WINDOW, enabled=False):
+        self.window = window
+        self.enabled = enabled
+        self.timings = {}
+        self.counters = {}
+        self.started = time.time()
+
+    def reset(self):
+        self.timings.clear()
+        self.counters.clear()
+        self.started = time.time()
+
+    # ------------------- Recording -------------------
+    def timed(self, name):
+        #
+        # Time a block:  with profiler.timed("draw.Board"): ...
+        #
+        if not self.enabled:
+            return _NULL_SECTION
+        return _Section(self, name)
+
+    def record(self, name, seconds):
+        if not self.enabled:
+            return
+        timing = self.timings.get(name)
+        if timing is None:
+            timing = self.timings[name] = _Timing(self.window)
+        timing.add(seconds)
+
+    def count(self, name, n=1):
+        if self.enabled:
+            self.counters[name] = self.counters.get(name, 0) + n
+
+    def hit(self, cache, hit):
+        # Count one lookup of `cache` as a hit or a miss
+        if self.enabled:
+            name = cache + (".hit" if hit else ".miss")
+            self.counters[name] = self.counters.get(name, 0) + 1
+
+    # ------------------- Reading -------------------
+    def percentiles(self, name, pcts=PERCENTILES):
+        # {pct: seconds} over the rolling window (values are None without samples)
+        timing = self.timings.get(name)
+        values = sorted(timing.samples) if timing else []
+        return {pct: percentile(values, pct) for pct in pcts}
+
+    def hit_rate(self, cache):
+        # Fraction of `cache` lookups that hit, None before the first lookup
+        hits = self.counters.get(cache + ".hit", 0)
+        total = hits + self.counters.get(cache + ".miss", 0)
+        return hits / total if total else None
+
+    def caches(self):
+        # Names of every cache with hit/miss counters, sorted
+        return sorted({name.rsplit(".", 1)[0] for name in self.counters
+                       if name.endswith((".hit", ".miss"))})
+
+    def snapshot(self):
+        #
+        # Every counter as a JSON-ready dict (times in milliseconds).
+        #
+        timings = {}
+        for name, timing in sorted(self.timings.items()):
+            entry = {
+                "count": timing.count,
+                "total_ms": timing.total * 1000,
+                "mean_ms": timing.total / timing.count * 1000,
+                "max_ms": timing.max * 1000,
+            }
+            for pct, value in self.percentiles(name).items():
+                entry[f"p{pct}_ms"] = value * 1000
+            timings[name] = entry
+
+        return {
+            "version": TRACE_VERSION,
+            "started": self.started,
+            "duration_s": time.time() - self.started,
+            "window": self.window,
+            "timings": timings,
+            "counters": dict(sorted(self.counters.items())),
+            "hit_rates": {cache: self.hit_rate(cache) for cache in self.caches()},
+        }
+
+    def dump(self, path):
+        # Write snapshot() to `path` as JSON and return it
+        snapshot = self.snapshot()
+        with open(path, "w") as f:
+            json.dump(snapshot, f, indent=2)
+        return snapshot
+
+
+# Process-wide instance used by the instrumented code
+profiler = Profiler()
@@ -0,0 +1,221 @@
+# src/core/puzzle_pool.py
+
+# Persistent pool of pre-generated puzzles
+# ----------------------------------------
+# Keeps up to `capacity` puzzles per difficulty in one small file each, so
+# "Start New Game" can hand out a board instantly instead of generating it
+# inside the event loop. A background thread refills a difficulty whenever
+# it drops below `low_water`. The generating itself runs in a child
+# `python -m core.generator` process at lowered priority, so it never holds
+# the GIL the pygame loop and a GenerationJob need; the thread just reads the
+# child's output lines into the pool.
+#
+# On-disk format: fixed-size 52-byte records appended to <difficulty>.pool
+#    - 41 bytes: solution digits packed two per byte (high nibble first)
+#    - 11 bytes: 81-bit little-endian mask of which cells are givens
+# Fixed-size records make taking a puzzle O(1): pop the last record and
+# truncate the file.
+# ----------------------------------------
+import os
+import random
+import subprocess
+import sys
+import threading
+from core.generator import generate_sudoku, string_to_grid, GRID_SIZE
+
+CELL_COUNT = GRID_SIZE * GRID_SIZE
+SOLUTION_BYTES = (CELL_COUNT + 1) // 2
+MASK_BYTES = (CELL_COUNT + 7) // 8
+RECORD_SIZE = SOLUTION_BYTES + MASK_BYTES
+
+DIFFICULTIES = ("easy", "medium", "hard", "expert")
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))  # so the child finds core.generator
+WORKER_NICENESS = 10
+
+
+def encode_record(puzzle, solution):
+    # Pack a (puzzle, solution) pair into one RECORD_SIZE-byte record
+    digits = [cell for row in solution for cell in row] + [0]  # pad to even length
+    packed = bytes((digits[i] << 4) | digits[i + 1] for i in range(0, CELL_COUNT, 2))
+
+    givens = 0
+    for i, cell in enumerate(cell for row in puzzle for cell in row):
+        if cell:
+            givens |= 1 << i
+    return packed + givens.to_bytes(MASK_BYTES, "little")
+
+
+def decode_record(record):
+    # Unpack a record into (puzzle, solution) 9x9 lists
+    digits = []
+    for byte in record[:SOLUTION_BYTES]:
+        digits.append(byte >> 4)
+        digits.append(byte & 0x0F)
+    givens = int.from_bytes(record[SOLUTION_BYTES:RECORD_SIZE], "little")
+
+    solution = [digits[r * GRID_SIZE:(r + 1) * GRID_SIZE] for r in range(GRID_SIZE)]
+    puzzle = [[solution[r][c] if givens >> (r * GRID_SIZE + c) & 1 else 0
+               for c in range(GRID_SIZE)] for r in range(GRID_SIZE)]
+    return puzzle, solution
+
+
+class PuzzlePool:
+    #
+    # Args:
+    #    directory: folder holding the <difficulty>.pool files (created if missing)
+    #    capacity: puzzles to keep per difficulty
+    #    low_water: refill a difficulty once it holds fewer than this many
+    #    difficulties: difficulties to keep stocked
+    #    generate: puzzle factory, generate(difficulty, rng) -> (puzzle, solution),
+    #              used by refill() and by the background thread when processes is False
+    #    processes: background refills run in a child generator process
+    #
+    def __init__(self, directory, capacity=10, low_water=3,
+                 difficulties=DIFFICULTIES, generate=generate_sudoku, processes=True):
+        self.directory = directory
+        self.capacity = capacity
+        self.low_water = low_water
+        self.difficulties = tuple(difficulties)
+        self.generate = generate
+        self.processes = processes
+
+        os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+        self._process = None  # running child generator, if any
+        self._rng = random.Random()
+
+        # In-memory copy of every record, last element = next to hand out
+        self._records = {d: self._load(d) for d in self.difficulties}
+
+    # ------------------- Storage -------------------
+    def _path(self, difficulty):
+        return os.path.join(self.directory, f"{difficulty}.pool")
+
+    def _load(self, difficulty):
+        path = self._path(difficulty)
+        if not os.path.exists(path):
+            return []
+        with open(path, "rb") as f:
+            data = f.read()
+
+        # Drop a partial trailing record left by an interrupted write
+        count = len(data) // RECORD_SIZE
+        if len(data) != count * RECORD_SIZE:
+            os.truncate(path, count * RECORD_SIZE)
+        return [data[i * RECORD_SIZE:(i + 1) * RECORD_SIZE] for i in range(count)]
+
+    # ------------------- Pool API -------------------
+    def size(self, difficulty):
+        with self._lock:
+            return len(self._records.get(difficulty, ()))
+
+    def take(self, difficulty):
+        #
+        # Hand out one pooled puzzle in O(1).
+        #
+        # Returns:
+        #    (puzzle, solution), or None if the pool for this difficulty is empty
+        #
+        with self._lock:
+            records = self._records.get(difficulty)
+            record = records.pop() if records else None
+            if record is not None:
+                os.truncate(self._path(difficulty), len(records) * RECORD_SIZE)
+            needs_refill = records is not None and len(records) < self.low_water
+
+        if needs_refill:
+            self._wake.set()
+        return decode_record(record) if record is not None else None
+
+    def add(self, difficulty, puzzle, solution):
+        # Append one puzzle to the pool (memory and disk)
+        record = encode_record(puzzle, solution)
+        with self._lock:
+            self._records.setdefault(difficulty, []).append(record)
+            with open(self._path(difficulty), "ab") as f:
+                f.write(record)
+
+    def refill(self):
+        # Generate puzzles until every difficulty is back at capacity
+        for difficulty in self.difficulties:
+            while self.size(difficulty) < self.capacity and not self._stop.is_set():
+                puzzle, solution = self.generate(difficulty, self._rng)
+                self.add(difficulty, puzzle, solution)
+
+    def refill_in_process(self):
+        # refill(), with each difficulty's missing puzzles generated by one child process
+        for difficulty in self.difficulties:
+            missing = self.capacity - self.size(difficulty)
+            if missing <= 0 or self._stop.is_set():
+                continue
+            self._process = self._spawn_generator(difficulty, missing)
+            added = 0
+            try:
+                for line in self._process.stdout:
+                    _, puzzle, solution = line.strip().split(",")
+                    self.add(difficulty, string_to_grid(puzzle), string_to_grid(solution))
+                    added += 1
+                    if self._stop.is_set():
+                        break
+            finally:
+                self._process.kill()
+                self._process.wait()
+                self._process.stdout.close()
+                self._process = None
+            if not added and not self._stop.is_set():
+                # Don't respawn a failing child in a loop; retry on the next take()
+                print(f"Puzzle pool: generator process produced no {difficulty} puzzles")
+                return
+
+    def _spawn_generator(self, difficulty, count):
+        # python -m core.generator on one core, writing index,puzzle,solution lines
+        command = [sys.executable, "-m", "core.generator", "-n", str(count), "-d", difficulty,
+                   "-w", "1", "-s", str(self._rng.getrandbits(64))]
+        env = dict(os.environ)
+        env["PYTHONPATH"] = os.pathsep.join(filter(None, [SRC_DIR, env.get("PYTHONPATH")]))
+        env["PYTHONUNBUFFERED"] = "1"  # hand over each puzzle as soon as it is written
+        flags = getattr(subprocess, "BELOW_NORMAL_PRIORITY_CLASS", 0)  # Windows
+        process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                                   text=True, env=env, creationflags=flags)
+        if hasattr(os, "setpriority"):
+            try:
+                os.setpriority(os.PRIO_PROCESS, process.pid, WORKER_NICENESS)
+            except OSError:
+                pass  # already exited, or not allowed - it still runs, just not niced
+        return process
+
+    # ------------------- Background worker -------------------
+    def start(self):
+        # Start the refill thread (fills every difficulty to capacity first)
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="PuzzlePool", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout=None):
+        # Ask the refill thread to finish after its current puzzle (a running
+        # generator process is killed)
+        self._stop.set()
+        self._wake.set()
+        process = self._process
+        if process is not None:
+            try:
+                process.kill()  # the thread then sees end of output
+            except OSError:
+                pass
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self):
+        while not self._stop.is_set():
+            if self.processes:
+                self.refill_in_process()
+            else:
+                self.refill()
+            self._wake.wait()
+            self._wake.clear()
@@ -0,0 +1,243 @@
+# src/core/solver.py
+
+# Bitmask-backed constraint solver
+# --------------------------------
+# Shared by the generator, validator and hint code.
+#
+# The grid is kept as a flat list of 81 values plus one 9-bit occupancy
+# mask per row, column and box (bit d-1 set = digit d already used).
+# Candidates for a cell are therefore a couple of ORs away, the search
+# always branches on the most-constrained cell (MRV), and naked and
+# hidden singles are propagated between guesses.
+# --------------------------------
+
+from core.tables import (GRID_SIZE, CELL_COUNT, ALL_DIGITS,
+                         ROW_OF, COL_OF, BOX_OF, HOUSES, POPCOUNT, DIGIT_OF_BIT,
+                         digit_bit, mask_to_digits)
+
+
+class SolverState:
+    #
+    # Mutable solver state: flat cell values and house occupancy masks.
+    #
+    # Args:
+    #    grid: 9x9 list of lists (0 = empty)
+    #
+    # A grid that already breaks the rules (duplicate digit in a house)
+    # is flagged through `self.valid = False` and never has a solution.
+    #
+    __slots__ = ("cells", "rows", "cols", "boxes", "valid")
+
+    def __init__(self, grid):
+        self.cells = [0] * CELL_COUNT
+        self.rows = [0] * GRID_SIZE
+        self.cols = [0] * GRID_SIZE
+        self.boxes = [0] * GRID_SIZE
+        self.valid = True
+
+        for r in range(GRID_SIZE):
+            for c in range(GRID_SIZE):
+                value = grid[r][c]
+                if value == 0:
+                    continue
+                i = r * GRID_SIZE + c
+                if not (1 <= value <= GRID_SIZE) or not self.candidates(i) & digit_bit(value):
+                    self.valid = False
+                    continue
+                self.place(i, value)
+
+    # ------------------- Cell updates -------------------
+    def candidates(self, i):
+        # Return the candidate mask for cell index i (0 if filled)
+        if self.cells[i]:
+            return 0
+        return ALL_DIGITS & ~(self.rows[ROW_OF[i]] | self.cols[COL_OF[i]] | self.boxes[BOX_OF[i]])
+
+    def place(self, i, digit):
+        bit = 1 << (digit - 1)
+        self.cells[i] = digit
+        self.rows[ROW_OF[i]] |= bit
+        self.cols[COL_OF[i]] |= bit
+        self.boxes[BOX_OF[i]] |= bit
+
+    def clear(self, i):
+        bit = 1 << (self.cells[i] - 1)
+        self.cells[i] = 0
+        self.rows[ROW_OF[i]] &= ~bit
+        self.cols[COL_OF[i]] &= ~bit
+        self.boxes[BOX_OF[i]] &= ~bit
+
+    def to_grid(self):
+        return [self.cells[r * GRID_SIZE:(r + 1) * GRID_SIZE] for r in range(GRID_SIZE)]
+
+    # ------------------- Propagation -------------------
+    def _propagate(self, trail):
+        #
+        # Fill naked and hidden singles until nothing changes.
+        # Every placement is pushed onto `trail` so the caller can undo it.
+        #
+        # Returns:
+        #    False if a contradiction was found, True otherwise
+        #
+        cells = self.cells
+        changed = True
+        while changed:
+            changed = False
+
+            # Naked singles: a cell with exactly one candidate
+            for i in range(CELL_COUNT):
+                if cells[i]:
+                    continue
+                mask = self.candidates(i)
+                if mask == 0:
+                    return False
+                if mask & (mask - 1) == 0:
+                    self.place(i, DIGIT_OF_BIT[mask])
+                    trail.append(i)
+                    changed = True
+
+            # Hidden singles: a digit with exactly one place left in a house
+            for house in HOUSES:
+                once = twice = placed = 0
+                for i in house:
+                    if cells[i]:
+                        placed |= 1 << (cells[i] - 1)
+                    else:
+                        mask = self.candidates(i)
+                        twice |= once & mask
+                        once |= mask
+                if (once | placed) != ALL_DIGITS:
+                    return False  # some digit has nowhere to go
+
+                singles = once & ~twice & ~placed
+                while singles:
+                    bit = singles & -singles
+                    singles ^= bit
+                    for i in house:
+                        if not cells[i] and self.candidates(i) & bit:
+                            self.place(i, DIGIT_OF_BIT[bit])
+                            trail.append(i)
+                            changed = True
+                            break
+                    else:
+                        return False  # an earlier placement took the last spot
+        return True
+
+    def _undo(self, trail, mark=0):
+        while len(trail) > mark:
+            self.clear(trail.pop())
+
+    # ------------------- Search -------------------
+    def _search(self, limit, found, rng=None):
+        #
+        # Depth-first search with MRV branching.
+        #
+        # Args:
+        #    limit: stop once this many solutions have been found
+        #    found: list collecting solved grids (only the first is copied)
+        #    rng: optional random.Random used to shuffle branch order
+        #
+        # Returns:
+        #    int: number of solutions found in this subtree
+        #
+        trail = []
+        if not self._propagate(trail):
+            self._undo(trail)
+            return 0
+
+        # Pick the empty cell with the fewest candidates
+        best, best_mask, best_count = -1, 0, GRID_SIZE + 1
+        for i in range(CELL_COUNT):
+            if self.cells[i]:
+                continue
+            mask = self.candidates(i)
+            count = POPCOUNT[mask]
+            if count < best_count:
+                best, best_mask, best_count = i, mask, count
+                if count == 2:
+                    break
+
+        if best == -1:
+            # Board is full - a solution
+            if not found:
+                found.append(self.to_grid())
+            self._undo(trail)
+            return 1
+
+        digits = mask_to_digits(best_mask)
+        if rng is not None:
+            rng.shuffle(digits)
+
+        total = 0
+        for digit in digits:
+            self.place(best, digit)
+            total += self._search(limit - total, found, rng)
+            self.clear(best)
+            if total >= limit:
+                break
+
+        self._undo(trail)
+        return total
+
+    def count_solutions(self, limit=2):
+        # Count solutions of the current state, stopping at `limit`
+        if not self.valid:
+            return 0
+        return self._search(limit, [])
+
+    def has_solution_without(self, i, digit):
+        #
+        # Return True if the current state has a solution in which cell i
+        # holds anything other than `digit`. Cell i must be empty.
+        #
+        # Used for uniqueness checks: if a puzzle is known to have a solution
+        # with `digit` at i, a second solution must differ there.
+        #
+        if not self.valid:
+            return False
+        others = self.candidates(i) & ~digit_bit(digit)
+        while others:
+            bit = others & -others
+            others ^= bit
+            self.place(i, DIGIT_OF_BIT[bit])
+            count = self._search(1, [])
+            self.clear(i)
+            if count:
+                return True
+        return False
+
+
+# ------------------- Public API -------------------
+#
+# Solve a puzzle.
+#
+# Args:
+#    grid: 9x9 list of lists (0 = empty). Not modified.
+#    rng: optional random.Random - when given, branch order is shuffled,
+#         so solving an empty grid yields a random full board.
+#
+# Returns:
+#    A solved 9x9 list of lists, or None if the grid has no solution
+#
+def solve(grid, rng=None):
+    state = SolverState(grid)
+    if not state.valid:
+        return None
+    found = []
+    state._search(1, found, rng)
+    return found[0] if found else None
+
+
+#
+# Count the solutions of a puzzle, stopping once `limit` is reached.
+#
+# Returns:
+#    int in the range 0..limit
+#
+def count_solutions(grid, limit=2):
+    return SolverState(grid).count_solutions(limit)
+
+
+# Return True if the puzzle has exactly one solution
+def is_unique(grid):
+    return count_solutions(grid, 2) == 1
@@ -0,0 +1,84 @@
+# src/core/tables.py
+
+# Import-time lookup tables
+# -------------------------
+# Cells are addressed by flat index i = row * 9 + col (0-80). Everything
+# here is built once when the module is imported and never changes, so the
+# solver, board state and every heuristic can look relations up in O(1)
+# instead of recomputing them with nested loops.
+#
+#    ROW_OF / COL_OF / BOX_OF[i]  -> row / column / box number of cell i
+#    ROWS / COLS / BOXES[h]       -> the 9 cells of row / column / box h
+#    HOUSES[h]                    -> all 27 houses: rows 0-8, columns 9-17, boxes 18-26
+#    HOUSES_OF[i]                 -> (row house, column house, box house) ids of cell i
+#    PEERS[i] / PEER_SETS[i]      -> the 20 cells sharing a house with i (sorted / frozenset)
+#    COMMON_PEERS[a][b]           -> sorted cells that are peers of both a and b
+#    HOUSE_MASKS[h] / PEER_MASKS[i] -> the same cells as 81-bit cell bitsets (bit i = cell i)
+#    POPCOUNT[mask]               -> number of digits in a 9-bit candidate mask
+#    DIGIT_OF_BIT[bit]            -> digit (1-9) for a single-bit mask
+#    DIGITS_OF_MASK[mask]         -> the digits of a 9-bit candidate mask, ascending
+# -------------------------
+
+GRID_SIZE = 9
+BOX_SIZE = 3
+CELL_COUNT = GRID_SIZE * GRID_SIZE
+ALL_DIGITS = (1 << GRID_SIZE) - 1  # 0b111111111
+
+# ------------------- Cell -> house -------------------
+ROW_OF = tuple(i // GRID_SIZE for i in range(CELL_COUNT))
+COL_OF = tuple(i % GRID_SIZE for i in range(CELL_COUNT))
+BOX_OF = tuple((i // GRID_SIZE // BOX_SIZE) * BOX_SIZE + (i % GRID_SIZE) // BOX_SIZE
+               for i in range(CELL_COUNT))
+
+# ------------------- House -> cells -------------------
+ROWS = tuple(tuple(r * GRID_SIZE + c for c in range(GRID_SIZE)) for r in range(GRID_SIZE))
+COLS = tuple(tuple(r * GRID_SIZE + c for r in range(GRID_SIZE)) for c in range(GRID_SIZE))
+BOXES = tuple(tuple(i for i in range(CELL_COUNT) if BOX_OF[i] == b) for b in range(GRID_SIZE))
+HOUSES = ROWS + COLS + BOXES
+
+ROW_HOUSE, COL_HOUSE, BOX_HOUSE = 0, GRID_SIZE, 2 * GRID_SIZE  # offsets into HOUSES
+HOUSES_OF = tuple((ROW_OF[i], COL_HOUSE + COL_OF[i], BOX_HOUSE + BOX_OF[i])
+                  for i in range(CELL_COUNT))
+
+# ------------------- Peers -------------------
+PEER_SETS = tuple(
+    frozenset(ROWS[ROW_OF[i]] + COLS[COL_OF[i]] + BOXES[BOX_OF[i]]) - {i}
+    for i in range(CELL_COUNT)
+)
+PEERS = tuple(tuple(sorted(peers)) for peers in PEER_SETS)
+COMMON_PEERS = tuple(
+    tuple(tuple(sorted(PEER_SETS[a] & PEER_SETS[b])) for b in range(CELL_COUNT))
+    for a in range(CELL_COUNT)
+)
+
+# ------------------- Cell bitsets -------------------
+HOUSE_MASKS = tuple(sum(1 << i for i in house) for house in HOUSES)
+PEER_MASKS = tuple(sum(1 << j for j in peers) for peers in PEERS)
+
+# ------------------- Digit masks -------------------
+POPCOUNT = tuple(bin(m).count("1") for m in range(ALL_DIGITS + 1))
+DIGIT_OF_BIT = {1 << (d - 1): d for d in range(1, GRID_SIZE + 1)}
+DIGITS_OF_MASK = tuple(tuple(d for d in range(1, GRID_SIZE + 1) if m >> (d - 1) & 1)
+                       for m in range(ALL_DIGITS + 1))
+
+
+def cell_index(row, col):
+    return row * GRID_SIZE + col
+
+
+def iter_bits(mask):
+    # Yield the index of every set bit, lowest first (cells of a cell bitset)
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+def digit_bit(digit):
+    # Return the mask bit for a digit 1-9
+    return 1 << (digit - 1)
+
+
+def mask_to_digits(mask):
+    # Expand a 9-bit candidate mask into a sorted list of digits
+    return [d for d in range(1, GRID_SIZE + 1) if mask & (1 << (d - 1))]
@@ -1,25 +1,112 @@
 # src/hints/engine/hint_engine.py
 
+from collections.abc import Mapping
 import pygame
+from core.board_state import BoardState
+from core.profiler import profiler
+from hints.utils.context import HintContext
 from hints.heuristics.naked_singles import find_naked_singles
 from hints.heuristics.naked_pairs import find_naked_pairs
 from hints.heuristics.hidden_singles import find_hidden_singles
+from hints.heuristics.intersections import find_pointing, find_claiming
+from hints.heuristics.subsets import (find_naked_triples, find_naked_quads, find_hidden_pairs,
+                                      find_hidden_triples, find_hidden_quads)
+from hints.heuristics.x_wing import find_x_wings, find_swordfish, find_jellyfish
+from hints.heuristics.chains import find_xy_wings, find_simple_coloring, find_x_chains
+
+
+# -----------------------------------
+# Hints for one board state, keyed by technique name.
+#
+# Each technique runs the first time it is looked up, so a panel that only
+# shows one expanded technique never pays for the others. All techniques
+# share one HintContext, so candidates are computed once per pass. The
+# engine keeps one of these per board and swaps it for a fresh one when
+# the board version changes.
+# -----------------------------------
+class HintResults(Mapping):
+    def __init__(self, board, key=None):
+        self.board = board
+        self.key = key
+        self._context = None
+        self._results = {}
+
+    @property
+    def context(self):
+        if self._context is None:
+            self._context = HintContext(self.board)
+        return self._context
+
+    def __getitem__(self, technique_name):
+        if technique_name not in self._results:
+            func = HintEngine.FUNCTIONS[technique_name]  # KeyError for unknown names
+            self._results[technique_name] = HintEngine._run(technique_name, func, self.board, self)
+        return self._results[technique_name]
+
+    def __iter__(self):
+        return iter(HintEngine.FUNCTIONS)
+
+    def __len__(self):
+        return len(HintEngine.FUNCTIONS)
+
+    def is_computed(self, technique_name):
+        return technique_name in self._results
+
 
 class HintEngine:
     # Map hint keys for UI to their corresponding functions
     HEURISTICS = {
         pygame.K_a: ("Naked Singles", find_naked_singles),
         pygame.K_b: ("Naked Pairs", find_naked_pairs),
+        pygame.K_m: ("Pointing", find_pointing),
+        pygame.K_n: ("Claiming", find_claiming),
         pygame.K_c: ("Hidden Singles", find_hidden_singles),
+        pygame.K_h: ("Naked Triples", find_naked_triples),
+        pygame.K_i: ("Naked Quads", find_naked_quads),
+        pygame.K_j: ("Hidden Pairs", find_hidden_pairs),
+        pygame.K_k: ("Hidden Triples", find_hidden_triples),
+        pygame.K_l: ("Hidden Quads", find_hidden_quads),
+        pygame.K_d: ("X-Wing", find_x_wings),
+        pygame.K_e: ("Swordfish", find_swordfish),
+        pygame.K_g: ("Jellyfish", find_jellyfish),  # K_f fills in all notes
+        pygame.K_o: ("XY-Wing", find_xy_wings),
+        pygame.K_p: ("Simple Coloring", find_simple_coloring),
+        pygame.K_q: ("X-Chain", find_x_chains),
     }
 
+    # Technique name -> function, in display order
+    FUNCTIONS = {name: func for name, func in HEURISTICS.values()}
+
+    # -----------------------------------
+    # Version key used to decide whether cached hints are still valid.
+    # Boards bump `version` in _notify_update; the state's value_version also
+    # catches edits made directly through the grid views.
+    # Returns None for boards that cannot be versioned (never cached).
+    # -----------------------------------
+    @staticmethod
+    def version_key(board):
+        version = getattr(board, "version", None)
+        state = getattr(board, "state", None)
+        if not isinstance(version, int) or not isinstance(state, BoardState):
+            return None
+        return (version, state.value_version)
+
+    @staticmethod
+    def _run(technique_name, func, board, results):
+        try:
+            with profiler.timed("hint." + technique_name):
+                return func(board, results.context)
+        except Exception as e:
+            print(f"Error running heuristic {technique_name}: {e}")
+            return []
+
     # -----------------------------------
     # Run a specific heuristic by key and return its hints.
     #
     # Args:
     #    board: Board object
     #    key: str, key corresponding to a registered heuristic
-    # 
+    #
     # Returns:
     #    list[dict]: List of hint dictionaries for that technique
     # -----------------------------------
@@ -27,23 +114,27 @@ class HintEngine:
     def get_hint_by_key(board, key):
         if key not in HintEngine.HEURISTICS:
             return []
-        
-        technique_name, func = HintEngine.HEURISTICS[key]
-        try:
-            hints = func(board)
-            return hints
-        except Exception as e:
-            print(f"Error running heuristic {technique_name}: {e}")
-            return []
 
+        technique_name, _ = HintEngine.HEURISTICS[key]
+        return HintEngine.get_all_hints(board)[technique_name]
+
+    # -----------------------------------
+    # Hints for every technique, keyed by technique name.
+    #
+    # Returns a lazy, read-only mapping: a technique runs on first lookup and
+    # its result is reused until the board version changes. Do not modify
+    # the returned hint lists.
+    # -----------------------------------
     @staticmethod
     def get_all_hints(board):
-        # Run all heuristics and return a dictionary keyed by technique name
-        all_hints = {}
-        for key, (technique_name, func) in HintEngine.HEURISTICS.items():
-            try:
-                all_hints[technique_name] = func(board)
-            except Exception as e:
-                print(f"Error running heuristic {technique_name}: {e}")
-                all_hints[technique_name] = []
-        return all_hints
\ No newline at end of file
+        key = HintEngine.version_key(board)
+        if key is None:
+            return HintResults(board)
+
+        # Cached on the board itself, so it goes away with the board
+        results = getattr(board, "_hint_results", None)
+        profiler.hit("hints", results is not None and results.key == key)
+        if results is None or results.key != key:
+            results = HintResults(board, key)  # old entries are evicted with the old object
+            board._hint_results = results
+        return results
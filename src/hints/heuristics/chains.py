@@ -0,0 +1,246 @@
+# src/hints/heuristics/chains.py
+from collections import deque
+from hints.utils.board_utils import cell_to_ui_cell, house_name
+from hints.utils.context import get_context
+from core.tables import GRID_SIZE, HOUSES_OF, PEER_MASKS, POPCOUNT, ROW_OF, COL_OF, DIGITS_OF_MASK, iter_bits
+
+#
+# Chaining techniques (XY-Wing, Simple Coloring, X-Chain)
+# -------------------------------------------------------
+# All three walk the context's LinkIndex (hints.utils.links), built once
+# per board version from the candidate grid:
+#
+#    XY-Wing:         bivalue pivot {a,b} seeing bivalue pincers {a,c} and
+#                     {b,c}. One pincer must be c, so c goes from every cell
+#                     that sees both pincers.
+#    Simple Coloring: the strong links on one digit split into components
+#                     that are 2-coloured; one colour is all true and the
+#                     other all false. Two cells of one colour that see each
+#                     other make that colour false (wrap); a cell that sees
+#                     both colours loses the digit (trap).
+#    X-Chain:         a chain on one digit alternating strong and weak links
+#                     that starts and ends with a strong link. One end must
+#                     be the digit, so it goes from cells that see both.
+#
+# "Cells that see both" is PEER_MASKS[a] & PEER_MASKS[b] - the common-peer
+# lookup as a bitset - ANDed with the digit's candidate cells. X-Chains are
+# searched breadth first from every linked cell, so each end pair is found
+# through its shortest chain, and never longer than X_CHAIN_MAX_LINKS.
+# -------------------------------------------------------
+
+X_CHAIN_MAX_LINKS = 9  # strong + weak links; odd, since chains end on a strong link
+
+
+def _ui(i):
+    return ROW_OF[i] + 1, COL_OF[i] + 1
+
+
+def _eliminations(cells, digit, reason):
+    return [{"cell": _ui(j), "remove": digit, "reason": reason} for j in iter_bits(cells)]
+
+
+def _shared_house(a, b):
+    # Name of the first house (row, column, block) containing both cells
+    for house in HOUSES_OF[a]:
+        if house in HOUSES_OF[b]:
+            return house_name(house)
+    return None
+
+
+#
+# Find all XY-Wings.
+#
+# Args:
+#    board: Board object
+#    context: optional HintContext with the candidates for this hint pass
+#
+# Returns:
+#    list of dicts, each containing:
+#        - 'technique': 'XY-Wing'
+#        - 'cell': [pivot, pincer, pincer] (UI 1-indexed)
+#        - 'value': the three digits {a, b, c}
+#        - 'where': the houses linking the pivot to each pincer
+#        - 'reason': explanation string
+#        - 'eliminations': c from the cells that see both pincers
+#    Only wings that eliminate at least one candidate are reported.
+#
+def find_xy_wings(board, context=None):
+    context = get_context(board, context)
+    masks = context.masks
+    links = context.links
+    candidate_cells = context.candidate_cells
+    findings = []
+
+    for pivot in iter_bits(links.bivalue):
+        pivot_mask = masks[pivot]
+        # Bivalue peers sharing exactly one digit with the pivot
+        wings = [i for i in iter_bits(PEER_MASKS[pivot] & links.bivalue)
+                 if POPCOUNT[masks[i] & pivot_mask] == 1]
+        for k, x in enumerate(wings):
+            for y in wings[k + 1:]:
+                # {a,c} ^ {b,c} == {a,b} only for the two different pincers
+                if masks[x] ^ masks[y] != pivot_mask:
+                    continue
+                (c,) = DIGITS_OF_MASK[masks[x] & masks[y]]
+                removed = PEER_MASKS[x] & PEER_MASKS[y] & candidate_cells[c]
+                if not removed:
+                    continue
+
+                a, b = DIGITS_OF_MASK[pivot_mask]
+                pivot_ui, x_ui, y_ui = _ui(pivot), _ui(x), _ui(y)
+                findings.append({
+                    "technique": "XY-Wing",
+                    "cell": [pivot_ui, x_ui, y_ui],
+                    "value": {a, b, c},
+                    "where": [_shared_house(pivot, x), _shared_house(pivot, y)],
+                    "reason": f"Cell {pivot_ui} is {a} or {b}, so one of {x_ui} and {y_ui} must be {c}; "
+                              f"{c} can be removed from cells that see both.",
+                    "eliminations": _eliminations(removed, c, f"XY-Wing pivot {pivot_ui} on {c}")
+                })
+
+    return findings
+
+
+#
+# Find all Simple Coloring eliminations.
+#
+# Args:
+#    board: Board object
+#    context: optional HintContext with the candidates for this hint pass
+#
+# Returns:
+#    list of dicts shaped like find_xy_wings', one per coloured component
+#    with eliminations: 'cell' is the component's cells, 'value' {digit},
+#    'where' the component's two colour groups ('colour A: ...'). Components
+#    of a single conjugate pair are skipped - they are intersections.
+#
+def find_simple_coloring(board, context=None):
+    context = get_context(board, context)
+    links = context.links
+    findings = []
+
+    for digit in range(1, GRID_SIZE + 1):
+        cells = links.candidate_cells[digit]
+        strong = links.strong[digit]
+        unseen = links.linked[digit]
+        while unseen:
+            start = (unseen & -unseen).bit_length() - 1
+            colors = [1 << start, 0]
+            queue = deque([(start, 0)])
+            while queue:
+                i, color = queue.popleft()
+                for j in iter_bits(strong[i] & ~(colors[0] | colors[1])):
+                    colors[1 - color] |= 1 << j
+                    queue.append((j, 1 - color))
+            component = colors[0] | colors[1]
+            unseen &= ~component
+            if bin(component).count("1") < 3:
+                continue
+
+            seen = [0, 0]
+            wrapped = None
+            for color in (0, 1):
+                for i in iter_bits(colors[color]):
+                    if PEER_MASKS[i] & colors[color]:
+                        wrapped = color
+                    seen[color] |= PEER_MASKS[i]
+
+            if wrapped is not None:
+                removed = colors[wrapped]
+                rule = "two cells of one colour see each other, so that colour is false"
+            else:
+                removed = cells & seen[0] & seen[1] & ~component
+                rule = "cells that see both colours can't hold it"
+            if not removed:
+                continue
+
+            groups = [cell_to_ui_cell([(ROW_OF[i], COL_OF[i]) for i in iter_bits(colors[color])])
+                      for color in (0, 1)]
+            findings.append({
+                "technique": "Simple Coloring",
+                "cell": cell_to_ui_cell([(ROW_OF[i], COL_OF[i]) for i in iter_bits(component)]),
+                "value": {digit},
+                "where": [f"colour A: {groups[0]}", f"colour B: {groups[1]}"],
+                "reason": f"The strong links on {digit} split these cells into two colours, one of "
+                          f"which holds {digit}; {rule}.",
+                "eliminations": _eliminations(removed, digit, f"Simple Coloring on {digit}")
+            })
+
+    return findings
+
+
+#
+# Find all X-Chains up to X_CHAIN_MAX_LINKS links.
+#
+# Args:
+#    board: Board object
+#    context: optional HintContext with the candidates for this hint pass
+#
+# Returns:
+#    list of dicts shaped like find_xy_wings', one per distinct elimination
+#    set (through the shortest chain that gives it): 'cell' is the chain in
+#    order, 'value' {digit}, 'where' the chain in Eureka notation
+#    ('(1,2)=(1,7)-(4,7)=(4,2)', '=' strong and '-' weak). Chains of a
+#    single strong link are skipped - they are intersections.
+#
+def find_x_chains(board, context=None):
+    context = get_context(board, context)
+    links = context.links
+    chains = []
+
+    for digit in range(1, GRID_SIZE + 1):
+        cells = links.candidate_cells[digit]
+        strong = links.strong[digit]
+        linked = links.linked[digit]
+        for start in iter_bits(linked):
+            # Nodes are (cell, on); 'on' cells are reached through a strong
+            # link and leave through a weak one, 'off' cells the other way round
+            parent = {(start, False): None}
+            queue = deque([(start, False, 0)])
+            while queue:
+                i, on, length = queue.popleft()
+                if length == X_CHAIN_MAX_LINKS:
+                    continue
+                # Weak links lead on only to cells with a strong link of their own
+                nxt = strong[i] if not on else links.weak(digit, i) & linked
+                for j in iter_bits(nxt):
+                    node = (j, not on)
+                    if node in parent:
+                        continue
+                    parent[node] = (i, on)
+                    queue.append((j, not on, length + 1))
+                    if on or j < start or length < 2:
+                        continue  # needs 2+ strong links; each end pair once
+                    chain = [j]
+                    back = (i, on)
+                    while back is not None:
+                        chain.append(back[0])
+                        back = parent[back]
+                    if len(set(chain)) != len(chain):
+                        continue  # the walk crossed itself
+                    chain_mask = sum(1 << k for k in chain)
+                    removed = PEER_MASKS[start] & PEER_MASKS[j] & cells & ~chain_mask
+                    if removed:
+                        chains.append((length + 1, digit, chain[::-1], removed))
+
+    findings = []
+    reported = set()
+    for _, digit, chain, removed in sorted(chains, key=lambda found: found[0]):
+        if (digit, removed) in reported:
+            continue
+        reported.add((digit, removed))
+        start_ui, end_ui = _ui(chain[0]), _ui(chain[-1])
+        notation = "({},{})".format(*start_ui)
+        for k, i in enumerate(chain[1:]):
+            notation += ("-" if k % 2 else "=") + "({},{})".format(*_ui(i))
+        findings.append({
+            "technique": "X-Chain",
+            "cell": [_ui(i) for i in chain],
+            "value": {digit},
+            "where": [notation],
+            "reason": f"Following the chain on {digit}, either {start_ui} or {end_ui} must be {digit}, "
+                      f"so it can be removed from cells that see both.",
+            "eliminations": _eliminations(removed, digit, f"X-Chain on {digit} from {start_ui} to {end_ui}")
+        })
+
+    return findings
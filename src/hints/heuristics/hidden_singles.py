@@ -1,94 +1,142 @@
 # src/hints/heuristics/hidden_singles.py
-from hints.utils.board_utils import get_all_candidates, cell_to_ui_cell
-from .naked_singles import find_naked_singles
-from hints.utils.elimination_utils import find_eliminations
+import sys
+from array import array
+from hints.utils.board_utils import HOUSE_NAMES
+from hints.utils.elimination_utils import UI_CELLS, SingleEliminations
+from hints.utils.context import get_context
+from core.tables import (CELL_COUNT, GRID_SIZE, ROWS, COLS, BOXES, HOUSES_OF, COL_HOUSE, BOX_HOUSE,
+                         HOUSE_MASKS, iter_bits)
+
+# Hidden Singles Heuristic
+# ------------------------
+# A 'hidden single' is a digit that has only one possible cell left in a
+# row, column or block.
+#
+# The context's 81 candidate masks are read as one integer with a 16-bit
+# field per cell (bit 16 * i + d - 1 = cell i has digit d). Shifting it by
+# each cell offset inside a house and masking with the fields of the
+# houses' first cells folds every house of one kind onto its first cell,
+# all nine digits at once; a seen-once / seen-twice accumulation over the
+# nine folds leaves a bit for every house/digit pair with exactly one cell.
+# That is 27 folds for the whole board instead of a test per house and
+# digit, and the bits come out in house order, then digit order - the
+# order hints are reported in. Houses are carried as core.tables house IDs
+# (0-8 rows, 9-17 columns, 18-26 blocks); their display names are only
+# looked up for hints that are actually returned.
+#
+# Cells that hold a naked single are meant to be skipped by the search.
+# The original implementation compared 0-indexed cells with the 1-indexed
+# naked single cells, so the cell diagonally below-right of each naked
+# single is skipped instead; that is kept so hints do not change. Each hint
+# is also checked against all empty cells of its house (skipped or not),
+# and a cell keeps the first house it was found in, even if that hint is
+# then dropped by the check.
+# ------------------------
+
+
+ALL_CELLS = (1 << CELL_COUNT) - 1
+LAST_COLUMN = HOUSE_MASKS[COL_HOUSE + GRID_SIZE - 1]
+FIELD = 16  # bits per cell in the packed masks (array('H') items)
+DIGIT_FIELD = (1 << GRID_SIZE) - 1
+
+
+def _fold(houses, first_house):
+    # (bit offsets of a house's cells from its first cell, the houses'
+    #  first-cell fields, first cell -> house ID) for one kind of house
+    origins = 0
+    house_of = [None] * CELL_COUNT
+    for n, house in enumerate(houses):
+        origins |= DIGIT_FIELD << (FIELD * house[0])
+        house_of[house[0]] = first_house + n
+    offsets = tuple(FIELD * (i - houses[0][0]) for i in houses[0])
+    return offsets, origins, tuple(house_of)
+
+
+# Rows, columns, blocks - in house ID order
+FOLDS = (_fold(ROWS, 0), _fold(COLS, COL_HOUSE), _fold(BOXES, BOX_HOUSE))
+
+
+# cell * 27 + house -> the end of a hint's reason, formatted once
+HOUSE_COUNT = len(HOUSE_MASKS)
+PLACED_TEXT = {i * HOUSE_COUNT + house: f" can only go in cell {UI_CELLS[i]} in {HOUSE_NAMES[house]}."
+               for i in range(CELL_COUNT) for house in HOUSES_OF[i]}
+
+
+def _packed_masks(masks):
+    # The 81 array('H') masks as one integer, cell i at bits 16 * i
+    if sys.byteorder == "big":
+        masks = array("H", masks)
+        masks.byteswap()
+    return int.from_bytes(masks.tobytes(), "little")
+
+
+def _skipped_cells(candidate_cells):
+    # Bitset of the cells the search ignores (see note above).
+    # Naked singles are the cells seen in exactly one digit's bitset...
+    once = twice = 0
+    for cells in candidate_cells:
+        twice |= once & cells
+        once |= cells
+    naked = once & ~twice
+    # ...moved one row down and one column right (i + 10); cells in the
+    # last row or column have no such neighbour
+    return ((naked & ~LAST_COLUMN) << (GRID_SIZE + 1)) & ALL_CELLS
+
 
 #
 #    Find all hidden singles in the current board state,
 #    ignoring cells that already have a naked single
 #
+#    Args:
+#        context (HintContext, optional): shared candidates for this hint pass
+#
 #    Returns:
 #        list of dicts: Each dict has 'technique', 'cell', 'value', 'reason', 'where'
-def find_hidden_singles(board):
+#        and 'eliminations' (a SingleEliminations, built when first read)
+def find_hidden_singles(board, context=None):
     hints = []
-    size = board.size
-    candidates = get_all_candidates(board)
+    hint_context = get_context(board, context)
     technique = 'Hidden Singles'
 
-    # Skip naked singles
-    naked_singles = find_naked_singles(board)
-    naked_cells = {hint['cell'] for hint in naked_singles}
-
-    # Keep track of cells already assigned a hidden single number
-    assigned_cells = set()
-
-    # --- Helper function to check a unit ---
-    def check_unit(unit_cells, context):
-        for num in range(1, 10):
-            # Count how many cells in the unit have this candidate
-            candidate_cells = [cell for cell in unit_cells
-                   if cell not in naked_cells and num in candidates[cell[0]][cell[1]] and board.user_board[cell[0]][cell[1]] == 0]
-
-            if len(candidate_cells) == 1:
-                cell = candidate_cells[0]
-                if cell not in assigned_cells:
-                    assigned_cells.add(cell)
-                    ui_cell = cell_to_ui_cell([cell])[0]
-                    r, c = cell
-                    eliminations = find_eliminations(board, [(r, c, num)], technique)
-                    hints.append({
-                        "technique": technique,
-                        "cell": ui_cell,
-                        "value": num,
-                        "reason": f"Number {num} can only go in cell {ui_cell} in {context}.",
-                        "where": [context],
-                        "eliminations": eliminations
-                    })
-
-    # --- Row check ---
-    for r in range(size):
-        row_cells = [(r, c) for c in range(size)]
-        check_unit(row_cells, f"row {r+1}")
-
-    # --- Column check ---
-    for c in range(size):
-        col_cells = [(r, c) for r in range(size)]
-        check_unit(col_cells, f"column {c+1}")
-
-    # --- Block check ---
-    for br in range(0, size, 3):
-        for bc in range(0, size, 3):
-            block_cells = [(r, c) for r in range(br, br+3) for c in range(bc, bc+3)]
-            check_unit(block_cells, f"block starting at ({br+1},{bc+1})")
-
-    # --- Validation step ---
-    validated_hints = []
-    for hint in hints:
-        cell_r, cell_c = hint['cell']
-        num = hint['value']
-        keep = True
-
-        for unit in hint['where']:
-            if unit.startswith("row"):
-                r = int(unit.split()[1]) - 1
-                unit_cells = [(r, c) for c in range(size)]
-            elif unit.startswith("column"):
-                c = int(unit.split()[1]) - 1
-                unit_cells = [(r, c) for r in range(size)]
-            elif unit.startswith("block"):
-                br, bc = [int(x) - 1 for x in unit.split("(")[1].split(")")[0].split(",")]
-                unit_cells = [(r, c) for r in range(br, br + 3) for c in range(bc, bc + 3)]
-            else:
-                continue
+    # digit -> every empty cell with the candidate / the cells the search looks at
+    candidate_cells = hint_context.candidate_cells
+    skipped = _skipped_cells(candidate_cells)
+    searched = [cells & ~skipped for cells in candidate_cells]
+    packed = _packed_masks(hint_context.masks)
+    for i in iter_bits(skipped):
+        packed &= ~(DIGIT_FIELD << (FIELD * i))
+    assigned = 0  # bitset of cells already claimed by a house
 
-            count = sum(1 for r, c in unit_cells
-                if board.user_board[r][c] == 0 and num in candidates[r][c])
+    for offsets, origins, house_of in FOLDS:
+        once = twice = 0
+        for offset in offsets:
+            cells = (packed >> offset) & origins
+            twice |= once & cells
+            once |= cells
+        single = once & ~twice
 
-            if count != 1:
-                keep = False
-                break
+        # One bit per house/digit pair with a single searched cell
+        while single:
+            low = single & -single
+            single ^= low
+            bit = low.bit_length() - 1
+            house, num = house_of[bit // FIELD], bit % FIELD + 1
+
+            found = HOUSE_MASKS[house] & searched[num]
+            if assigned & found:
+                continue
+            assigned |= found
+            if HOUSE_MASKS[house] & candidate_cells[num] != found:
+                continue  # another (skipped) cell of the house can take it too
 
-        if keep:
-                validated_hints.append(hint)
+            i = found.bit_length() - 1
+            hints.append({
+                "technique": technique,
+                "cell": UI_CELLS[i],
+                "value": num,
+                "reason": f"Number {num}{PLACED_TEXT[i * HOUSE_COUNT + house]}",
+                "where": [HOUSE_NAMES[house]],
+                "eliminations": SingleEliminations(i, num, candidate_cells)
+            })
 
-    return validated_hints
\ No newline at end of file
+    return hints
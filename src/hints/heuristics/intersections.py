@@ -0,0 +1,108 @@
+# src/hints/heuristics/intersections.py
+from hints.utils.board_utils import house_name
+from hints.utils.context import get_context
+from core.tables import GRID_SIZE, BOXES, ROW_OF, COL_OF, BOX_HOUSE, COL_HOUSE, HOUSE_MASKS, iter_bits
+
+#
+# Intersection removal (locked candidates)
+# ----------------------------------------
+# A box and a row (or column) crossing it share a 3-cell segment.
+#
+#    Pointing: all of a box's cells for digit d lie in the segment, so d
+#              goes there and leaves the rest of the line.
+#    Claiming: all of a line's cells for digit d lie in the segment, so d
+#              goes there and leaves the rest of the box.
+#
+# With the context's per-digit cell bitsets each box/line pair is a few
+# ANDs: `cells & box & ~segment == 0` means pointing, and then
+# `cells & line & ~box` is what gets eliminated (and the other way round for
+# claiming). Only patterns with at least two cells are reported - a single
+# cell is a hidden single.
+# ----------------------------------------
+
+# (box house, line house, segment bitset) for every box and the 3 rows and
+# 3 columns through it
+SEGMENTS = tuple(
+    (BOX_HOUSE + b, line, HOUSE_MASKS[BOX_HOUSE + b] & HOUSE_MASKS[line])
+    for b in range(GRID_SIZE)
+    for line in sorted({ROW_OF[i] for i in BOXES[b]}) + sorted({COL_HOUSE + COL_OF[i] for i in BOXES[b]})
+)
+
+
+def _group(pointing):
+    # (source house, source bitset, ((target house, target bitset, segment), ...))
+    # per box (pointing) or per line (claiming), in house order
+    groups = {}
+    for box, line, segment in SEGMENTS:
+        source, target = (box, line) if pointing else (line, box)
+        groups.setdefault(source, []).append((target, HOUSE_MASKS[target], segment))
+    return tuple((source, HOUSE_MASKS[source], tuple(targets)) for source, targets in sorted(groups.items()))
+
+
+POINTING_GROUPS = _group(True)
+CLAIMING_GROUPS = _group(False)
+
+
+def _find_intersections(board, technique, groups, context):
+    context = get_context(board, context)
+    candidate_cells = context.candidate_cells
+    hints = []
+
+    for digit in range(1, 10):
+        cells = candidate_cells[digit]
+        if not cells:
+            continue
+        for source, source_mask, targets in groups:
+            # Pointing: the box confines d to a segment; claiming: the line does
+            locked = cells & source_mask
+            if locked & (locked - 1) == 0:
+                continue  # no cells or a single cell
+            for target, target_mask, segment in targets:
+                if locked & ~segment:
+                    continue
+                removed = cells & target_mask & ~segment
+                if removed:
+                    break
+            else:
+                continue
+
+            source_name, target_name = house_name(source), house_name(target)
+            ui_cells = [(ROW_OF[i] + 1, COL_OF[i] + 1) for i in iter_bits(locked)]
+            reason = f"{technique}: {digit} in {source_name} is locked to {target_name}"
+            hints.append({
+                "technique": technique,
+                "cell": ui_cells,
+                "value": {digit},
+                "where": [source_name, target_name],
+                "reason": f"In {source_name}, {digit} can only go in cells {ui_cells}, which are all in "
+                          f"{target_name}, so it can be removed from the rest of {target_name}.",
+                "eliminations": [{"cell": (ROW_OF[j] + 1, COL_OF[j] + 1), "remove": digit, "reason": reason}
+                                 for j in iter_bits(removed)]
+            })
+
+    return hints
+
+
+#
+# Pointing: a digit confined to one row or column inside a box.
+#
+# Args:
+#    board: Board object
+#    context: optional HintContext with the candidates for this hint pass
+#
+# Returns:
+#    list of dicts with 'technique' ('Pointing'), 'cell' (the locked cells,
+#    UI 1-indexed), 'value' ({digit}), 'where' ([box, line]), 'reason' and
+#    'eliminations' (the digit in the rest of the line)
+#
+def find_pointing(board, context=None):
+    return _find_intersections(board, "Pointing", POINTING_GROUPS, context)
+
+
+#
+# Claiming (box-line reduction): a digit confined to one box inside a row
+# or column. Same hint format as find_pointing, with 'where' as
+# [line, box] and eliminations in the rest of the box.
+#
+def find_claiming(board, context=None):
+    return _find_intersections(board, "Claiming", CLAIMING_GROUPS, context)
@@ -1,6 +1,7 @@
 # src/hints/heuristics/naked_singles.py 
 from hints.utils.board_utils import *
 from hints.utils.elimination_utils import find_eliminations
+from hints.utils.context import get_context
 
 # Naked Singles Heuristic
 # -----------------------
@@ -14,6 +15,7 @@ from hints.utils.elimination_utils import find_eliminations
 #
 # Args:
 #    board (Board): The current game board instance
+#    context (HintContext, optional): shared candidates for this hint pass
 #
 # Returns:
 #    list[dict]: A list of hints. Each hint dictionary contains:
@@ -25,17 +27,19 @@ from hints.utils.elimination_utils import find_eliminations
 #            'where': list[str]
 #        }
 #
-def find_naked_singles(board):
+def find_naked_singles(board, context=None):
     hints = []
+    context = get_context(board, context)
+    values, masks = context.values, context.masks
 
     for r in range(board.size):
         for c in range(board.size):
-            if board.user_board[r][c] == 0:  # Only check cells without a final value
-                candidates = get_candidates_for_cell(board, r, c)
-                if len(candidates) == 1:
-                    val = next(iter(candidates))
+            if values[r * board.size + c] == 0:  # Only check cells without a final value
+                candidates = masks[r * board.size + c]
+                if candidates and candidates & (candidates - 1) == 0:  # exactly one bit set
+                    val = candidates.bit_length()
                     ui_cell = cell_to_ui_cell([(r, c)])[0]
-                    eliminations = find_eliminations(board, [(r, c, val)], 'Naked Singles')
+                    eliminations = find_eliminations(board, [(r, c, val)], 'Naked Singles', context)
                     hints.append({
                         'technique': 'Naked Singles',
                         'cell': ui_cell,
@@ -0,0 +1,162 @@
+# src/hints/heuristics/subsets.py
+from hints.utils.board_utils import cell_to_ui_cell, house_name, mask_subsets
+from hints.utils.context import get_context
+from hints.utils.elimination_utils import relation_text, subset_eliminations
+from core.tables import HOUSES, ROW_OF, COL_OF, DIGITS_OF_MASK, iter_bits
+
+#
+# Naked and hidden subsets (pairs, triples, quads)
+# ------------------------------------------------
+# Naked subset: n cells of a house whose candidates together are exactly n
+# digits. Those digits must go in those cells, so every other cell that
+# sees all n cells loses them - across every house the cells share, which
+# is worked out once per subset from the intersection of their peer masks.
+#
+# Hidden subset: n digits that, within a house, can only go in the same n
+# cells. Those cells can hold nothing else, so their other candidates go.
+#
+# Both are found per house with board_utils.mask_subsets on 9-bit masks:
+# candidate masks of the house's cells (naked) or, for each digit, the mask
+# of house positions where it can go (hidden). A subset found in several
+# houses (e.g. a row and a block) is reported once, listing every house in
+# 'where'.
+# ------------------------------------------------
+
+SUBSET_NAMES = {2: "Pair", 3: "Triple", 4: "Quad"}
+
+
+#
+# Find all naked subsets of size n.
+#
+# Args:
+#    board: Board object
+#    n: 2, 3 or 4
+#    context: optional HintContext with the candidates for this hint pass
+#    require_eliminations: leave out subsets that remove no candidates
+#
+# Returns:
+#    list of dicts, each containing:
+#        - 'technique': 'Naked Pairs' / 'Naked Triples' / 'Naked Quads'
+#        - 'cell': list of (r, c) UI 1-indexed cells, in house order
+#        - 'value': set of the subset's digits
+#        - 'where': every house the cells share (['row 1', 'block starting at (1,1)'])
+#        - 'reason': explanation string
+#        - 'eliminations': list of {'cell', 'remove', 'reason'} (UI 1-indexed)
+#
+def find_naked_subsets(board, n, context=None, require_eliminations=True):
+    noun = SUBSET_NAMES[n]
+    technique = f"Naked {noun}s"
+    context = get_context(board, context)
+    values, masks = context.values, context.masks
+    candidate_cells = context.candidate_cells
+    found = {}  # cells -> hint
+
+    for house, house_cells in enumerate(HOUSES):
+        name = house_name(house)
+        items = [(i, masks[i]) for i in house_cells if not values[i]]
+        for cells, union in mask_subsets(items, n):
+            hint = found.get(cells)
+            if hint is not None:
+                hint["where"].append(name)
+                continue
+
+            digits = DIGITS_OF_MASK[union]
+            ui_cells = cell_to_ui_cell([(ROW_OF[i], COL_OF[i]) for i in cells])
+
+            reason = f"Naked {noun} in related area {relation_text(cells)}"
+            eliminations = subset_eliminations(cells, union, masks, candidate_cells, reason)
+
+            found[cells] = {
+                "technique": technique,
+                "cell": ui_cells,
+                "value": set(digits),
+                "where": [name],
+                "reason": f"Cells {ui_cells} form naked {noun.lower()} {digits} in {name}.",
+                "eliminations": eliminations
+            }
+
+    return [hint for hint in found.values() if hint["eliminations"] or not require_eliminations]
+
+
+#
+# Find all hidden subsets of size n.
+#
+# Args:
+#    board: Board object
+#    n: 2, 3 or 4
+#    context: optional HintContext with the candidates for this hint pass
+#
+# Returns:
+#    list of dicts shaped like find_naked_subsets' ('technique' is
+#    'Hidden Pairs' / 'Hidden Triples' / 'Hidden Quads'). Only subsets whose
+#    cells have other candidates to remove are reported - the rest are
+#    naked subsets.
+#
+def find_hidden_subsets(board, n, context=None):
+    noun = SUBSET_NAMES[n]
+    technique = f"Hidden {noun}s"
+    context = get_context(board, context)
+    values, masks = context.values, context.masks
+    found = {}  # (cells, digits) -> hint
+
+    for house, house_cells in enumerate(HOUSES):
+        name = house_name(house)
+
+        # digit -> 9-bit mask of the house positions it can go in
+        positions = [0] * 10
+        for k, i in enumerate(house_cells):
+            if not values[i]:
+                for d in DIGITS_OF_MASK[masks[i]]:
+                    positions[d] |= 1 << k
+
+        for digits, slots in mask_subsets(list(enumerate(positions))[1:], n):
+            cells = tuple(house_cells[k] for k in iter_bits(slots))
+            key = (cells, digits)
+            hint = found.get(key)
+            if hint is not None:
+                hint["where"].append(name)
+                continue
+
+            keep = sum(1 << (d - 1) for d in digits)
+            ui_cells = cell_to_ui_cell([(ROW_OF[i], COL_OF[i]) for i in cells])
+            eliminations = []
+            for i in cells:
+                for d in DIGITS_OF_MASK[masks[i] & ~keep]:
+                    eliminations.append({
+                        "cell": (ROW_OF[i] + 1, COL_OF[i] + 1),
+                        "remove": d,
+                        "reason": f"Hidden {noun} {digits} in {name}"
+                    })
+            if not eliminations:
+                continue
+
+            found[key] = {
+                "technique": technique,
+                "cell": ui_cells,
+                "value": set(digits),
+                "where": [name],
+                "reason": f"Digits {digits} can only go in cells {ui_cells} in {name}.",
+                "eliminations": eliminations
+            }
+
+    return list(found.values())
+
+
+def find_naked_triples(board, context=None):
+    return find_naked_subsets(board, 3, context)
+
+
+def find_naked_quads(board, context=None):
+    return find_naked_subsets(board, 4, context)
+
+
+def find_hidden_pairs(board, context=None):
+    return find_hidden_subsets(board, 2, context)
+
+
+def find_hidden_triples(board, context=None):
+    return find_hidden_subsets(board, 3, context)
+
+
+def find_hidden_quads(board, context=None):
+    return find_hidden_subsets(board, 4, context)
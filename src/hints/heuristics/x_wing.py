@@ -1 +1,120 @@
-# src/hints/heuristics/x_wing.py
\ No newline at end of file
+# src/hints/heuristics/x_wing.py
+from hints.utils.board_utils import cell_to_ui_cell, mask_subsets
+from hints.utils.context import get_context
+from core.tables import iter_bits
+
+#
+# Fish (X-Wing, Swordfish, Jellyfish)
+# -----------------------------------
+# A fish of size n on digit d: n base rows whose candidates for d all lie
+# in the same n columns (the cover). d must go in those columns within the
+# base rows, so it can be removed from every other cell of the cover
+# columns. The same holds with rows and columns swapped.
+#
+# Works on per-digit position masks: for each digit, a 9-bit mask per row
+# (bit c = column c still has d as a candidate) and per column. Base lines
+# are combined with board_utils.mask_subsets, which abandons a branch as
+# soon as the union covers more than n lines, so most of the C(9, n)
+# combinations are never visited. Lines with a single position (hidden
+# singles) or none (solved) are never used as base lines.
+# -----------------------------------
+
+FISH_NAMES = {2: "X-Wing", 3: "Swordfish", 4: "Jellyfish"}
+
+
+#
+# Per-digit position masks.
+#
+# Returns:
+#    (row_pos, col_pos): row_pos[d][r] has bit c set when (r, c) is empty and
+#    has d as a candidate; col_pos[d][c] likewise with bit r. Index 0 unused.
+#
+def position_masks(context):
+    row_pos = [[0] * 9 for _ in range(10)]
+    col_pos = [[0] * 9 for _ in range(10)]
+    masks = context.masks
+    values = context.values
+    for i in range(81):
+        if values[i]:
+            continue
+        r, c = divmod(i, 9)
+        for b in iter_bits(masks[i]):
+            row_pos[b + 1][r] |= 1 << c
+            col_pos[b + 1][c] |= 1 << r
+    return row_pos, col_pos
+
+
+#
+# Find all fish of size n on the board.
+#
+# Args:
+#    board: Board object
+#    n: 2 (X-Wing), 3 (Swordfish) or 4 (Jellyfish)
+#    context: optional HintContext with the candidates for this hint pass
+#
+# Returns:
+#    list of dicts, each containing:
+#        - 'technique': 'X-Wing', 'Swordfish' or 'Jellyfish'
+#        - 'cell': list of (r, c) base cells holding the digit (UI 1-indexed)
+#        - 'value': {digit}
+#        - 'where': ['rows 1, 5'] / ['columns 2, 7'] - the base lines
+#        - 'reason': explanation string
+#        - 'eliminations': list of {'cell', 'remove', 'reason'} (UI 1-indexed)
+#    Only fish that eliminate at least one candidate are reported.
+#
+def find_fish(board, n, context=None):
+    technique = FISH_NAMES[n]
+    context = get_context(board, context)
+    row_pos, col_pos = position_masks(context)
+    findings = []
+
+    for digit in range(1, 10):
+        for base_name, cover_name, positions, cover_positions, to_cell in (
+                ("rows", "columns", row_pos[digit], col_pos[digit], lambda base, cover: (base, cover)),
+                ("columns", "rows", col_pos[digit], row_pos[digit], lambda base, cover: (cover, base))):
+            for base_lines, cover in mask_subsets(list(enumerate(positions)), n):
+                base_mask = sum(1 << line for line in base_lines)
+                cover_lines = tuple(iter_bits(cover))
+                base_text = ", ".join(str(line + 1) for line in base_lines)
+                cover_text = ", ".join(str(line + 1) for line in cover_lines)
+
+                # Every other cell of the cover lines loses the digit
+                eliminations = []
+                for cover_line in cover_lines:
+                    for other in iter_bits(cover_positions[cover_line] & ~base_mask):
+                        r, c = to_cell(other, cover_line)
+                        eliminations.append({
+                            "cell": (r + 1, c + 1),
+                            "remove": digit,
+                            "reason": f"{technique} on {digit} in {base_name} {base_text} "
+                                      f"covers {cover_name} {cover_text}"
+                        })
+                if not eliminations:
+                    continue
+                eliminations.sort(key=lambda e: e["cell"])
+
+                cells = sorted(to_cell(base, cover_line)
+                               for base in base_lines for cover_line in iter_bits(positions[base]))
+                findings.append({
+                    "technique": technique,
+                    "cell": cell_to_ui_cell(cells),
+                    "value": {digit},
+                    "where": [f"{base_name} {base_text}"],
+                    "reason": f"In {base_name} {base_text}, {digit} can only go in {cover_name} "
+                              f"{cover_text}, so it can be removed from the rest of those {cover_name}.",
+                    "eliminations": eliminations
+                })
+
+    return findings
+
+
+def find_x_wings(board, context=None):
+    return find_fish(board, 2, context)
+
+
+def find_swordfish(board, context=None):
+    return find_fish(board, 3, context)
+
+
+def find_jellyfish(board, context=None):
+    return find_fish(board, 4, context)
@@ -1,59 +1,107 @@
 # src/hints/utils/board_utils.py
 
 # Common helper functions used by Sudoku heuristics
+from core.board_state import BoardState
+from core.tables import GRID_SIZE, POPCOUNT, mask_to_digits
 
 # Helper to format reason with 1-indexed positions
 def cell_to_ui_cell(cells):
     return [(r + 1, c + 1) for r, c in cells]
 
+# Display name of a core.tables house ID (0-8 rows, 9-17 columns, 18-26 blocks)
+def house_name(house):
+    kind, n = divmod(house, GRID_SIZE)
+    if kind == 0:
+        return f"row {n + 1}"
+    if kind == 1:
+        return f"column {n + 1}"
+    br, bc = divmod(n, 3)
+    return f"block starting at ({br * 3 + 1},{bc * 3 + 1})"
+
+HOUSE_NAMES = tuple(house_name(house) for house in range(3 * GRID_SIZE))
+
+#
+# All groups of n items whose 9-bit masks together cover exactly n bits -
+# the core of every subset technique (naked / hidden subsets, fish).
+#
+# Args:
+#    items: list of (item, mask); masks with fewer than 2 or more than n
+#           bits can never be part of a useful group and are skipped
+#    n: group size
+#
+# Returns:
+#    list of (tuple of items, union mask), in combination order
+#
+# Groups are built depth-first, OR-ing masks as items are added, and a
+# branch is abandoned as soon as its union has more than n bits.
+#
+def mask_subsets(items, n):
+    items = [(item, mask) for item, mask in items if 2 <= POPCOUNT[mask] <= n]
+    found = []
+    chosen = []
+
+    def extend(start, union):
+        if len(chosen) == n:
+            if POPCOUNT[union] == n:
+                found.append((tuple(chosen), union))
+            return
+        # Leave enough items to complete the group
+        for k in range(start, len(items) - (n - len(chosen)) + 1):
+            item, mask = items[k]
+            combined = union | mask
+            if POPCOUNT[combined] <= n:
+                chosen.append(item)
+                extend(k + 1, combined)
+                chosen.pop()
+
+    extend(0, 0)
+    return found
+
 def get_block_bounds(row: int, col: int, block_size: int = 3):
     # Return start/end indices for the 3x3 block containing (row, col)
     r0 = (row // block_size) * block_size
     c0 = (col // block_size) * block_size
     return r0, r0 + block_size, c0, c0 + block_size
 
+#
+# Return the compact BoardState behind a board. Boards without one (plain
+# objects that only expose user_board, e.g. in tests) get a temporary state
+# built from their grid.
+#
+def get_state(board):
+    state = getattr(board, "state", None)
+    if isinstance(state, BoardState):
+        return state
+    return BoardState.from_grid(board.user_board, givens=False)
+
 def get_block_values(board, row: int, col: int):
     # Return the set of values present in the 3x3 block for a given cell
-    r0, r1, c0, c1 = get_block_bounds(row, col)
-    values = set()
-    for rr in range(r0, r1):
-        for cc in range(c0, c1):
-            val = board.user_board[rr][cc]
-            if val != 0:
-                values.add(val)
-    return values
+    state = get_state(board)
+    return set(mask_to_digits(state.box_masks[(row // 3) * 3 + col // 3]))
 
 def get_row_values(board, row: int):
     # Return the set of nonzero values in a given row
-    return {v for v in board.user_board[row] if v != 0}
+    return set(mask_to_digits(get_state(board).row_masks[row]))
 
 def get_col_values(board, col: int):
     # Return the set of nonzero values in a given column
-    return {board.user_board[r][col] for r in range(board.size) if board.user_board[r][col] != 0}
+    return set(mask_to_digits(get_state(board).col_masks[col]))
 
 def get_candidates_for_cell(board, row: int, col: int):
-    # Return the set of legal candidates for a given empty cell 
-    if board.user_board[row][col] != 0:
-        return set()  # already filled
-
-    used = (
-        get_row_values(board, row)
-        | get_col_values(board, col)
-        | get_block_values(board, row, col)
-    )
-    return set(range(1, 10)) - used
+    # Return the set of legal candidates for a given empty cell (empty set if filled)
+    state = get_state(board)
+    return set(mask_to_digits(state.candidates(row * board.size + col)))
 
 #
 # Return a 9x9 list of sets of candidates for each empty cell
 # Already filled cells have an empty set
 #
+# The result comes from the board's candidate cache: it is rebuilt only after
+# a value changes and the same lists are handed to every caller, so it must
+# not be modified.
+#
 def get_all_candidates(board):
-    size = board.size
-    candidates = [[set() for _ in range(size)] for _ in range(size)]
-    for r in range(size):
-        for c in range(size):
-            candidates[r][c] = get_candidates_for_cell(board, r, c)
-    return candidates
+    return get_state(board).candidate_sets()
 
 # Nicely print a list of hints to the console. Used for testing
 #
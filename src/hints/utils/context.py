@@ -0,0 +1,83 @@
+# src/hints/utils/context.py
+
+from array import array
+from core.tables import (HOUSES, HOUSES_OF, ROWS, COLS, BOXES, PEERS, PEER_SETS,
+                         COMMON_PEERS, ROW_OF, COL_OF, BOX_OF, DIGITS_OF_MASK)
+from hints.utils import board_utils
+from hints.utils.links import LinkIndex
+
+#
+# Heuristic execution context
+# ---------------------------
+# Everything a heuristic pass needs that does not change while the pass runs:
+# the candidate grid (computed once, shared by every heuristic and every
+# find_eliminations call) plus the peer and house lookup tables.
+#
+# Heuristics accept an optional `context` argument; when omitted they build
+# their own, so calling them directly with just a board still works.
+#
+# Attributes:
+#    board: the board being analysed
+#    size: board size (9)
+#    candidates: 9x9 list of candidate sets (read-only)
+#    masks: flat array('H') of 81 9-bit candidate masks, same data as
+#           `candidates` (0 for filled cells)
+#    values: flat sequence of the 81 cell values (0 = empty)
+#    candidate_cells: digit -> cell bitset of the empty cells that still have
+#                     it as a candidate (index 0 unused); built on first use
+#    links: LinkIndex of bivalue cells and strong links for the chaining
+#           techniques; built on first use
+#    peers / common_peers / houses / houses_of / ...: the core.tables lookups
+#
+class HintContext:
+    peers = PEERS
+    peer_sets = PEER_SETS
+    common_peers = COMMON_PEERS
+    houses = HOUSES
+    houses_of = HOUSES_OF
+    rows = ROWS
+    cols = COLS
+    boxes = BOXES
+    row_of = ROW_OF
+    col_of = COL_OF
+    box_of = BOX_OF
+
+    def __init__(self, board):
+        self.board = board
+        self.size = board.size
+        self.state = board_utils.get_state(board)
+        self.values = self.state.values
+        self.candidates = board_utils.get_all_candidates(board)
+
+        if self.candidates is self.state.candidate_sets():
+            # Straight from the board's candidate cache - reuse its masks
+            self.masks = self.state.cands
+        else:
+            self.masks = array("H", (0 if self.values[i] else sum(1 << (d - 1) for d in cell)
+                                     for i, cell in enumerate(cell for row in self.candidates for cell in row)))
+        self._candidate_cells = None
+        self._links = None
+
+    @property
+    def candidate_cells(self):
+        if self._candidate_cells is None:
+            cells = [0] * 10
+            values, masks = self.values, self.masks
+            for i in range(len(masks)):
+                if not values[i]:
+                    bit = 1 << i
+                    for d in DIGITS_OF_MASK[masks[i]]:
+                        cells[d] |= bit
+            self._candidate_cells = cells
+        return self._candidate_cells
+
+    @property
+    def links(self):
+        if self._links is None:
+            self._links = LinkIndex(self)
+        return self._links
+
+
+def get_context(board, context=None):
+    # Return `context` if given, else build one for `board`
+    return context if context is not None else HintContext(board)
@@ -1,24 +1,12 @@
-from hints.utils.board_utils import get_all_candidates
+from collections.abc import Sequence
+from core.tables import (CELL_COUNT, PEERS, PEER_SETS, PEER_MASKS, COMMON_PEERS, ROW_OF, COL_OF, BOX_OF,
+                         DIGITS_OF_MASK, iter_bits)
+from hints.utils.context import get_context
 
 def get_visible_cells(cell):
     #Return all cells visible to the given cell (same row, col, or block)
     r, c = cell
-    visible = set()
-
-    # Same row and same column
-    for i in range(9):
-        visible.add((r, i))
-        visible.add((i, c))
-
-    # Same block
-    block_r, block_c = 3 * (r // 3), 3 * (c // 3)
-    for i in range(block_r, block_r + 3):
-        for j in range(block_c, block_c + 3):
-            visible.add((i, j))
-
-    # Remove the cell itself
-    visible.discard((r, c))
-    return visible
+    return {(j // 9, j % 9) for j in PEERS[r * 9 + c]}
 
 
 def get_common_visible_cells(hinted_cells):
@@ -26,10 +14,120 @@ def get_common_visible_cells(hinted_cells):
     if not hinted_cells:
         return set()
 
-    common = get_visible_cells(hinted_cells[0])
-    for cell in hinted_cells[1:]:
-        common &= get_visible_cells(cell)
-    return common
+    indices = [r * 9 + c for r, c in hinted_cells]
+    if len(indices) == 1:
+        common = PEER_SETS[indices[0]]
+    else:
+        common = set(COMMON_PEERS[indices[0]][indices[1]])
+        for i in indices[2:]:
+            common &= PEER_SETS[i]
+    return {(j // 9, j % 9) for j in common}
+
+def _single_reason(hi, j):
+    # "same row, same block as (1,2)": how peer j relates to the confirmed cell hi
+    relations = []
+    if ROW_OF[j] == ROW_OF[hi]:
+        relations.append("same row")
+    if COL_OF[j] == COL_OF[hi]:
+        relations.append("same column")
+    if BOX_OF[j] == BOX_OF[hi]:
+        relations.append("same block")
+    return ", ".join(relations) + f" as ({ROW_OF[hi]+1},{COL_OF[hi]+1})"
+
+# UI (1-indexed) cell of every cell index, and the elimination reason of
+# every (confirmed cell, peer) pair - singles build these for every hint
+UI_CELLS = tuple((ROW_OF[i] + 1, COL_OF[i] + 1) for i in range(CELL_COUNT))
+PEER_REASONS = tuple({j: _single_reason(i, j) for j in PEERS[i]} for i in range(CELL_COUNT))
+
+
+#
+#Eliminations of a single: `value` placed in cell index `i` leaves every
+#peer that still has it as a candidate (row-major order).
+#
+#Args:
+#    i: flat cell index (r * 9 + c)
+#    value: the digit placed in the cell
+#    candidate_cells: the HintContext's per-digit cell bitsets
+#
+def single_eliminations(i, value, candidate_cells):
+    eliminations = []
+    peers = PEER_MASKS[i] & candidate_cells[value]
+    if peers:
+        reasons = PEER_REASONS[i]
+        for j in iter_bits(peers):
+            eliminations.append({"cell": UI_CELLS[j], "remove": value, "reason": reasons[j]})
+    return eliminations
+
+
+#
+#Eliminations of a single, built on first use. Heuristics that report many
+#singles (hidden singles) return these so hints nobody selects never build
+#their elimination dicts. Reads like the list single_eliminations returns
+#and compares equal to it.
+#
+class SingleEliminations(Sequence):
+    __slots__ = ("_i", "_value", "_candidate_cells", "_items")
+
+    def __init__(self, i, value, candidate_cells):
+        self._i = i
+        self._value = value
+        self._candidate_cells = candidate_cells  # the context's; never mutated
+        self._items = None
+
+    def _list(self):
+        if self._items is None:
+            self._items = single_eliminations(self._i, self._value, self._candidate_cells)
+        return self._items
+
+    def __getitem__(self, index):
+        return self._list()[index]
+
+    def __len__(self):
+        return len(self._list())
+
+    def __eq__(self, other):
+        if isinstance(other, Sequence):
+            return self._list() == list(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return repr(self._list())
+
+
+#
+#Eliminations of a naked subset: the subset's digits leave every cell that
+#sees all of its cells, in any house they share (row-major order).
+#
+#Args:
+#    cells: flat cell indices of the subset
+#    union: 9-bit mask of the subset's digits
+#    masks: the HintContext's candidate masks
+#    candidate_cells: the HintContext's per-digit cell bitsets
+#    reason: reason text for every elimination
+#
+def subset_eliminations(cells, union, masks, candidate_cells, reason):
+    seen_by_all = PEER_MASKS[cells[0]]
+    for i in cells[1:]:
+        seen_by_all &= PEER_MASKS[i]
+    holding = 0
+    for d in DIGITS_OF_MASK[union]:
+        holding |= candidate_cells[d]
+
+    eliminations = []
+    for j in iter_bits(seen_by_all & holding):
+        for d in DIGITS_OF_MASK[masks[j] & union]:
+            eliminations.append({"cell": UI_CELLS[j], "remove": d, "reason": reason})
+    return eliminations
+
+
+def relation_text(cells):
+    # "(row=1, col=0, block=1)": the row / column / block all cells share, 0 if none
+    def shared(lookup):
+        values = {lookup[i] for i in cells}
+        return values.pop() + 1 if len(values) == 1 else 0
+    return f"(row={shared(ROW_OF)}, col={shared(COL_OF)}, block={shared(BOX_OF)})"
 
 def _deduplicate_eliminations(elims):
     seen = set()
@@ -49,6 +147,8 @@ def _deduplicate_eliminations(elims):
 #Args:
 #    board: Board-like object (must support .size and ideally .user_board or similar)
 #    confirmed_values: list of (row, col, value) tuples using 0-indexed coordinates
+#    context: optional HintContext - pass the one from the current heuristic
+#             pass so candidates are not recomputed for every call
 #
 #Returns:
 #    A list of dicts like:
@@ -58,91 +158,28 @@ def _deduplicate_eliminations(elims):
 #        ...
 #    ]
 #
-def find_eliminations(board, confirmed_values, technique):
+def find_eliminations(board, confirmed_values, technique, context=None):
     eliminations = []
-    candidates = get_all_candidates(board)  # 9x9 list of sets
+    context = get_context(board, context)
 
     # --- Naked / Hidden Singles ---
     if technique in ("Naked Singles", "Hidden Singles"):
+        candidate_cells = context.candidate_cells
         for hr, hc, hv in confirmed_values:
-            for r in range(9):
-                for c in range(9):
-                    if (r, c) == (hr, hc):
-                        continue
-                    same_row = r == hr
-                    same_col = c == hc
-                    same_block = (r // 3, c // 3) == (hr // 3, hc // 3)
-                    if same_row or same_col or same_block:
-                        if hv in candidates[r][c]:
-                            relations = []
-                            if same_row:
-                                relations.append("same row")
-                            if same_col:
-                                relations.append("same column")
-                            if same_block:
-                                relations.append("same block")
-                            reason = ", ".join(relations) + f" as ({hr+1},{hc+1})"
-                            eliminations.append({
-                                "cell": (r+1, c+1),
-                                "remove": hv,
-                                "reason": reason
-                            })
+            eliminations.extend(single_eliminations(hr * 9 + hc, hv, candidate_cells))
 
     # --- Naked Pairs ---
     elif technique == "Naked Pairs":
-     # For optimization: gather affected houses (rows, cols, blocks) from confirmed_values
-        
         # Extract the two cells and their shared values
-        cells = list({(r, c) for (r, c, _) in confirmed_values})
-        pair_values = list({v for (_, _, v) in confirmed_values})
+        cells = sorted({r * 9 + c for (r, c, _) in confirmed_values})
+        pair_values = {v for (_, _, v) in confirmed_values}
 
         if len(cells) != 2 or len(pair_values) != 2:
             return eliminations  # safety check
 
-        (r1, c1), (r2, c2) = cells
-        relation_bools, relation_ids = get_cell_relation((r1, c1), (r2, c2))
-        rel_row, rel_col, rel_block = relation_ids
-
-        # Use boolean flags from get_cell_relation
-        same_row, same_col, same_block = relation_bools
-
-        related_cells = set()
-
-        # --- Only collect cells from related regions ---
-    
-        # Row eliminations
-        if same_row:
-            r = r1  # the shared row
-            for c in range(9):
-                if (r, c) not in [(r1, c1), (r2, c2)]:
-                    related_cells.add((r, c))
-
-        # Column eliminations
-        if same_col:
-            c = c1  # the shared column
-            for r in range(9):
-                if (r, c) not in [(r1, c1), (r2, c2)]:
-                    related_cells.add((r, c))
-
-        # Block eliminations
-        if same_block:
-            block_r = (r1 // 3) * 3
-            block_c = (c1 // 3) * 3
-            for rr in range(block_r, block_r + 3):
-                for cc in range(block_c, block_c + 3):
-                    if (rr, cc) not in [(r1, c1), (r2, c2)]:
-                        related_cells.add((rr, cc))
-
-
-        # --- Check candidate eliminations only in related cells ---
-        for (r, c) in related_cells:
-            for v in pair_values:
-                if v in candidates[r][c]:
-                    eliminations.append({
-                        "cell": (r+1, c+1),
-                        "remove": v,
-                        "reason": f"Naked Pair in related area (row={rel_row+1}, col={rel_col+1}, block={rel_block+1})"
-                    })
+        union = sum(1 << (v - 1) for v in pair_values)
+        reason = f"Naked Pair in related area {relation_text(cells)}"
+        eliminations = subset_eliminations(cells, union, context.masks, context.candidate_cells, reason)
 
     else:
         raise ValueError(f"Unsupported technique: {technique}")
@@ -0,0 +1,51 @@
+# src/hints/utils/links.py
+
+from core.tables import CELL_COUNT, GRID_SIZE, HOUSE_MASKS, PEER_MASKS, POPCOUNT
+
+#
+# Link index for chaining techniques
+# ----------------------------------
+# Built once per hint pass (HintContext.links, i.e. once per board version)
+# and shared by XY-Wing, Simple Coloring and X-Chain:
+#
+#    bivalue:  cell bitset of the empty cells with exactly two candidates
+#    strong:   strong[d][i] is the cell bitset of the cells j where d is
+#              either in i or in j - the only two cells of a house with d
+#              (a conjugate pair / bilocal link); index 0 unused
+#    linked:   linked[d] is the bitset of cells with at least one strong
+#              link on d
+#
+# Weak links (both cells can't be d, but both could be not d) are just
+# peers that also have the candidate - see weak().
+# ----------------------------------
+
+
+class LinkIndex:
+    def __init__(self, context):
+        masks, values = context.masks, context.values
+        self.candidate_cells = context.candidate_cells
+
+        self.bivalue = 0
+        for i in range(CELL_COUNT):
+            if not values[i] and POPCOUNT[masks[i]] == 2:
+                self.bivalue |= 1 << i
+
+        self.strong = [None] + [[0] * CELL_COUNT for _ in range(GRID_SIZE)]
+        self.linked = [0] * (GRID_SIZE + 1)
+        for d in range(1, GRID_SIZE + 1):
+            cells = self.candidate_cells[d]
+            strong = self.strong[d]
+            for house_mask in HOUSE_MASKS:
+                pair = house_mask & cells
+                rest = pair & (pair - 1)
+                if not rest or rest & (rest - 1):
+                    continue  # fewer or more than two cells
+                a = (pair ^ rest).bit_length() - 1
+                b = rest.bit_length() - 1
+                strong[a] |= 1 << b
+                strong[b] |= 1 << a
+                self.linked[d] |= pair
+
+    def weak(self, d, i):
+        # Cells weakly linked to i on d: its peers that have d as a candidate
+        return PEER_MASKS[i] & self.candidate_cells[d]
@@ -1,22 +1,33 @@
+import os
 import pygame
 import sys
+import time
 from ui.menu import Menu
 from ui.board import Board
 from ui.numberpad import NumberPad
-from core.generator import generate_sudoku, fill_board
+from core.puzzle_pool import PuzzlePool
+from core.generation_job import GenerationJob
 from ui.timer import Timer
 import ui.style as style
 from ui.sidebar import Sidebar
 from ui.hint_section import handle_hint_key
+from ui.progress import GenerationProgress
+from ui.render import Renderer
+from ui.scheduler import FrameScheduler
+from ui.profiler_overlay import ProfilerOverlay
+from core.profiler import profiler
 
 # ------------------- INITIALIZE PYGAME -------------------
 # Initialize Pygame
 pygame.init()
 
+# Load every font the UI uses once, before the first frame
+style.warm_up_fonts()
+
 # ------------------- CONSTANTS -------------------
 # Constants
 CELL_SIZE = 60
-GRID_SIZE = 550
+GRID_SIZE = style.BOARD_PIXELS
 BUTTON_HEIGHT = 60
 BUTTON_AREA_HEIGHT = BUTTON_HEIGHT + 20  # padding
 SIDEBAR_WIDTH = 300
@@ -26,11 +37,28 @@ SCREEN_WIDTH = GRID_SIZE + SIDEBAR_WIDTH # expand for right menu
 SCREEN_HEIGHT = GRID_SIZE + BUTTON_AREA_HEIGHT
 GRID_PIXELS = CELL_SIZE * GRID_SIZE  # 600x600 square for grid
 FPS = 60
+
+# Frame pacing: "adaptive" sleeps while nothing happens (waking once per
+# second for the timer), "fixed" always runs at FPS
+FRAME_POLICY = os.environ.get("SUDOKU_FRAME_POLICY", "adaptive")
+IDLE_TIMEOUT = 1.0    # longest idle sleep, seconds
+ACTIVE_PERIOD = 0.5   # keep full frame rate this long after input, seconds
+
+# Profiling: F3 toggles the overlay; with SUDOKU_PROFILE_TRACE set, counters
+# are collected from the start and written there as JSON on exit
+PROFILER_KEY = pygame.K_F3
+PROFILE_TRACE = os.environ.get("SUDOKU_PROFILE_TRACE")
+
+# Pre-generated puzzle pool (per difficulty)
+POOL_DIR = os.path.join(os.path.expanduser("~"), ".sudoku_trainer", "puzzle_pool")
+POOL_CAPACITY = 10
+POOL_LOW_WATER = 3
 screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
 
 # Game states
 STATE_MENU = "menu"
 STATE_DIFFICULTY = "difficulty"
+STATE_GENERATING = "generating"
 STATE_GAME = "game"
 
 # ------------------- CREATE MENUS -------------------
@@ -55,9 +83,12 @@ difficulty_menu = Menu(
      y=SCREEN_HEIGHT // 4,
      menu_type = "DIFFICULTY",
      spacing = 60)
+generation_progress = GenerationProgress(SCREEN_WIDTH, SCREEN_HEIGHT)
 
 # ------------------- GLOBALS -------------------
 clock = pygame.time.Clock()
+renderer = Renderer(screen)
+profiler_overlay = ProfilerOverlay()
 
 # State
 game_state = STATE_MENU
@@ -65,21 +96,101 @@ board = None
 selected_difficulty = None
 selected_cell = None
 timer = None
+generation_job = None
+
+
+# ------------------- GAME SETUP -------------------
+#
+# Build the board and game-screen widgets for a new puzzle.
+#
+# Returns:
+#    (board, numberpad, timer, sidebar)
+#
+def create_game(puzzle, solution_board):
+    # Create 9x9 board based on puzzle and solution
+    board = Board(
+        size=9,
+        screen_size=GRID_SIZE,
+        puzzle=puzzle,
+        solution=solution_board,
+    )
+
+    # Automatically refresh hints whenever board changes
+    board.register_update_listener(lambda: sidebar.hint_section.mark_dirty())
+    
+    #DUBUG SECTION - Keeping for easy debug access, for now
+    '''
+    print("Puzzle for difficulty", choice)
+    for row in puzzle:
+        print(row)
+
+    print("grid type:", type(board.grid), "len:", len(board.grid))
+    print("grid[0] type:", type(board.grid[0]))
+    print("user_board type:", type(board.user_board), "len:", len(board.user_board))
+    print("user_board[0] type:", type(board.user_board[0]))
+
+    # Debug print
+    print("=== Initial Board State ===")
+    print("grid:")
+    for row in board.grid:
+        print(row)
+    print("user_board:")
+    for row in board.user_board:
+        print(row)
+    print("givens:")
+    for row in board.givens:
+        print(row)
+    print("solutions:")
+    for row in solution_board:
+        print(row)
+    '''
+
+    board.selected_cell = None
+
+    numberpad = NumberPad(GRID_SIZE, board.screen_size)
+    numberpad.board = board
+
+    # Kick off game timer
+    timer = Timer(style.FONT_TIMER, 650, 32)
+    timer.start()
+
+    sidebar = Sidebar(board, numberpad, timer, SCREEN_WIDTH)
+
+    return board, numberpad, timer, sidebar
 
 
 # Main loop
 def main():
-    global game_state, board, selected_difficulty, selected_cell, timer
+    global game_state, board, selected_difficulty, selected_cell, timer, generation_job
 
     clock = pygame.time.Clock()
+    scheduler = FrameScheduler(FPS, FRAME_POLICY, IDLE_TIMEOUT, ACTIVE_PERIOD, clock)
     run = True
 
+    # Keep the puzzle pool stocked in the background
+    puzzle_pool = PuzzlePool(POOL_DIR, capacity=POOL_CAPACITY, low_water=POOL_LOW_WATER)
+    puzzle_pool.start()
+
+    if PROFILE_TRACE:
+        profiler.enabled = True
+
     while run:
-        events = pygame.event.get()
+        # Full rate while generating (progress bar) or interacting; otherwise
+        # sleep until input arrives or the timer shows the next second
+        wake_in = None
+        if game_state == STATE_GAME and timer and not timer.paused:
+            wake_in = 1.0 - timer.get_elapsed() % 1.0
+        events = scheduler.get_events(busy=game_state == STATE_GENERATING, wake_in=wake_in)
+        frame_start = time.perf_counter()
 
         for event in events:
             if event.type == pygame.QUIT:
                 run = False
+            elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                renderer.invalidate()
+            elif event.type == pygame.KEYDOWN and event.key == PROFILER_KEY:
+                profiler_overlay.toggle()
+                continue
 
             # --- TIMER HANDLING ---
             if timer:
@@ -101,58 +212,24 @@ def main():
             elif game_state == STATE_DIFFICULTY:
                 difficulty_choice = difficulty_menu.handle_event(event)
                 if difficulty_choice:
-                    # Generate puzzle for selected difficulty
-                    puzzle, solution_board = generate_sudoku(difficulty_choice)
-                    
-                    # Create 9x9 board based on puzzle and solution
-                    board = Board(
-                        size=9,
-                        screen_size=GRID_SIZE,
-                        puzzle=puzzle,
-                        solution=solution_board,
-                    )
-
-                    # Automatically refresh hints whenever board changes
-                    board.register_update_listener(lambda: sidebar.hint_section.draw(screen))
-                    
-                    #DUBUG SECTION - Keeping for easy debug access, for now
-                    '''
-                    print("Puzzle for difficulty", choice)
-                    for row in puzzle:
-                        print(row)
-
-                    print("grid type:", type(board.grid), "len:", len(board.grid))
-                    print("grid[0] type:", type(board.grid[0]))
-                    print("user_board type:", type(board.user_board), "len:", len(board.user_board))
-                    print("user_board[0] type:", type(board.user_board[0]))
-
-                    # Debug print
-                    print("=== Initial Board State ===")
-                    print("grid:")
-                    for row in board.grid:
-                        print(row)
-                    print("user_board:")
-                    for row in board.user_board:
-                        print(row)
-                    print("givens:")
-                    for row in board.givens:
-                        print(row)
-                    print("solutions:")
-                    for row in solution_board:
-                        print(row)
-                    '''
-
-                    game_state = STATE_GAME
-                    board.selected_cell = None
-
-                    numberpad = NumberPad(GRID_SIZE, board.screen_size)
-                    numberpad.board = board
-
-                    # Kick off game timer
-                    timer = Timer(style.FONT_TIMER, 650, 32)
-                    timer.start()
-
-                    sidebar = Sidebar(board, numberpad, timer, SCREEN_WIDTH)
+                    # Take a pre-generated puzzle when the pool has one
+                    pooled = puzzle_pool.take(difficulty_choice)
+                    if pooled:
+                        puzzle, solution_board = pooled
+                        board, numberpad, timer, sidebar = create_game(puzzle, solution_board)
+                        game_state = STATE_GAME
+                    else:
+                        # Generate off the main thread and show progress meanwhile
+                        generation_job = GenerationJob(difficulty_choice)
+                        generation_progress.set_difficulty(difficulty_choice)
+                        game_state = STATE_GENERATING
+
+            # --- GENERATING (background job running) ---
+            elif game_state == STATE_GENERATING:
+                if generation_progress.handle_event(event) == "cancel":
+                    generation_job.cancel()
+                    generation_job = None
+                    game_state = STATE_DIFFICULTY
 
             # --- BOARD (GAME LOOP)---
             elif game_state == STATE_GAME:
@@ -178,18 +255,40 @@ def main():
                 if board and sidebar:
                     sidebar.hint_section.handle_event(event, board)
                 
+        # --- BACKGROUND GENERATION ---
+        if game_state == STATE_GENERATING and generation_job and generation_job.done:
+            if generation_job.result:
+                puzzle, solution_board = generation_job.result
+                board, numberpad, timer, sidebar = create_game(puzzle, solution_board)
+                game_state = STATE_GAME
+            else:
+                game_state = STATE_DIFFICULTY
+            generation_job = None
+
         # --- DRAW SECTION ---
-        screen.fill(style.BACKGROUND_COLOR)
+        # Only areas that changed since the last frame are repainted and pushed
+        # to the display; switching screens (or pausing) redraws everything.
         if game_state == STATE_MENU:
-            main_menu.draw(screen)
+            scene, layers = STATE_MENU, [main_menu]
         elif game_state == STATE_DIFFICULTY:
-            difficulty_menu.draw(screen)
+            scene, layers = STATE_DIFFICULTY, [difficulty_menu]
+        elif game_state == STATE_GENERATING and generation_job:
+            generation_progress.progress = generation_job.progress
+            scene, layers = (STATE_GENERATING, generation_job), [generation_progress]
         elif game_state == STATE_GAME and board:
-            board.draw(screen)
-            sidebar.draw(screen)
-        pygame.display.flip()
-        clock.tick(FPS)
+            scene, layers = (STATE_GAME, board, timer.paused), [board, sidebar]
+        else:
+            scene, layers = None, []
+        dirty = renderer.render(scene, layers + [profiler_overlay])
+        if dirty:
+            pygame.display.update(dirty)
+        profiler.record("frame", time.perf_counter() - frame_start)
 
+    if generation_job:
+        generation_job.cancel()
+    puzzle_pool.stop(timeout=1)
+    if PROFILE_TRACE:
+        profiler.dump(PROFILE_TRACE)
     pygame.quit()
     sys.exit()
 
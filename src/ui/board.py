@@ -1,29 +1,31 @@
 # ui/board.py
 import pygame
 import ui.style as style
-from hints.utils.board_utils import get_all_candidates, pretty_print_findings
 from ui.hint_section import handle_hint_key
+from core.board_state import BoardState, ValueGrid, GivenGrid, GivenFlags, LockedFlags, NotesGrid
+from core.tables import PEERS, iter_bits, mask_to_digits
+from ui.render import Renderable
+from ui.glyphs import GlyphAtlas
+from core.profiler import profiler
 
 
 GRID_SIZE = 9
 
-class Board:
+class Board(Renderable):
     def __init__(self, size=9, screen_size=600, puzzle=None, solution=None):
         self.size = size
         self.screen_size = screen_size
         self.cell_size = screen_size // size
-        self.font = pygame.font.SysFont("arial", self.cell_size // 2)
+        self.font = style.get_default_font(style.board_font_sizes(self.cell_size)[0])
+        self._glyphs = None  # GlyphAtlas for the current cell_size, see _get_glyphs()
+        self._layers = {}    # layer name -> (key, Surface), see draw()
 
-        self.grid = puzzle if puzzle else [[0]*size for _ in range(size)]
         self.solution = solution  
-        
-        # Track user edits separately without harm of overwriting givens
-        # - Starts as copy of puzzle (self.grid), will update as user enters numbers
-        self.user_board = [row[:] for row in self.grid]  
 
-        # Keep track of which cells are givens (non-editable)
-        self.givens = [[1 if val != 0 else 0 for val in row] for row in self.grid]
-        self.locked = [[0 for _ in range(size)] for _ in range(size)]
+        # Compact state: values, notes, givens/locked bitsets and house masks.
+        # grid / user_board / givens / locked / notes below are 9x9 views of it.
+        # - Every non-zero puzzle cell starts as a given (non-editable)
+        self.state = BoardState.from_grid(puzzle) if puzzle else BoardState()
 
         # track selected cell (row, col)
         self.selected_cell = None
@@ -31,182 +33,216 @@ class Board:
 
         # Notes mode
         self.notes_mode = False
-        self.notes = [[set() for _ in range(self.size)] for _ in range(self.size)]
-
-        # Count of how many of each number user has correctly entered
-        self.number_counts = {i: 0 for i in range(1, 10)}
 
         # Highlighting hints and eliminations
         self.highlighted_cells = []        # Cells highlighted for the current hint
         self.highlighted_candidates = {}   # Dict mapping (r,c) -> set of candidates to highlight
         self.highlighted_eliminations = {} # Dict mapping (r,c) -> set of candidates to eliminate
+        self.highlight_version = 0         # Bumped whenever the highlights above change
 
         # --- Add update listener support ---
         self._update_listeners = []
 
+        # Monotonic version, bumped on every update - caches key off it
+        self.version = 0
+        self._hint_results = None  # HintEngine cache for this version
+
+    # ------------------- State views -------------------
+    @property
+    def grid(self):
+        # Original puzzle (givens only)
+        return GivenGrid(self.state)
+
+    @property
+    def user_board(self):
+        # Givens plus user entries
+        return ValueGrid(self.state)
+
+    @property
+    def givens(self):
+        return GivenFlags(self.state)
+
+    @property
+    def locked(self):
+        return LockedFlags(self.state)
+
+    @property
+    def notes(self):
+        return NotesGrid(self.state)
+
+    @property
+    def number_counts(self):
+        # How many of each number (1-9) are on the board, kept up to date by BoardState
+        counts = self.state.digit_counts
+        return {i: counts[i] for i in range(1, 10)}
+
+    # ------------------- Rendering -------------------
+    def _get_glyphs(self):
+        # Pre-rendered digits and notes, rebuilt only when the cell size changes
+        if self._glyphs is None or self._glyphs.cell_size != self.cell_size:
+            self._glyphs = GlyphAtlas(self.cell_size)
+        return self._glyphs
+
+    def render_key(self):
+        # State version covers values, notes, givens and locked cells
+        return (self.state.version, self.selected_cell, self.highlight_version)
+
+    def render_regions(self):
+        # Grid plus the outer border lines, which stick out by a pixel or two
+        grid_rect = pygame.Rect(style.GRID_OFFSET_X, style.GRID_OFFSET_Y,
+                                self.screen_size, self.screen_size)
+        return [grid_rect.inflate(4, 4)]
+
     # ------------------- Listener API -------------------
     def register_update_listener(self, callback):
         """Register a function to call whenever the board updates."""
         self._update_listeners.append(callback)
 
     def _notify_update(self):
+        self.version += 1
         for callback in self._update_listeners:
             callback()
 
     def get_conflicts(self, row, col):
         # Return list of (r, c) positions that conflict with selected cell
-        conflicts = []
-        num = self.user_board[row][col]
-        if num == 0:
-            return conflicts
-
-        # same row or column
-        for i in range(self.size):
-            if i != col and self.user_board[row][i] == num:
-                conflicts.append((row, i))
-            if i != row and self.user_board[i][col] == num:
-                conflicts.append((i, col))
-
-        # same 3x3 block
-        block_row = (row // 3) * 3
-        block_col = (col // 3) * 3
-        for r in range(block_row, block_row + 3):
-            for c in range(block_col, block_col + 3):
-                if (r, c) != (row, col) and self.user_board[r][c] == num:
-                    conflicts.append((r, c))
-        return conflicts
+        # (looked up from the state's digit index, cached until the next edit)
+        return [divmod(j, self.size) for j in self.state.conflicts(row * self.size + col)]
        
-    def draw(self, screen):
+    # ------------------- Layers -------------------
+    #
+    # The board is composited from four cached surfaces, back to front:
+    #    background - grid fill, never changes for a given screen_size
+    #    highlights - selected cell, its row/column/block, matches and conflicts
+    #    content    - digits, notes and hint boxes around notes
+    #    lines      - grid lines, never change for a given screen_size
+    # Each layer is only redrawn when its key changes; otherwise draw() is
+    # four blits.
+    #
+    LAYER_MARGIN = 2  # the thick outer grid lines stick out by up to 2px
+
+    def _cell_origin(self, row, col):
+        # Top-left of a cell in layer coordinates
+        return (self.LAYER_MARGIN + col * self.cell_size, self.LAYER_MARGIN + row * self.cell_size)
+
+    def _cell_rect(self, row, col):
+        return pygame.Rect(self._cell_origin(row, col), (self.cell_size, self.cell_size))
+
+    def _layer(self, name, key, build, solid=False):
+        # Return the cached surface for layer `name`, rebuilding it if `key` changed.
+        # solid: layer has no partially transparent pixels (no text), so it can
+        #        be RLE-encoded, which makes blitting a mostly empty layer nearly free
+        cached = self._layers.get(name)
+        hit = cached is not None and cached[0] == key
+        profiler.hit("layer." + name, hit)
+        if hit:
+            return cached[1]
+        size = (self.screen_size + 2 * self.LAYER_MARGIN,) * 2
+        if cached is not None and cached[1].get_size() == size:
+            surface = cached[1]
+            surface.fill((0, 0, 0, 0))
+        else:
+            surface = pygame.Surface(size, pygame.SRCALPHA)
+            if solid:
+                surface.set_alpha(255, pygame.RLEACCEL)
+        build(surface)
+        self._layers[name] = (key, surface)
+        return surface
+
+    def _build_background(self, surface):
         # Draw grid background color
         grid_size = self.cell_size * 9
-        grid_rect = pygame.Rect(style.GRID_OFFSET_X, style.GRID_OFFSET_Y, grid_size, grid_size)
-        pygame.draw.rect(screen, style.BACKGROUND_GRID, grid_rect)
+        pygame.draw.rect(surface, style.BACKGROUND_GRID,
+                         (self.LAYER_MARGIN, self.LAYER_MARGIN, grid_size, grid_size))
+
+    def _build_highlights(self, surface):
+        state = self.state
+        values = state.values
+        if not self.selected_cell:
+            return
+
+        # Only the selected cell, its peers and cells holding the same digit
+        # are touched - all found through the state's indexes
+        row, col = self.selected_cell
+        index = row * self.size + col
+
+        # Highlight all matching numbers in green
+        selected_value = values[index]
+        if selected_value != 0:
+            for j in iter_bits(state.digit_cells[selected_value] & ~(1 << index)):
+                pygame.draw.rect(surface, style.HIGHLIGHT_GREEN, self._cell_rect(*divmod(j, self.size)))
 
         # Draw grey highlight for row, column, and block
-        if self.selected_cell:
-             # Highlight all matching numbers in green
-            sel_row, sel_col = self.selected_cell
-            selected_value = self.user_board[sel_row][sel_col]
-            if selected_value != 0:
-                for r in range(self.size):
-                    for c in range(self.size):
-                        if (r, c) != (sel_row, sel_col) and self.user_board[r][c] == selected_value:
-                            match_rect = pygame.Rect(
-                                style.GRID_OFFSET_X + c * self.cell_size,
-                                style.GRID_OFFSET_Y + r * self.cell_size,
-                                self.cell_size,
-                                self.cell_size
-                            )
-                            pygame.draw.rect(screen, style.HIGHLIGHT_GREEN, match_rect)
-            # Highlight all conflicts in red
-            row, col = self.selected_cell
-            block_row = (row // 3) * 3
-            block_col = (col // 3) * 3
-            for r in range(self.size):
-                for c in range(self.size):
-                    if r == row or c == col or (block_row <= r < block_row + 3 and block_col <= c < block_col + 3):
-                        rect = pygame.Rect(
-                            style.GRID_OFFSET_X + c * self.cell_size,
-                            style.GRID_OFFSET_Y + r * self.cell_size,
-                            self.cell_size,
-                            self.cell_size
-                        )
-                        pygame.draw.rect(screen, style.HIGHLIGHT_GREY, rect)
-            for (r, c) in self.get_conflicts(row, col):
-                rect = pygame.Rect(
-                    style.GRID_OFFSET_X + c * self.cell_size,
-                    style.GRID_OFFSET_Y + r * self.cell_size,
-                    self.cell_size,
-                    self.cell_size
-                )
-                pygame.draw.rect(screen, style.HIGHLIGHT_RED, rect)
-
-        # Draw grid cells
+        for j in PEERS[index]:
+            pygame.draw.rect(surface, style.HIGHLIGHT_GREY, self._cell_rect(*divmod(j, self.size)))
+
+        # Highlight all conflicts in red
+        for j in state.conflicts(index):
+            pygame.draw.rect(surface, style.HIGHLIGHT_RED, self._cell_rect(*divmod(j, self.size)))
+
+        # Highlight selected cell
+        rect = self._cell_rect(row, col)
+        if state.is_given(index):
+            # Givens - Highlight selected cell in blue
+            pygame.draw.rect(surface, style.HIGHLIGHT_BLUE, rect)
+        elif state.is_locked(index):
+            # Correct entry - Highlight selected cell in blue
+            pygame.draw.rect(surface, style.HIGHLIGHT_BLUE, rect)
+        elif values[index] != 0 and self.solution:
+            # Wrong entry - Highlight selected cell in red
+            pygame.draw.rect(surface, style.HIGHLIGHT_WRONG_ENTRY, rect)
+            self.selected_cell_type="WRONG"
+        else:  # Default - Highlight selected cell in blue
+            pygame.draw.rect(surface, style.HIGHLIGHT_BLUE, rect)
+
+    def _build_content(self, surface):
+        state = self.state
+        values = state.values
+        glyphs = self._get_glyphs()
+
         for row in range(self.size):
             for col in range(self.size):
-                rect = pygame.Rect(
-                    style.GRID_OFFSET_X + col * self.cell_size,
-                    style.GRID_OFFSET_Y + row * self.cell_size,
-                    self.cell_size,
-                    self.cell_size
-                )
-                # Highlight selected cell
-                if self.selected_cell == (row, col):
-                    if self.givens[row][col]:
-                        # Givens - Highlight selected cell in blue
-                        pygame.draw.rect(screen, style.HIGHLIGHT_BLUE, rect)
-                    elif self.locked[row][col]: 
-                        # Correct entry - Highlight selected cell in blue
-                        pygame.draw.rect(screen, style.HIGHLIGHT_BLUE, rect)
-                    elif self.user_board[row][col] != 0 and self.solution:
-                        # Wrong entry - Highlight selected cell in red
-                        pygame.draw.rect(screen, style.HIGHLIGHT_WRONG_ENTRY, rect)
-                        self.selected_cell_type="WRONG"
-                    else:  # Default - Highlight selected cell in blue
-                        pygame.draw.rect(screen, style.HIGHLIGHT_BLUE, rect)
-
-                # Draw numbers: givens first, then user_board               
-                num = self.user_board[row][col]
-                is_wrong = self.solution and num != 0 and num != self.solution[row][col] and not self.givens[row][col]
+                index = row * self.size + col
+                x, y = self._cell_origin(row, col)
+
+                # Draw numbers: givens first, then user_board
+                num = values[index]
                 if num != 0:
-                    if self.givens[row][col] != 0:
-                    # Given number - black
-                        color = style.GIVEN_COLOR
-                    elif self.locked[row][col]:
+                    if state.is_given(index):
+                        # Given number - black
+                        kind = "given"
+                    elif state.is_locked(index):
                         # Correct user entry - blue
-                        color = style.USER_COLOR
+                        kind = "user"
                     else:
                         # Incorrect user entry - red
-                        color = style.WRONG_COLOR
-                    label = self.font.render(str(num), True, color)
-                    label_rect = label.get_rect(center=rect.center)
-                    screen.blit(label, label_rect)
+                        kind = "wrong"
+                    surface.blit(*glyphs.digit(kind, num, x, y))
+                    continue
 
                 # Draw notes - only if cell is empty
-                notes = self.notes[row][col]
-                if notes and self.user_board[row][col] == 0:
-                    for note in notes:
-                        sub_row = (note - 1) // 3
-                        sub_col = (note - 1) % 3
-                        x = style.GRID_OFFSET_X + col * self.cell_size + (sub_col + 0.5) * (self.cell_size / 3)
-                        y = style.GRID_OFFSET_Y + row * self.cell_size + (sub_row + 0.5) * (self.cell_size / 3)
-                        note_font = pygame.font.SysFont("arial", self.cell_size // 4)
-                        note_label = note_font.render(str(note), True, (120, 120, 120))
-                        note_rect = note_label.get_rect(center=(x, y))
-                        screen.blit(note_label, note_rect)
-
-        # --- Draw notes (with green boxes for highlighted candidates) ---
-        for row in range(self.size):
-            for col in range(self.size):
-                notes = self.notes[row][col]
-                if notes and self.user_board[row][col] == 0:
-                    for note in notes:
-                        sub_row = (note - 1) // 3
-                        sub_col = (note - 1) % 3
-                        x = style.GRID_OFFSET_X + col * self.cell_size + (sub_col + 0.5) * (self.cell_size / 3)
-                        y = style.GRID_OFFSET_Y + row * self.cell_size + (sub_row + 0.5) * (self.cell_size / 3)
-
-                        note_font = pygame.font.SysFont("arial", self.cell_size // 4)
-                        note_label = note_font.render(str(note), True, (120, 120, 120))
-                        note_rect = note_label.get_rect(center=(x, y))
-                        screen.blit(note_label, note_rect)
-
-                        # If this candidate is part of a shown hint - draw green box 
-                        if (row, col) in self.highlighted_candidates and note in self.highlighted_candidates[(row, col)]:
-                            box_rect = note_rect.inflate(6, 6)
-                            pygame.draw.rect(screen, style.HIGHLIGHT_GREEN, box_rect, border_radius=2)  # filled
-                            # Then blit number on top
-                            note_label = note_font.render(str(note), True, (0, 0, 0))  # text color (black)
-                            screen.blit(note_label, note_rect)
-
-                        # If this candidate is marked for elimination - draw red box
-                        if (row, col) in self.highlighted_eliminations and note in self.highlighted_eliminations[(row, col)]:
-                            box_rect = note_rect.inflate(6, 6)
-                            pygame.draw.rect(screen, style.HIGHLIGHT_RED, box_rect, border_radius=2)
-                            note_label = note_font.render(str(note), True, (0, 0, 0))  # text color (black)
-                            screen.blit(note_label, note_rect)
-
+                notes = state.notes[index]
+                if not notes:
+                    continue
+                highlighted = self.highlighted_candidates.get((row, col), ())
+                eliminated = self.highlighted_eliminations.get((row, col), ())
+                for note in mask_to_digits(notes):
+                    # If this candidate is part of a shown hint - green box,
+                    # if it is marked for elimination - red box
+                    box_color = None
+                    if note in highlighted:
+                        box_color = style.HIGHLIGHT_GREEN
+                    if note in eliminated:
+                        box_color = style.HIGHLIGHT_RED
+                    if box_color is None:
+                        surface.blit(*glyphs.note(note, x, y))
+                        continue
+                    note_label, note_rect = glyphs.note(note, x, y, highlighted=True)
+                    pygame.draw.rect(surface, box_color, note_rect.inflate(6, 6), border_radius=2)
+                    surface.blit(note_label, note_rect)
+
+    def _build_lines(self, surface):
         # Draw thicker lines every 3 cells (classic Sudoku style)
+        origin = self.LAYER_MARGIN
         for i in range(self.size + 1):
             if  i % 3 == 0:
                 line_width = 3
@@ -214,19 +250,34 @@ class Board:
                 line_width = 1
             # Vertical lines
             pygame.draw.line(
-                screen, style.GRID_BLACK_LINE,
-                (style.GRID_OFFSET_X + i * self.cell_size, style.GRID_OFFSET_Y),
-                (style.GRID_OFFSET_X + i * self.cell_size, style.GRID_OFFSET_Y + self.screen_size),
+                surface, style.GRID_BLACK_LINE,
+                (origin + i * self.cell_size, origin),
+                (origin + i * self.cell_size, origin + self.screen_size),
                 line_width
             )
             # Horizontal lines
             pygame.draw.line(
-                screen, style.GRID_BLACK_LINE,
-                (style.GRID_OFFSET_X, style.GRID_OFFSET_Y + i * self.cell_size),
-                (style.GRID_OFFSET_X + self.screen_size, style.GRID_OFFSET_Y + i * self.cell_size),
+                surface, style.GRID_BLACK_LINE,
+                (origin, origin + i * self.cell_size),
+                (origin + self.screen_size, origin + i * self.cell_size),
                 line_width
             )
 
+    def draw(self, screen):
+        state = self.state
+        geometry = (self.screen_size, self.cell_size)
+        layers = (
+            self._layer("background", geometry, self._build_background, solid=True),
+            self._layer("highlights", (geometry, self.selected_cell, state.value_version,
+                                       state.givens, state.locked), self._build_highlights, solid=True),
+            self._layer("content", (geometry, state.version, self.highlight_version),
+                        self._build_content),
+            self._layer("lines", geometry, self._build_lines, solid=True),
+        )
+        position = (style.GRID_OFFSET_X - self.LAYER_MARGIN, style.GRID_OFFSET_Y - self.LAYER_MARGIN)
+        for layer in layers:
+            screen.blit(layer, position)
+
     def get_cell_from_mouse(self, pos):
         x, y = pos
         col = (x - style.GRID_OFFSET_X) // self.cell_size
@@ -240,7 +291,7 @@ class Board:
         if key in range(pygame.K_1, pygame.K_9 + 1):
             number = key - pygame.K_0
             # If all of number x is on the board, don't let user enter more
-            if self.number_counts.get(number, 0) >= 9:
+            if self.state.digit_counts[number] >= 9:
                 return
             self.handle_number_entry(number)
         elif key in (pygame.K_BACKSPACE, pygame.K_DELETE):
@@ -254,36 +305,32 @@ class Board:
         if self.selected_cell is None:
             return
         row, col = self.selected_cell
+        state = self.state
+        index = row * self.size + col
 
         # Ignore givens AND locked cells
-        if self.givens[row][col] == 1 or self.locked[row][col] == 1:
+        if state.is_given(index) or state.is_locked(index):
             return
         
         # ----- Notes mode -----
         if self.notes_mode:
             # Only allow notes in empty cells
-            if self.user_board[row][col] != 0:
+            if state.values[index] != 0 or not 1 <= number <= 9:
                 return
             
-            if self.number_counts[number] >= 9:
+            if state.digit_counts[number] >= 9:
                 return
-            elif number in self.notes[row][col]:
-                self.notes[row][col].remove(number)
-            else:
-                self.notes[row][col].add(number)
+            state.toggle_note(index, number)
             self._notify_update()
             return  # stop here, do not place number in user_board
 
         # ----- Solve mode -----
-        # Place number
-        self.user_board[row][col] = number
+        # Place number (number counts and house masks update incrementally)
+        state.set_value(index, number)
 
         # If correct, lock it
         if self.solution and number == self.solution[row][col]:
-            self.locked[row][col] = 1
-            
-        # Update number counts after correct entry
-        self.update_number_counts()
+            state.set_locked(index, True)
 
         # Notify Observers / Hint refresh
         self._notify_update()
@@ -295,19 +342,17 @@ class Board:
             self._notify_update()
 
     def remove_candidate(self, row, col, value):
-        self.notes[row][col].discard(value)
+        if 1 <= value <= 9:
+            self.notes[row][col].discard(value)
         self._notify_update()
     
     def toggle_notes_mode(self):
         self.notes_mode = not self.notes_mode
 
     def update_number_counts(self):
-        # Recalculate how many times each number (1–9) appears on the board
-        self.number_counts = {i: 0 for i in range(1, 10)}
-        for row in self.user_board:
-            for num in row:
-                if num in self.number_counts:
-                    self.number_counts[num] += 1
+        # Kept for compatibility - BoardState now tracks counts incrementally
+        return self.number_counts
+
     #
     # Apply hint highlighting to the board.
     # Args:
@@ -316,7 +361,7 @@ class Board:
     def highlight_cells(self, hints):
         # Clear previous highlights
         self.highlighted_candidates.clear()
-        candidates = get_all_candidates(self)
+        self.highlight_version += 1
 
         for hint in hints:
             # --- Normalize cells ---
@@ -375,6 +420,7 @@ class Board:
                 - "value": int (candidate number)
         """
         self.highlighted_eliminations.clear()
+        self.highlight_version += 1
 
         for elim in eliminations:
             # --- Normalize cells ---
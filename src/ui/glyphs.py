@@ -0,0 +1,59 @@
+# ui/glyphs.py
+import ui.style as style
+
+# Glyph atlas
+# -----------
+# Every digit the board can show, rendered once per colour at the current
+# cell size: cell values (given / user / wrong) and pencil-mark notes (plain
+# and highlighted). Board.draw only blits from here, so drawing a board full
+# of notes costs no font lookups or text rendering at all.
+#
+# Note positions inside a cell are fixed per digit (1-3 on the top row,
+# ...), so their rects are precomputed relative to the cell's top-left.
+# -----------
+
+DIGIT_KINDS = {
+    "given": style.GIVEN_COLOR,
+    "user": style.USER_COLOR,
+    "wrong": style.WRONG_COLOR,
+}
+
+
+class GlyphAtlas:
+    def __init__(self, cell_size):
+        self.cell_size = cell_size
+        digit_size, note_size = style.board_font_sizes(cell_size)
+        digit_font = style.get_default_font(digit_size)
+        note_font = style.get_default_font(note_size)
+
+        # kind -> [None, glyph for 1, ..., glyph for 9]
+        self.digits = {
+            kind: [None] + [digit_font.render(str(d), True, color) for d in range(1, 10)]
+            for kind, color in DIGIT_KINDS.items()
+        }
+        self.notes = [None] + [note_font.render(str(d), True, style.NOTE_COLOR) for d in range(1, 10)]
+        self.highlighted_notes = [None] + [note_font.render(str(d), True, style.NOTE_HIGHLIGHT_COLOR)
+                                           for d in range(1, 10)]
+
+        # Rect of each digit centred in its cell, relative to the cell's top-left
+        center = (cell_size // 2, cell_size // 2)
+        self.digit_offsets = {
+            kind: [None] + [glyphs[d].get_rect(center=center) for d in range(1, 10)]
+            for kind, glyphs in self.digits.items()
+        }
+
+        # Rect of each note in its 3x3 sub-grid, relative to the cell's top-left
+        third = cell_size / 3
+        self.note_offsets = [None] + [
+            self.notes[d].get_rect(center=(((d - 1) % 3 + 0.5) * third, ((d - 1) // 3 + 0.5) * third))
+            for d in range(1, 10)
+        ]
+
+    def digit(self, kind, digit, x, y):
+        # (surface, rect) for a cell value drawn in the cell at (x, y)
+        return self.digits[kind][digit], self.digit_offsets[kind][digit].move(x, y)
+
+    def note(self, digit, x, y, highlighted=False):
+        # (surface, rect) for a pencil mark drawn in the cell at (x, y)
+        glyphs = self.highlighted_notes if highlighted else self.notes
+        return glyphs[digit], self.note_offsets[digit].move(x, y)
@@ -1,11 +1,14 @@
 # src/ui/hint_section.py
 import pygame
+from bisect import bisect_right
 import ui.style as style
 from hints.engine.hint_engine import HintEngine
 from hints.utils.board_utils import get_all_candidates, pretty_print_findings
+from core.board_state import BoardState
+from ui.render import Renderable, push_clip
 
 
-class HintSection:
+class HintSection(Renderable):
     def __init__(self, board, screen_width, padding=20):
         self.board = board
         self.screen_width = screen_width
@@ -16,7 +19,7 @@ class HintSection:
         self.title = "HINTS"
         self.title_font = style.get_title_font(20)
         self.button_font = style.get_default_font(16)
-        self.hint_font = pygame.font.SysFont("arial", 14)
+        self.hint_font = style.get_default_font(14)
         self.button_height = 36 # Heuristic Buttons
         self.button_margin = 8
         self.hint_button_spacing = 15
@@ -40,6 +43,14 @@ class HintSection:
         
         # Store rects of "Show" buttons for click detection
         self.show_button_rects = []
+        self._button_rects = {}
+
+        # Virtualized list: row layout per hint set, rendered rows cached as surfaces
+        self._layout_key = None
+        self._rows = []             # (top, height, name, hint or None), top relative to content start
+        self._row_tops = []         # tops only, for bisecting the viewport
+        self._row_surfaces = {}     # row index -> Surface
+        self._show_surface = None
 
         # Open/expand heuristics
         self.open_heuristics = {}  # key: heuristic name, value: bool (open/closed)
@@ -86,6 +97,18 @@ class HintSection:
             max_scroll = max(0, self.total_content_height - scroll_rect.height)
             self.scroll_y = max(0, min(self.scroll_y, max_scroll))
     
+    def render_key(self):
+        # Hints only change with the board values; the rest is panel state
+        state = getattr(self.board, "state", None)
+        return (getattr(self.board, "version", None),
+                getattr(state, "value_version", None),
+                self.scroll_y,
+                tuple(self.open_heuristics.items()))
+
+    def render_regions(self):
+        self._compute_panel_rect()
+        return [self.hint_rect]
+
     def _compute_panel_rect(self):
         # Compute the main hint panel rect
         sidebar_width = self.screen_width - self.board.screen_size
@@ -106,17 +129,42 @@ class HintSection:
             self.hint_rect.bottom - (divider_y + 12)
         )
     
-    def _update_content_height(self):
-        # Update total content height based on which sections are expanded
-        y = 0
+    #
+    # Row layout of the scrollable list: one row per heuristic button and one
+    # per hint of each expanded heuristic. Rebuilt only when the hint set
+    # (board version) or the expanded sections change; boards without a
+    # version are laid out on every call.
+    #
+    def _layout(self):
+        hints_key = HintEngine.version_key(self.board)
+        key = (hints_key, tuple(self.open_heuristics.items()))
+        if hints_key is not None and key == self._layout_key:
+            return self._rows
+
+        rows = []
+        y = 0                # where the next row is drawn
+        padding = 0          # extra scroll room below each open section
         for name in self.buttons:
-            y += self.button_height + self.button_margin
+            rows.append((y, self.button_height + 8, name, None))
+            y += self.button_height + 8  # small gap before hints
             if self.open_heuristics.get(name, False):
-                hints = HintEngine.get_all_hints(self.board).get(name, [])
-                for hint in hints:
-                    y += self.hint_font.get_height() + self.hint_button_spacing
-                y += self.button_margin + 8 # extra padding to prevent last hint from getting cut off
-        self.total_content_height = y + self.bottom_padding
+                hint_height = self.hint_font.get_height() + self.hint_button_spacing + 2
+                for hint in HintEngine.get_all_hints(self.board).get(name, []):
+                    rows.append((y, hint_height, name, hint))
+                    y += hint_height
+                padding += self.button_margin + 8 # extra padding to prevent last hint from getting cut off
+        content_height = y + padding
+
+        self._layout_key = key
+        self._rows = rows
+        self._row_tops = [row[0] for row in rows]
+        self._row_surfaces = {}
+        self.total_content_height = content_height + self.bottom_padding
+        return rows
+
+    def _update_content_height(self):
+        # Update total content height based on which sections are expanded
+        self._layout()
 
     #
     # Draws a single hint like "(1,4) -> 4" with stylized visuals.
@@ -185,6 +233,48 @@ class HintSection:
 
         return font.get_height() + self.hint_button_spacing  # return vertical space used
 
+    # Hint rows draw their cell boxes a few pixels above the row top
+    ROW_OVERHANG = 4
+
+    def _show_text(self):
+        if self._show_surface is None:
+            self._show_surface = self.button_font.render("Show", True, style.TEXT_COLOR)
+        return self._show_surface
+
+    #
+    # Render one list row onto a transparent surface of the scroll area's width.
+    # The row top sits ROW_OVERHANG pixels down from the surface top.
+    #
+    def _render_row(self, width, height, name, hint):
+        surface = pygame.Surface((width, height + self.ROW_OVERHANG), pygame.SRCALPHA)
+        top = self.ROW_OVERHANG
+        btn_rect = pygame.Rect(10, top, width - 20, self.button_height)
+
+        if hint is None:
+            # Draw heuristic button background & border
+            pygame.draw.rect(surface, (230, 230, 230), btn_rect)
+            pygame.draw.rect(surface, (0, 0, 0), btn_rect, 1)
+
+            # Draw button label
+            label_surf = self.button_font.render(name, True, (0, 0, 0))
+            surface.blit(label_surf, (btn_rect.x + 10, btn_rect.y + (self.button_height - label_surf.get_height()) // 2))
+            return surface
+
+        self._draw_styled_hint(surface, btn_rect.x + 10, top, hint['cell'], hint['value'])
+
+        # Draw "Show" button
+        show_text = self._show_text()
+        show_rect = pygame.Rect(
+            btn_rect.right - show_text.get_width() - 14,
+            top + 2,
+            show_text.get_width() + 10,
+            22
+        )
+        pygame.draw.rect(surface, (200, 200, 200), show_rect)
+        pygame.draw.rect(surface, (0, 0, 0), show_rect, 1)
+        surface.blit(show_text, (show_rect.x + 5, show_rect.y + 3))
+        return surface
+
     def draw(self, screen):
         # compute geometry
         self._compute_panel_rect()
@@ -206,62 +296,35 @@ class HintSection:
                          (self.hint_rect.left + self.padding, divider_y),
                          (self.hint_rect.right - self.padding, divider_y), 2)
 
-         # Scrollable area
+         # Scrollable area - only rows intersecting the viewport are drawn
         scroll_rect = self._scroll_rect()
-        screen.set_clip(scroll_rect)
-
-        cur_y = -self.scroll_y
-        left = scroll_rect.left + 10
-        width = scroll_rect.width - 20
+        previous_clip = push_clip(screen, scroll_rect)
 
+        rows = self._layout()
         self._button_rects = {}  # store rects for click detection
         self.show_button_rects.clear()
 
-        for name in self.buttons:
-            
-            btn_rect = pygame.Rect(left, scroll_rect.top + cur_y, width, self.button_height)
-            self._button_rects[name] = btn_rect
-
-            # Draw heuristic button background & border
-            pygame.draw.rect(screen, (230, 230, 230), btn_rect)
-            pygame.draw.rect(screen, (0, 0, 0), btn_rect, 1)
-
-            # Draw button label
-            label_surf = self.button_font.render(name, True, (0, 0, 0))
-            screen.blit(label_surf, (btn_rect.x + 10, btn_rect.y + (self.button_height - label_surf.get_height()) // 2))
-
-            cur_y += self.button_height + 8  # small gap before hints
-            
-            # Draw hints if expanded
-            if self.open_heuristics.get(name, False):
-                # get hints for this heuristic
-                all_hints = HintEngine.get_all_hints(self.board)
-                hints = all_hints.get(name, [])
-                
-                for hint in hints:
-                    cell = hint['cell']
-                    val = hint['value']
-                    used_height = self._draw_styled_hint(
-                        screen,
-                        btn_rect.x + 10,
-                        scroll_rect.top + cur_y,
-                        cell,
-                        val
-                    )
-                    cur_y += used_height + 2
-
-                    # Draw "Show" button
-                    show_text = self.button_font.render("Show", True, style.TEXT_COLOR)
-                    show_rect = pygame.Rect(
-                        btn_rect.right - show_text.get_width() - 14,
-                        scroll_rect.top + cur_y - used_height,
-                        show_text.get_width() + 10,
-                        22
-                    )
-                    pygame.draw.rect(screen, (200, 200, 200), show_rect)
-                    pygame.draw.rect(screen, (0, 0, 0), show_rect, 1)
-                    screen.blit(show_text, (show_rect.x + 5, show_rect.y + 3))
-                    self.show_button_rects.append((show_rect, hint))
+        first = max(0, bisect_right(self._row_tops, self.scroll_y) - 1)
+        for index in range(first, len(rows)):
+            top, height, name, hint = rows[index]
+            if top - self.ROW_OVERHANG >= self.scroll_y + scroll_rect.height:
+                break
+            origin = (scroll_rect.left, scroll_rect.top + top - self.scroll_y)
+
+            surface = self._row_surfaces.get(index)
+            if surface is None:
+                surface = self._render_row(scroll_rect.width, height, name, hint)
+                self._row_surfaces[index] = surface
+            screen.blit(surface, (origin[0], origin[1] - self.ROW_OVERHANG))
+
+            left = origin[0] + 10
+            width = scroll_rect.width - 20
+            if hint is None:
+                self._button_rects[name] = pygame.Rect(left, origin[1], width, self.button_height)
+            else:
+                show_width = self._show_text().get_width()
+                show_rect = pygame.Rect(left + width - show_width - 14, origin[1] + 2, show_width + 10, 22)
+                self.show_button_rects.append((show_rect, hint))
 
          # Draw scrollbar
         if self.total_content_height > scroll_rect.height:
@@ -269,8 +332,8 @@ class HintSection:
             scrollbar_y = scroll_rect.top + (self.scroll_y / self.total_content_height) * scroll_rect.height
             pygame.draw.rect(screen, (180, 180, 180),
                              (scroll_rect.right - 8, scrollbar_y, 6, scrollbar_height))
-        # Reset clipping
-        screen.set_clip(None)
+        # Restore clipping
+        screen.set_clip(previous_clip)
 
 # ---
 # Handles key events for hint heuristics.
@@ -284,6 +347,13 @@ def handle_hint_key(event, board):
     
     # Fill all candidates when 'f' is pressed - For testing purposes
     if event.key == pygame.K_f:
+        state = getattr(board, "state", None)
+        if isinstance(state, BoardState):
+            # Copy straight from the candidate cache - no set building
+            for i in range(board.size * board.size):
+                if state.values[i] == 0:  # empty cell
+                    state.set_notes(i, state.candidates(i))
+            return
         candidates = get_all_candidates(board)
         for r in range(board.size):
             for c in range(board.size):
@@ -295,6 +365,10 @@ def handle_hint_key(event, board):
     # a - Naked Singles
     # b - Naked Pairs
     # c - Hidden SIngles
+    # d / e / g - X-Wing / Swordfish / Jellyfish
+    # h / i - Naked Triples / Quads, j / k / l - Hidden Pairs / Triples / Quads
+    # m / n - Pointing / Claiming
+    # o / p / q - XY-Wing / Simple Coloring / X-Chain
     if event.key in HintEngine.HEURISTICS:
         hints = HintEngine.get_hint_by_key(board, event.key)
         pretty_print_findings(hints)
@@ -1,11 +1,12 @@
 # ui/numberpad.py
 import pygame
 import ui.style as style
+from ui.render import Renderable
 
-class NumberPad:
+class NumberPad(Renderable):
     def __init__(self, screen_size, board_size, board=None):
         self.buttons = []
-        self.font = pygame.font.SysFont("arial", 32)
+        self.font = style.get_default_font(32)
         self.button_size = 48
         self.board_size = board_size
         self.spacing = 15
@@ -15,7 +16,7 @@ class NumberPad:
         self.create_buttons()
 
         # Mode label + toggle button
-        self.mode_label_font = pygame.font.SysFont("arial", 22)
+        self.mode_label_font = style.get_default_font(22)
         self.mode_label_pos = (screen_size + 30, 60)
         self.switch_rect = pygame.Rect(screen_size + 160, 60, 60, 25)
         
@@ -28,6 +29,28 @@ class NumberPad:
             x = start_x + (i - 1) * (self.button_size + self.spacing)
             self.buttons.append((i, (x, y)))  # store center coords
 
+    def _hovered_button(self, mouse_pos):
+        for num, (x, y) in self.buttons:
+            if ((mouse_pos[0] - x) ** 2 + (mouse_pos[1] - y) ** 2) ** 0.5 <= self.button_size // 2:
+                return num
+        return None
+
+    def render_key(self):
+        counts = self.board.number_counts if self.board else {}
+        return (self._hovered_button(pygame.mouse.get_pos()),
+                bool(self.board and self.board.notes_mode),
+                tuple(counts.get(i, 0) for i in range(1, 10)))
+
+    def render_regions(self):
+        # Row of number buttons, plus the mode label and switch in the sidebar
+        radius = self.button_size // 2
+        (_, (first_x, y)), (_, (last_x, _)) = self.buttons[0], self.buttons[-1]
+        buttons_rect = pygame.Rect(first_x - radius, y - radius,
+                                   last_x - first_x + 2 * radius, 2 * radius).inflate(2, 2)
+        label_width = max(self.mode_label_font.size(f"{mode} Mode")[0] for mode in ("Notes", "Solve"))
+        label_rect = pygame.Rect(self.mode_label_pos, (label_width, self.mode_label_font.get_height()))
+        return [buttons_rect, label_rect.union(self.switch_rect)]
+
     def draw(self, screen):
         mouse_pos = pygame.mouse.get_pos()
 
@@ -0,0 +1,99 @@
+# ui/profiler_overlay.py
+import time
+import pygame
+import ui.style as style
+from ui.render import Renderable
+from core.profiler import profiler as default_profiler
+
+# Profiler overlay
+# ----------------
+# Translucent panel (toggled with F3 in main) listing the core.profiler
+# counters: rolling frame-time percentiles, per-component draw times,
+# per-heuristic run times and cache hit rates. The text is re-rendered at
+# most UPDATE_HZ times a second so the overlay barely shows up in its own
+# numbers.
+# ----------------
+
+UPDATE_HZ = 4
+MAX_LINES = 18
+LINE_HEIGHT = 16
+PANEL_WIDTH = 300
+PANEL_PADDING = 6
+PANEL_COLOR = (0, 0, 0, 190)
+OVERLAY_TEXT_COLOR = (235, 235, 235)
+
+
+def _ms(seconds):
+    return "-" if seconds is None else f"{seconds * 1000:.2f}"
+
+
+#
+# The overlay's text, one string per line (at most MAX_LINES).
+#
+def format_lines(profiler):
+    frame = profiler.percentiles("frame")
+    lines = ["frame ms  p50 {}  p95 {}  p99 {}".format(*(_ms(frame[p]) for p in (50, 95, 99)))]
+
+    for prefix, title in (("draw.", "draw ms (mean / p95)"), ("hint.", "hints ms (mean / p95)")):
+        names = sorted(name for name in profiler.timings if name.startswith(prefix))
+        if names:
+            lines.append(title)
+        for name in names:
+            timing = profiler.timings[name]
+            p95 = profiler.percentiles(name, (95,))[95]
+            lines.append(f"  {name[len(prefix):]:<16} {_ms(timing.total / timing.count)} / {_ms(p95)}")
+
+    caches = profiler.caches()
+    if caches:
+        lines.append("cache hit rate")
+    for cache in caches:
+        lines.append(f"  {cache:<16} {profiler.hit_rate(cache):.0%}")
+
+    return lines[:MAX_LINES]
+
+
+class ProfilerOverlay(Renderable):
+    #
+    # Args:
+    #    x, y: top-left corner of the panel
+    #    profiler: core.profiler.Profiler to read (the process-wide one by default)
+    #
+    def __init__(self, x=8, y=8, profiler=default_profiler):
+        self.profiler = profiler
+        self.visible = False
+        self.rect = pygame.Rect(x, y, PANEL_WIDTH, MAX_LINES * LINE_HEIGHT + 2 * PANEL_PADDING)
+        self._panel = None
+        self._panel_key = None
+
+    def toggle(self):
+        # Show / hide the panel; showing it starts collecting counters
+        self.visible = not self.visible
+        if self.visible:
+            self.profiler.enabled = True
+
+    def render_key(self):
+        if not self.visible:
+            return False
+        return int(time.monotonic() * UPDATE_HZ)
+
+    def render_regions(self):
+        return [self.rect]
+
+    def _build_panel(self):
+        font = style.get_default_font(14)
+        panel = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+        panel.fill(PANEL_COLOR)
+        for n, line in enumerate(format_lines(self.profiler)):
+            text = font.render(line, True, OVERLAY_TEXT_COLOR)
+            panel.blit(text, (PANEL_PADDING, PANEL_PADDING + n * LINE_HEIGHT))
+        return panel
+
+    def draw(self, screen):
+        if not self.visible:
+            return
+        # The renderer may draw several dirty rects per frame - build once per key
+        key = self.render_key()
+        if self._panel is None or self._panel_key != key:
+            self._panel = self._build_panel()
+            self._panel_key = key
+        screen.blit(self._panel, self.rect)
@@ -0,0 +1,74 @@
+# ui/progress.py
+import pygame
+import ui.style as style
+from ui.render import Renderable
+
+class GenerationProgress(Renderable):
+    # Screen shown while a puzzle is generated in the background
+    def __init__(self, screen_width, screen_height, bar_width=400, bar_height=24):
+        self.screen_width = screen_width
+        self.screen_height = screen_height
+
+        # Title Text
+        self.title_font = style.get_title_font(48)
+        self.label_font = style.get_default_font(28)
+        self.button_font = style.get_title_font(30)
+
+        # Progress bar & cancel button positions
+        self.bar_rect = pygame.Rect(0, 0, bar_width, bar_height)
+        self.bar_rect.center = (screen_width // 2, screen_height // 2)
+        self.cancel_rect = pygame.Rect(0, 0, 200, 50)
+        self.cancel_rect.center = (screen_width // 2, self.bar_rect.bottom + 70)
+        self.cancel_text = self.button_font.render("CANCEL", True, style.TEXT_COLOR)
+
+        self.title_text = None
+        self.difficulty = None
+        self.progress = 0.0  # latest job progress, drawn when draw() gets none
+
+    def set_difficulty(self, difficulty):
+        # Pre-render the title once per job instead of every frame
+        self.difficulty = difficulty
+        self.title_text = self.title_font.render(
+            f"GENERATING {difficulty.upper()}", True, style.TEXT_COLOR)
+        self.progress = 0.0
+        self.mark_dirty()
+
+    def render_key(self):
+        # Whole percent steps - finer changes are not visible
+        return (self.difficulty, int(max(0.0, min(1.0, self.progress)) * 100))
+
+    def render_regions(self):
+        percent_width, percent_height = self.label_font.size("100%")
+        percent_rect = pygame.Rect(0, 0, percent_width + 4, percent_height)
+        percent_rect.center = (self.screen_width // 2, self.bar_rect.bottom + 20)
+        return [self.bar_rect.inflate(4, 4), percent_rect]
+
+    def draw(self, screen, progress=None):
+        if progress is None:
+            progress = self.progress
+        if self.title_text:
+            title_rect = self.title_text.get_rect(center=(self.screen_width // 2, self.bar_rect.top - 80))
+            screen.blit(self.title_text, title_rect)
+
+        # Progress bar - outline plus filled fraction
+        fill = self.bar_rect.copy()
+        fill.width = int(self.bar_rect.width * max(0.0, min(1.0, progress)))
+        pygame.draw.rect(screen, style.BACKGROUND_GRID, self.bar_rect, border_radius=6)
+        if fill.width > 0:
+            pygame.draw.rect(screen, style.BUTTON_BLUE, fill, border_radius=6)
+        pygame.draw.rect(screen, style.GRID_BLACK_LINE, self.bar_rect, 2, border_radius=6)
+
+        percent = self.label_font.render(f"{int(progress * 100)}%", True, style.TEXT_COLOR)
+        screen.blit(percent, percent.get_rect(center=(self.screen_width // 2, self.bar_rect.bottom + 20)))
+
+        # Cancel button
+        pygame.draw.rect(screen, style.BUTTON_BLUE, self.cancel_rect, border_radius=50)
+        screen.blit(self.cancel_text, self.cancel_text.get_rect(center=self.cancel_rect.center))
+
+    def handle_event(self, event):
+        # Return "cancel" if the cancel button was clicked or Escape pressed
+        if event.type == pygame.MOUSEBUTTONUP and self.cancel_rect.collidepoint(event.pos):
+            return "cancel"
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+            return "cancel"
+        return None
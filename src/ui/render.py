@@ -0,0 +1,136 @@
+# ui/render.py
+import pygame
+import ui.style as style
+from core.profiler import profiler
+
+# Dirty-rectangle rendering
+# -------------------------
+# Components that mix in `Renderable` describe what they look like with a
+# cheap `render_key()` (anything hashable - version counters, selected cell,
+# hovered button, ...) and where they draw with `render_regions()`.
+# `get_dirty_rects()` compares the key with the one from the last frame and
+# returns the regions only when something changed.
+#
+# The `Renderer` then repaints just those rectangles: each one is cleared to
+# the background and every layer overlapping it is redrawn with the clip set
+# to it, and the caller pushes the returned rects with
+# pygame.display.update(rects). An idle frame draws nothing at all.
+# -------------------------
+
+_STALE = object()  # render key that never matches, forces a redraw
+
+
+class Renderable:
+    _rendered_key = _STALE
+
+    def render_key(self):
+        # Hashable snapshot of everything that affects how this draws
+        return None
+
+    def render_regions(self):
+        # List of screen Rects this component draws into (none by default)
+        return []
+
+    def get_dirty_rects(self):
+        # Regions to repaint since the last call (empty list if unchanged)
+        key = self.render_key()
+        if key == self._rendered_key:
+            return []
+        self._rendered_key = key
+        return list(self.render_regions())
+
+    def mark_dirty(self):
+        # Force a repaint on the next frame
+        self._rendered_key = _STALE
+
+
+#
+# Clip drawing to `rect` within whatever clip is already active.
+# Returns the previous clip, to be restored with screen.set_clip(previous).
+#
+def push_clip(screen, rect):
+    previous = screen.get_clip()
+    if isinstance(previous, pygame.Rect):
+        screen.set_clip(rect.clip(previous))
+    else:
+        screen.set_clip(rect)
+    return previous
+
+
+class Renderer:
+    #
+    # Repaints only the dirty parts of the screen.
+    #
+    # Args:
+    #    screen: display Surface
+    #    background: fill colour for cleared areas
+    #
+    def __init__(self, screen, background=style.BACKGROUND_COLOR):
+        self.screen = screen
+        self.background = background
+        self._scene = _STALE
+
+    def invalidate(self):
+        # Redraw the whole screen on the next render (window exposed, resized, ...)
+        self._scene = _STALE
+
+    #
+    # Draw one frame.
+    #
+    # Args:
+    #    scene: hashable id of what is on screen; any change triggers a full redraw
+    #    layers: objects with draw(screen), back to front. Layers without
+    #            get_dirty_rects() are static and only drawn on full redraws
+    #            or where another layer is repainted.
+    #
+    # Returns:
+    #    list[pygame.Rect]: areas to pass to pygame.display.update (may be empty)
+    #
+    def render(self, scene, layers):
+        screen = self.screen
+
+        if scene != self._scene:
+            self._scene = scene
+            for layer in layers:
+                if isinstance(layer, Renderable):
+                    layer.get_dirty_rects()  # sync keys with what is drawn now
+            screen.set_clip(None)
+            screen.fill(self.background)
+            for layer in layers:
+                _draw(layer, screen)
+            return [screen.get_rect()]
+
+        dirty = []
+        for layer in layers:
+            if isinstance(layer, Renderable):
+                dirty.extend(layer.get_dirty_rects())
+        if not dirty:
+            return []
+
+        dirty = _merge_rects(dirty)
+        for rect in dirty:
+            screen.set_clip(rect)
+            screen.fill(self.background, rect)
+            for layer in layers:
+                if not isinstance(layer, Renderable) or rect.collidelist(layer.render_regions()) != -1:
+                    _draw(layer, screen)
+        screen.set_clip(None)
+        return dirty
+
+
+def _draw(layer, screen):
+    with profiler.timed("draw." + type(layer).__name__):
+        layer.draw(screen)
+
+
+def _merge_rects(rects):
+    # Union overlapping rects so no area is painted twice
+    merged = []
+    for rect in rects:
+        rect = pygame.Rect(rect)
+        i = rect.collidelist(merged)
+        while i != -1:
+            rect.union_ip(merged.pop(i))
+            i = rect.collidelist(merged)
+        merged.append(rect)
+    return merged
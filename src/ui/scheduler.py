@@ -0,0 +1,71 @@
+# ui/scheduler.py
+import time
+import pygame
+
+# Frame scheduling
+# ----------------
+# Decides how long the main loop sleeps between frames.
+#
+#    "fixed":    always tick at `fps` and poll for events (the old behaviour)
+#    "adaptive": tick at `fps` while the player is interacting (and for
+#                `active_period` seconds after the last event) or while the
+#                caller says something is animating; otherwise block in
+#                pygame.event.wait until an event arrives or the next
+#                scheduled wake-up (e.g. the timer's next second) is due.
+# ----------------
+
+POLICIES = ("adaptive", "fixed")
+
+
+class FrameScheduler:
+    #
+    # Args:
+    #    fps: frame rate while active (and always, for the fixed policy)
+    #    policy: "adaptive" or "fixed"
+    #    idle_timeout: longest sleep while idle, in seconds
+    #    active_period: seconds to keep running at full rate after an event
+    #    clock: pygame.time.Clock-like object (ticked every frame)
+    #
+    def __init__(self, fps=60, policy="adaptive", idle_timeout=1.0, active_period=0.5, clock=None):
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown frame policy: {policy!r} (expected one of {POLICIES})")
+        self.fps = fps
+        self.policy = policy
+        self.idle_timeout = idle_timeout
+        self.active_period = active_period
+        self.clock = clock if clock is not None else pygame.time.Clock()
+        self._active_until = 0.0
+        self.idle_waits = 0  # frames that slept in event.wait instead of ticking
+
+    def note_activity(self):
+        # Keep running at full rate for a little while
+        self._active_until = time.monotonic() + self.active_period
+
+    def is_active(self):
+        return time.monotonic() < self._active_until
+
+    #
+    # Wait for the next frame and return its events.
+    #
+    # Args:
+    #    busy: something is animating (progress bar, ...) - run at full rate
+    #    wake_in: seconds until the screen needs updating on its own
+    #             (e.g. the timer's next second); None if nothing is scheduled
+    #
+    # Returns:
+    #    list of pygame events (may be empty when woken by the timeout)
+    #
+    def get_events(self, busy=False, wake_in=None):
+        if self.policy == "fixed" or busy or self.is_active():
+            self.clock.tick(self.fps)
+            events = pygame.event.get()
+        else:
+            timeout = self.idle_timeout if wake_in is None else min(self.idle_timeout, wake_in)
+            event = pygame.event.wait(max(1, int(timeout * 1000)))
+            events = [] if event.type == pygame.NOEVENT else [event] + pygame.event.get()
+            self.clock.tick()  # keep the clock's frame timing current without sleeping
+            self.idle_waits += 1
+
+        if events:
+            self.note_activity()
+        return events
@@ -2,8 +2,10 @@
 import pygame
 import ui.style as style
 from ui.hint_section import HintSection
+from ui.render import Renderable
+from core.profiler import profiler
 
-class Sidebar:
+class Sidebar(Renderable):
     def __init__(self, board, numberpad, timer, screen_width, x_offset=20, y_offset=20):
         self.board = board
         self.numberpad = numberpad
@@ -28,6 +30,23 @@ class Sidebar:
 
         self.hint_section = HintSection(board, screen_width)
 
+    def _children(self):
+        return [child for child in (self.timer, self.hint_section, self.numberpad)
+                if isinstance(child, Renderable)]
+
+    def get_dirty_rects(self):
+        # The title never changes - only the widgets below it get repainted
+        dirty = super().get_dirty_rects()
+        for child in self._children():
+            dirty.extend(child.get_dirty_rects())
+        return dirty
+
+    def render_regions(self):
+        regions = [self.title_surface.get_rect(topleft=(self.board.screen_size + 20, 1))]
+        for child in self._children():
+            regions.extend(child.render_regions())
+        return regions
+
     def draw(self, screen):
         # Draw title
         title_surface = style.get_title_font(28).render("SUDOKU TRAINER", True, style.TEXT_COLOR)
@@ -36,12 +55,15 @@ class Sidebar:
         # Draw timer below title
         if self.timer:
             timer_y = self.title_rect.bottom + self.spacing
-            self.timer.draw(screen, self.screen_width, screen.get_height(), style.FONT_TIMER)
+            with profiler.timed("draw.Timer"):
+                self.timer.draw(screen, self.screen_width, screen.get_height(), style.FONT_TIMER)
         
         # Draw Hint Section
         if self.hint_section and not self.timer.paused:
-            self.hint_section.draw(screen)
+            with profiler.timed("draw.HintSection"):
+                self.hint_section.draw(screen)
 
         # Draw numberpad / toggle button if applicable
         if self.numberpad and not self.timer.paused:
-            self.numberpad.draw(screen)
\ No newline at end of file
+            with profiler.timed("draw.NumberPad"):
+                self.numberpad.draw(screen)
\ No newline at end of file
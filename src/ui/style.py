@@ -1,6 +1,7 @@
 # ui/style.py
 import pygame
 import os
+from collections import OrderedDict
 
 pygame.font.init()
 
@@ -27,11 +28,16 @@ GRID_BLACK_LINE = (0, 0, 0)
 GRID_GREY_LINE = (189, 189, 189)
 GRID_OFFSET_X = 10
 GRID_OFFSET_Y  = 10
+BOARD_PIXELS = 550  # side of the 9x9 grid on the game screen
 
 GIVEN_COLOR = (0, 0, 0)      # black for givens
 USER_COLOR = (50, 50, 200) 
 WRONG_COLOR = (255, 0, 0)
 
+# Pencil-mark notes
+NOTE_COLOR = (120, 120, 120)
+NOTE_HIGHLIGHT_COLOR = (0, 0, 0)   # on a green / red highlight box
+
 # NumberPad colors
 NUMBERPAD_BUTTON_COLOR = (230, 230, 230)
 NUMBERPAD_BORDER_COLOR = (0, 0, 0)
@@ -78,12 +84,93 @@ def load_font(filename, size):
     path = os.path.join(FONT_DIR, filename)
     return pygame.font.Font(path, size)
 
+# ---------- FONT REGISTRY ----------
+# Fonts are loaded once per (face, size) and reused, so drawing code can ask
+# for a font every frame without touching the disk. A face ending in .ttf is
+# loaded from FONT_DIR, anything else is a system font name.
+# Font objects die with pygame.quit(), so the registry empties itself then.
+TITLE_FACE = "MadimiOne-Regular.ttf"
+MENU_FACE = "Monofett-Regular.ttf"
+DEFAULT_FACE = "arial"
+FONT_CACHE_SIZE = 32
+
+# Digit and pencil-note font sizes for a board cell (Board, GlyphAtlas)
+def board_font_sizes(cell_size):
+    return cell_size // 2, cell_size // 4
+
+# (face, size) pairs the UI uses - loaded up front by warm_up_fonts()
+STARTUP_FONTS = [
+    (TITLE_FACE, 80), (TITLE_FACE, 60), (TITLE_FACE, 48), (TITLE_FACE, 30),
+    (TITLE_FACE, 28), (TITLE_FACE, 20),
+    (DEFAULT_FACE, 36), (DEFAULT_FACE, 32), (DEFAULT_FACE, 28), (DEFAULT_FACE, 22),
+    (DEFAULT_FACE, 16), (DEFAULT_FACE, 14),
+] + [(DEFAULT_FACE, size) for size in board_font_sizes(BOARD_PIXELS // 9)]
+
+class FontRegistry:
+    def __init__(self, capacity=FONT_CACHE_SIZE):
+        self.capacity = capacity
+        self._fonts = OrderedDict()  # (face, size) -> Font, least recently used first
+        self.hits = 0
+        self.misses = 0
+        self._quit_hook = False
+
+    def _on_quit(self):
+        self._fonts.clear()
+        self._quit_hook = False
+
+    def get(self, face, size):
+        key = (face, size)
+        font = self._fonts.get(key)
+        if font is not None:
+            self._fonts.move_to_end(key)
+            self.hits += 1
+            return font
+
+        self.misses += 1
+        if not self._quit_hook:
+            # pygame drops quit hooks once they have run, so re-register each time
+            pygame.register_quit(self._on_quit)
+            self._quit_hook = True
+        if face.endswith(".ttf"):
+            font = load_font(face, size)
+        else:
+            font = pygame.font.SysFont(face, size)
+        self._fonts[key] = font
+        if len(self._fonts) > self.capacity:
+            self._fonts.popitem(last=False)  # evict least recently used
+        return font
+
+    def warm_up(self, specs):
+        # Load (face, size) pairs ahead of time
+        for face, size in specs:
+            self.get(face, size)
+
+    def clear(self):
+        self._fonts.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses,
+                "size": len(self._fonts), "capacity": self.capacity}
+
+font_registry = FontRegistry()
+
+def warm_up_fonts(specs=None):
+    font_registry.warm_up(STARTUP_FONTS if specs is None else specs)
+
+def font_cache_stats():
+    return font_registry.stats()
+
+def clear_font_cache():
+    font_registry.clear()
+
 # Font getters
 def get_title_font(size=64):
-    return load_font("MadimiOne-Regular.ttf", size)
+    return font_registry.get(TITLE_FACE, size)
 
 def get_menu_font(size=48):
-    return load_font("Monofett-Regular.ttf", size)
+    return font_registry.get(MENU_FACE, size)
 
 def get_default_font(size=32):
-    return pygame.font.SysFont("arial", size)
\ No newline at end of file
+    return font_registry.get(DEFAULT_FACE, size)
\ No newline at end of file
@@ -2,8 +2,9 @@
 import time
 import pygame
 import ui.style as style
+from ui.render import Renderable
 
-class Timer:
+class Timer(Renderable):
     def __init__(self, font, x, y):
         self.font = font
         self.x = x
@@ -20,6 +21,12 @@ class Timer:
         self.pause_rect = pygame.Rect(self.x + 60, self.y + 8, self.icon_size, self.icon_size)
         self.resume_rect = None # Overlay button
 
+        # Render caches - text only changes once a second, the overlay never
+        self._label = (None, None)         # (time string, Surface) for the running timer
+        self._paused_label = (None, None)  # (time string, Surface) shown on the overlay
+        self._overlay = (None, None)       # ((width, height), Surface) pause overlay
+        self._region = None                # label + icon Rect last reported dirty
+
     def start(self):
         #Start or restart the timer
         self.start_time = time.time()
@@ -55,57 +62,85 @@ class Timer:
             elapsed = time.time() - self.start_time - self.total_paused
         return elapsed
 
+    def get_time_str(self):
+        # Elapsed time as shown, "MM:SS" (minutes keep growing past 99)
+        minutes, seconds = divmod(int(self.get_elapsed()), 60)
+        return f"{minutes:02}:{seconds:02}"
+
+    def render_key(self):
+        # Only redraw when the displayed second or the pause state changes
+        return (self.paused, int(self.get_elapsed()))
+
+    def render_regions(self):
+        # Time label plus the pause icon next to it, joined with the previous
+        # region so a label that got narrower (restart) is cleared as well
+        width, height = self.font.size(self.get_time_str())
+        region = pygame.Rect(self.x, self.y, max(width, self.pause_rect.right - self.x),
+                             max(height, self.pause_rect.bottom - self.y))
+        previous, self._region = self._region, region
+        return [region.union(previous) if previous else region]
+
+    def _build_overlay(self, SCREEN_WIDTH, SCREEN_HEIGHT):
+        # Full-screen pause overlay: background, 'PAUSED' and the resume button.
+        # Built once per screen size; only the time is drawn on top each frame.
+        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        overlay.fill(style.BACKGROUND_COLOR)
+
+        # 'PAUSED' Text
+        paused_font = style.get_title_font(60)
+        paused_text = paused_font.render("PAUSED", True, style.TEXT_COLOR)
+        overlay.blit(paused_text, (SCREEN_WIDTH//2 - paused_text.get_width()//2,
+                                   SCREEN_HEIGHT//2 - paused_text.get_height()//2 - 50))
+
+        #---Resume button---
+        resume_font = style.get_title_font(30)
+        resume_text = resume_font.render("RESUME", True, style.TEXT_COLOR)
+
+        # Button background & position
+        self.resume_rect = pygame.Rect(SCREEN_WIDTH//2 - 100,
+                                    SCREEN_HEIGHT//2 + 25, 200, 50) 
+        pygame.draw.rect(overlay, style.BUTTON_BLUE, self.resume_rect, border_radius=50)
+        
+        # Button + Text
+        overlay.blit(resume_text, (SCREEN_WIDTH//2 - resume_text.get_width()//2,
+                                   SCREEN_HEIGHT//2 - resume_text.get_height()//2 + 50))
+        return overlay
+
     def draw(self, screen, SCREEN_WIDTH, SCREEN_HEIGHT, FONT):
-        # Draw timer
-        elapsed = int(self.get_elapsed())
-        minutes, seconds = divmod(elapsed, 60)
-        time_str = f"{minutes:02}:{seconds:02}"
-        label = self.font.render(time_str, True, style.TEXT_COLOR)
-        screen.blit(label, (self.x, self.y))
+        time_str = self.get_time_str()
 
         # Draw Overlay
         if self.paused:
-            overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-            overlay.fill(style.BACKGROUND_COLOR)
-            screen.blit(overlay, (0,0))
-
-            # 'PAUSED' Text
-            paused_font = style.get_title_font(60)
-            paused_text = paused_font.render("PAUSED", True, style.TEXT_COLOR)
-            screen.blit(paused_text, (SCREEN_WIDTH//2 - paused_text.get_width()//2,
-                                    SCREEN_HEIGHT//2 - paused_text.get_height()//2 - 50))
+            size = (SCREEN_WIDTH, SCREEN_HEIGHT)
+            if self._overlay[0] != size or self.resume_rect is None:
+                self._overlay = (size, self._build_overlay(SCREEN_WIDTH, SCREEN_HEIGHT))
+            screen.blit(self._overlay[1], (0,0))
 
             # Paused-Timer Text
-            timer_font = style.get_title_font(30)
-            timer_text = timer_font.render(time_str, True, style.TEXT_COLOR)
+            if self._paused_label[0] != time_str:
+                timer_font = style.get_title_font(30)
+                self._paused_label = (time_str, timer_font.render(time_str, True, style.TEXT_COLOR))
+            timer_text = self._paused_label[1]
             screen.blit(timer_text, (SCREEN_WIDTH//2 - timer_text.get_width()//2,
                                     SCREEN_HEIGHT//2 - timer_text.get_height()//2 ))
-
-            #---Resume button---
-            resume_font = style.get_title_font(30)
-            resume_text = resume_font.render("RESUME", True, style.TEXT_COLOR)
-
-            # Button background & position
-            self.resume_rect = pygame.Rect(SCREEN_WIDTH//2 - 100,
-                                        SCREEN_HEIGHT//2 + 25, 200, 50) 
-            pygame.draw.rect(screen, style.BUTTON_BLUE, self.resume_rect, border_radius=50)
-            
-            # Button + Text
-            screen.blit(resume_text, (SCREEN_WIDTH//2 - resume_text.get_width()//2,
-                                    SCREEN_HEIGHT//2 - resume_text.get_height()//2 + 50))
-
-        else:
-            # Draw pause bars
-            bar_width = self.icon_size // 4
-            gap = bar_width
-            pygame.draw.rect(
-                screen, style.TEXT_COLOR,
-                (self.pause_rect.left, self.pause_rect.top, bar_width, self.icon_size)
-            )
-            pygame.draw.rect(
-                screen, style.TEXT_COLOR,
-                (self.pause_rect.left + bar_width + gap, self.pause_rect.top, bar_width, self.icon_size)
-            )
+            return
+
+        # Draw timer (re-rendered only when the displayed second changes)
+        if self._label[0] != time_str:
+            self._label = (time_str, self.font.render(time_str, True, style.TEXT_COLOR))
+        screen.blit(self._label[1], (self.x, self.y))
+
+        # Draw pause bars
+        bar_width = self.icon_size // 4
+        gap = bar_width
+        pygame.draw.rect(
+            screen, style.TEXT_COLOR,
+            (self.pause_rect.left, self.pause_rect.top, bar_width, self.icon_size)
+        )
+        pygame.draw.rect(
+            screen, style.TEXT_COLOR,
+            (self.pause_rect.left + bar_width + gap, self.pause_rect.top, bar_width, self.icon_size)
+        )
 
 
     def handle_event(self, event):
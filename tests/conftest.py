@@ -0,0 +1,22 @@
+# tests/conftest.py
+import pytest
+from board_corpus import mid_game_boards
+from ui.board import Board
+
+
+# The mid-game boards, shared by the heuristic tests
+@pytest.fixture(scope="module")
+def boards():
+    return [Board(size=9, puzzle=grid) for grid in mid_game_boards()]
+
+
+class DummyBoard:
+    def __init__(self, user_board):
+        self.user_board = user_board
+        self.size = 9
+
+
+# An empty 9x9 board stand-in, for tests that patch in their own candidates
+@pytest.fixture
+def dummy_board():
+    return DummyBoard([[0] * 9 for _ in range(9)])
@@ -0,0 +1,56 @@
+# tests/test_benchmarks.py
+import json
+import os
+import sys
+
+# benchmarks/ lives next to src/ at the repository root
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import board_corpus
+from benchmarks import run
+from benchmarks.corpus import hard_puzzles, mid_game_boards
+from core.solver import count_solutions
+
+
+def test_corpus_is_valid():
+    assert all(count_solutions(grid) == 1 for grid in hard_puzzles())
+    # Mid-game boards are deterministic and still solvable
+    boards = mid_game_boards()
+    assert boards == mid_game_boards()
+    assert all(count_solutions(grid) == 1 for grid in boards)
+    # The unit tests' copy of the corpus (tests/board_corpus.py) matches
+    assert boards == board_corpus.mid_game_boards()
+
+
+def test_summarize():
+    summary = run.summarize([0.001 * n for n in range(1, 101)])
+    assert summary["calls"] == 100
+    assert round(summary["p50_ms"], 6) == 50 and round(summary["p99_ms"], 6) == 99
+    assert summary["ops_per_s"] > 0
+
+
+def test_find_regressions_uses_threshold():
+    baseline = {"a": {"p50_ms": 1.0}, "b": {"p50_ms": 1.0}}
+    results = {"a": {"p50_ms": 1.2}, "b": {"p50_ms": 1.5}, "new": {"p50_ms": 9.0}}
+    regressions = run.find_regressions(results, baseline, threshold=0.25)
+    assert [name for name, *_ in regressions] == ["b"]
+
+
+def test_quick_run_and_baseline_round_trip(tmp_path):
+    path = tmp_path / "baseline.json"
+    results = run.run_suite(["hint.Naked Singles", "find_eliminations.singles"], repeat=1)
+    assert set(results) == {"hint.Naked Singles", "find_eliminations.singles"}
+
+    run.save_baseline(results, path)
+    assert run.load_baseline(path) == json.loads(path.read_text())["benchmarks"] == results
+    assert run.find_regressions(results, run.load_baseline(path)) == []
+
+
+def test_stored_baseline_covers_suite():
+    assert set(run.load_baseline()) == set(run.benchmark_suite())
+
+
+def test_heuristic_contexts_are_built_before_timing():
+    # Lazy tables built inside the first repeat would make medians depend on --repeat
+    for _, context in run._mid_game_contexts():
+        assert context._candidate_cells is not None and context._links is not None
@@ -1,5 +1,7 @@
 # tests/test_board_conflicts.py
 import pytest
+import pygame
+from unittest.mock import patch
 from ui.board import Board
 
 @pytest.fixture
@@ -154,4 +156,48 @@ def test_toggle_multiple_times_retains_data(board):
     # Candidate should still be there
     assert board.notes[0][0] == {1}
     # Final value in Solve mode should remain
-    assert board.user_board[0][0] == 3
\ No newline at end of file
+    assert board.user_board[0][0] == 3
+
+# ----- Glyph atlas -------
+def test_draw_uses_cached_glyphs(board):
+    screen = pygame.Surface((700, 700))
+    for d in range(1, 10):
+        board.notes[0][1].add(d)
+    board.draw(screen)
+    atlas = board._get_glyphs()
+
+    # No font loading once the atlas exists
+    with patch("pygame.font.SysFont") as sysfont:
+        board.draw(screen)
+    sysfont.assert_not_called()
+    assert board._get_glyphs() is atlas
+
+    # Rebuilt only when the cell size changes
+    board.cell_size = 40
+    assert board._get_glyphs() is not atlas
+    assert board._get_glyphs().cell_size == 40
+
+# ----- Cached layers -------
+def test_draw_rebuilds_only_changed_layers(board):
+    screen = pygame.Surface((700, 700))
+    board.draw(screen)
+    surfaces = {name: surface for name, (_, surface) in board._layers.items()}
+    keys = {name: key for name, (key, _) in board._layers.items()}
+
+    # Nothing changed - every layer reused
+    board.draw(screen)
+    assert {name: key for name, (key, _) in board._layers.items()} == keys
+
+    # Moving the selection only touches the highlight layer
+    board.selected_cell = (4, 4)
+    board.draw(screen)
+    changed = {name for name, (key, _) in board._layers.items() if key != keys[name]}
+    assert changed == {"highlights"}
+    assert board._layers["highlights"][1] is surfaces["highlights"]  # surface reused
+
+    # Entering a number changes highlights (matches) and content
+    keys = {name: key for name, (key, _) in board._layers.items()}
+    board.handle_number_entry(7)
+    board.draw(screen)
+    changed = {name for name, (key, _) in board._layers.items() if key != keys[name]}
+    assert changed == {"highlights", "content"}
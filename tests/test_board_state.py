@@ -0,0 +1,148 @@
+# tests/test_board_state.py
+import pytest
+from core.board_state import BoardState, ValueGrid, GivenGrid, NotesGrid
+
+# --- Fixtures ---
+@pytest.fixture
+def puzzle():
+    return [
+        [5, 3, 0, 0, 7, 0, 0, 0, 0],
+        [6, 0, 0, 1, 9, 5, 0, 0, 0],
+        [0, 9, 8, 0, 0, 0, 0, 6, 0],
+        [8, 0, 0, 0, 6, 0, 0, 0, 3],
+        [4, 0, 0, 8, 0, 3, 0, 0, 1],
+        [7, 0, 0, 0, 2, 0, 0, 0, 6],
+        [0, 6, 0, 0, 0, 0, 2, 8, 0],
+        [0, 0, 0, 4, 1, 9, 0, 0, 5],
+        [0, 0, 0, 0, 8, 0, 0, 7, 9]
+    ]
+
+def naive_candidates(grid, r, c):
+    if grid[r][c]:
+        return set()
+    used = set(grid[r]) | {grid[i][c] for i in range(9)}
+    br, bc = 3 * (r // 3), 3 * (c // 3)
+    used |= {grid[i][j] for i in range(br, br + 3) for j in range(bc, bc + 3)}
+    return set(range(1, 10)) - used
+
+def mask_set(mask):
+    return {d for d in range(1, 10) if mask >> (d - 1) & 1}
+
+# --- Tests ---
+def test_from_grid_matches_naive_candidates(puzzle):
+    state = BoardState.from_grid(puzzle)
+    for r in range(9):
+        for c in range(9):
+            assert mask_set(state.candidates(r * 9 + c)) == naive_candidates(puzzle, r, c)
+
+def test_givens_bitset(puzzle):
+    state = BoardState.from_grid(puzzle)
+    assert state.is_given(0)          # (0,0) = 5
+    assert not state.is_given(2)      # (0,2) empty
+    assert bin(state.givens).count("1") == 30
+
+def test_digit_counts_update_incrementally(puzzle):
+    state = BoardState.from_grid(puzzle)
+    assert state.digit_counts[5] == 3
+    state.set_value(2, 5)   # duplicate 5 in row 0
+    assert state.digit_counts[5] == 4
+    state.set_value(2, 0)
+    assert state.digit_counts[5] == 3
+
+def test_masks_survive_duplicate_removal():
+    state = BoardState()
+    state.set_value(0, 5)
+    state.set_value(8, 5)   # conflicting 5 in the same row
+    state.set_value(8, 0)
+    # Row 0 still holds a 5 at (0,0)
+    assert state.row_masks[0] == 1 << 4
+    state.set_value(0, 0)
+    assert state.row_masks[0] == 0
+
+def test_version_bumps_on_change():
+    state = BoardState()
+    before = state.version
+    state.set_value(10, 3)
+    state.toggle_note(11, 4)
+    assert state.version == before + 2
+    state.set_value(10, 3)  # no-op
+    assert state.version == before + 2
+
+def test_value_grid_writes_through(puzzle):
+    state = BoardState.from_grid(puzzle)
+    grid = ValueGrid(state)
+    grid[0][2] = 4
+    assert state.values[2] == 4
+    assert grid[0] == [5, 3, 4, 0, 7, 0, 0, 0, 0]
+    assert 4 in grid[0]
+    assert len(grid) == 9 and len(grid[0]) == 9
+
+def test_given_grid_only_shows_givens(puzzle):
+    state = BoardState.from_grid(puzzle)
+    ValueGrid(state)[0][2] = 4   # player entry, not a given
+    assert GivenGrid(state)[0][2] == 0
+    assert GivenGrid(state) == puzzle
+
+def test_notes_behave_like_sets():
+    state = BoardState()
+    notes = NotesGrid(state)
+    notes[0][0].add(1)
+    notes[0][0].add(3)
+    assert notes[0][0] == {1, 3}
+    notes[0][0].remove(1)
+    assert notes[0][0] == {3}
+    notes[0][1] = {2, 9}
+    assert set(notes[0][1]) == {2, 9}
+    assert state.notes[1] == (1 << 1) | (1 << 8)
+    assert notes[0][2] == set()
+
+# --- Candidate cache ---
+def test_candidate_cache_tracks_random_edits(puzzle):
+    import random
+    rng = random.Random(5)
+    state = BoardState.from_grid(puzzle)
+    grid = [row[:] for row in puzzle]
+    for _ in range(200):
+        i = rng.randrange(81)
+        digit = rng.randrange(10)
+        state.set_value(i, digit)
+        grid[i // 9][i % 9] = digit
+    for r in range(9):
+        for c in range(9):
+            assert mask_set(state.candidates(r * 9 + c)) == naive_candidates(grid, r, c)
+
+def test_candidate_sets_shared_until_value_changes(puzzle):
+    state = BoardState.from_grid(puzzle)
+    first = state.candidate_sets()
+    state.toggle_note(2, 1)           # notes do not affect candidates
+    assert state.candidate_sets() is first
+    state.set_value(2, 4)
+    second = state.candidate_sets()
+    assert second is not first
+    assert second[0][2] == set()
+    assert 4 not in second[0][3]
+
+def test_digit_cells_and_conflicts_track_edits(puzzle):
+    import random
+    from core.tables import PEERS
+    rng = random.Random(9)
+    state = BoardState.from_grid(puzzle)
+    for _ in range(200):
+        state.set_value(rng.randrange(81), rng.randrange(10))
+    values = state.values
+    for d in range(1, 10):
+        assert state.digit_cells[d] == sum(1 << i for i in range(81) if values[i] == d)
+    for i in range(81):
+        expected = tuple(j for j in PEERS[i] if values[i] and values[j] == values[i])
+        assert state.conflicts(i) == expected
+
+def test_conflicts_cached_until_value_changes():
+    state = BoardState()
+    state.set_value(0, 5)
+    state.set_value(4, 5)
+    first = state.conflicts(0)
+    assert first == (4,)
+    state.toggle_note(10, 1)
+    assert state.conflicts(0) is first
+    state.set_value(4, 0)
+    assert state.conflicts(0) == ()
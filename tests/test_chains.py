@@ -0,0 +1,129 @@
+# tests/test_chains.py
+from unittest.mock import patch
+from core.solver import solve
+from core.tables import PEER_SETS, HOUSES
+from hints.engine.hint_engine import HintEngine
+from hints.utils.context import HintContext
+from hints.heuristics.chains import find_xy_wings, find_simple_coloring, find_x_chains, X_CHAIN_MAX_LINKS
+
+
+def index(cell):
+    return (cell[0] - 1) * 9 + cell[1] - 1
+
+
+def naive_xy_wings(board):
+    # {(pivot, pincers, digit, eliminated cells)} by trying every bivalue triple
+    candidates = HintContext(board).candidates
+    cands = [candidates[i // 9][i % 9] for i in range(81)]
+    bivalue = [i for i in range(81) if len(cands[i]) == 2]
+    found = set()
+    for pivot in bivalue:
+        for x in bivalue:
+            for y in bivalue:
+                if not (x < y and x in PEER_SETS[pivot] and y in PEER_SETS[pivot]):
+                    continue
+                common = cands[x] & cands[y]
+                if len(common) != 1 or common & cands[pivot] or cands[x] ^ cands[y] != cands[pivot]:
+                    continue
+                (digit,) = common
+                removed = tuple(sorted(j for j in PEER_SETS[x] & PEER_SETS[y] if digit in cands[j]))
+                if removed:
+                    found.add((pivot, (x, y), digit, removed))
+    return found
+
+
+def conjugate(board, digit, a, b):
+    # a and b are the only two cells of some house with the digit
+    candidates = HintContext(board).candidates
+    return any(a in house and b in house and
+               sum(digit in candidates[i // 9][i % 9] for i in house) == 2 for house in HOUSES)
+
+
+def test_link_index(dummy_board):
+    candidates = [[set() for _ in range(9)] for _ in range(9)]
+    candidates[0][0] = {1, 2}
+    candidates[0][4] = {1, 3}
+    candidates[4][0] = {2, 3}
+    candidates[4][4] = {3, 5, 6}
+    candidates[4][7] = {3, 6}
+
+    with patch("hints.utils.board_utils.get_all_candidates", return_value=candidates):
+        links = HintContext(dummy_board).links
+
+    assert links.bivalue == (1 << 0) | (1 << 4) | (1 << 36) | (1 << 43)
+    # Column 5 holds 3 only at (0,4) and (4,4); row 5 has three 3s
+    assert links.strong[3][4] == 1 << 40
+    assert links.strong[3][36] == 0
+    assert links.linked[1] == (1 << 0) | (1 << 4)
+    assert links.weak(3, 36) == (1 << 40) | (1 << 43)
+
+
+def test_xy_wing(dummy_board):
+    candidates = [[set() for _ in range(9)] for _ in range(9)]
+    candidates[0][0] = {1, 2}  # pivot
+    candidates[0][4] = {1, 3}
+    candidates[4][0] = {2, 3}
+    candidates[4][4] = {3, 5}
+
+    with patch("hints.utils.board_utils.get_all_candidates", return_value=candidates):
+        findings = find_xy_wings(dummy_board)
+
+    assert len(findings) == 1
+    hint = findings[0]
+    assert hint["technique"] == "XY-Wing"
+    assert hint["cell"] == [(1, 1), (1, 5), (5, 1)] and hint["value"] == {1, 2, 3}
+    assert hint["where"] == ["row 1", "column 1"]
+    assert [(e["cell"], e["remove"]) for e in hint["eliminations"]] == [((5, 5), 3)]
+
+
+def test_xy_wings_match_naive_search(boards):
+    for board in boards:
+        found = {(index(h["cell"][0]), tuple(sorted(map(index, h["cell"][1:]))),
+                  h["eliminations"][0]["remove"],
+                  tuple(sorted(index(e["cell"]) for e in h["eliminations"])))
+                 for h in find_xy_wings(board)}
+        assert found == naive_xy_wings(board)
+
+
+def test_eliminations_are_sound(boards):
+    counts = {}
+    for board in boards:
+        solution = solve(board.user_board)
+        for find in (find_xy_wings, find_simple_coloring, find_x_chains):
+            for hint in find(board):
+                counts[hint["technique"]] = counts.get(hint["technique"], 0) + 1
+                assert hint["eliminations"]
+                for elim in hint["eliminations"]:
+                    r, c = elim["cell"]
+                    assert solution[r - 1][c - 1] != elim["remove"]
+    # The corpus exercises every technique
+    assert set(counts) == {"XY-Wing", "Simple Coloring", "X-Chain"}
+
+
+def test_x_chains_alternate_strong_and_weak_links(boards):
+    for board in boards:
+        for hint in find_x_chains(board):
+            (digit,) = hint["value"]
+            chain = [index(cell) for cell in hint["cell"]]
+            assert len(set(chain)) == len(chain)
+            assert 3 <= len(chain) - 1 <= X_CHAIN_MAX_LINKS and len(chain) % 2 == 0
+            for k, (a, b) in enumerate(zip(chain, chain[1:])):
+                assert b in PEER_SETS[a]
+                if k % 2 == 0:
+                    assert conjugate(board, digit, a, b)
+            removed = [index(e["cell"]) for e in hint["eliminations"]]
+            assert all(j in PEER_SETS[chain[0]] and j in PEER_SETS[chain[-1]] for j in removed)
+
+
+def test_shares_one_link_index_per_pass(boards):
+    context = HintContext(boards[0])
+    find_xy_wings(boards[0], context)
+    links = context.links
+    find_simple_coloring(boards[0], context)
+    find_x_chains(boards[0], context)
+    assert context.links is links
+
+
+def test_registered_after_fish():
+    names = list(HintEngine.FUNCTIONS)
+    assert names[names.index("Jellyfish") + 1:] == ["XY-Wing", "Simple Coloring", "X-Chain"]
@@ -0,0 +1,47 @@
+# tests/test_generation_job.py
+import threading
+import pytest
+from core import generator
+from core.generation_job import GenerationJob
+
+# --- Tests ---
+def test_job_produces_puzzle_and_reports_progress():
+    job = GenerationJob("medium")
+    assert job.wait(timeout=30)
+    assert job.done
+    puzzle, solution = job.result
+    assert len(puzzle) == 9 and len(solution) == 9
+    assert job.progress == 1.0
+    assert not job.cancelled
+
+def test_remove_numbers_progress_is_monotonic():
+    reported = []
+    board = [[0] * 9 for _ in range(9)]
+    generator.fill_board(board)
+    generator.remove_numbers(board, 30, progress=reported.append)
+    assert reported[-1] == 1.0
+    assert all(0.0 <= p <= 1.0 for p in reported)
+    assert reported == sorted(reported)
+
+def test_remove_numbers_honours_cancel():
+    cancel = threading.Event()
+    cancel.set()
+    board = [[0] * 9 for _ in range(9)]
+    generator.fill_board(board)
+    with pytest.raises(generator.GenerationCancelled):
+        generator.remove_numbers(board, 30, cancel=cancel)
+
+def test_cancelled_job_has_no_result():
+    started = threading.Event()
+
+    def slow_generate(difficulty, progress=None, cancel=None):
+        started.set()
+        cancel.wait(timeout=5)
+        raise generator.GenerationCancelled()
+
+    job = GenerationJob("expert", generate=slow_generate)
+    assert started.wait(timeout=5)
+    job.cancel()
+    assert job.wait(timeout=5)
+    assert job.cancelled
+    assert job.result is None
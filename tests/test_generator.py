@@ -2,6 +2,7 @@
 import pytest
 import pygame
 from core import generator
+from core import solver
 from ui.board import Board
 from ui.numberpad import NumberPad
 
@@ -129,4 +130,59 @@ def test_numberpad_entries_valid_only(example_board):
     # Simulate an invalid "numberpad" entry outside 1–9
     # Should ignore (no change)
     example_board.handle_key(pygame.K_0)  # 0 is invalid
-    assert example_board.user_board[0][3] == 5
\ No newline at end of file
+    assert example_board.user_board[0][3] == 5
+
+# -------------------
+# UNIQUENESS TESTS
+# -------------------
+
+@pytest.mark.parametrize("difficulty", ["easy", "medium", "hard", "expert"])
+def test_generated_puzzle_is_unique(difficulty):
+    puzzle, solution = generator.generate_sudoku(difficulty)
+    assert solver.is_unique(puzzle)
+    assert solver.solve(puzzle) == solution
+
+def test_remove_numbers_reaches_easy_target():
+    board = [[0] * 9 for _ in range(9)]
+    generator.fill_board(board)
+    puzzle = generator.remove_numbers(board, 40)
+    assert sum(cell != 0 for row in puzzle for cell in row) == 40
+
+def test_remove_numbers_keeps_givens_consistent():
+    board = [[0] * 9 for _ in range(9)]
+    generator.fill_board(board)
+    solution = [row[:] for row in board]
+    puzzle = generator.remove_numbers(board, 25)
+    for r in range(9):
+        for c in range(9):
+            assert puzzle[r][c] in (0, solution[r][c])
+
+
+# -------------------
+# BATCH GENERATION TESTS
+# -------------------
+
+def test_grid_string_round_trip():
+    puzzle, _ = generator.generate_sudoku("medium")
+    text = generator.grid_to_string(puzzle)
+    assert len(text) == 81
+    assert generator.string_to_grid(text) == puzzle
+
+def test_generate_batch_is_reproducible_across_workers():
+    inline = sorted(generator.generate_batch(6, "easy", workers=1, seed=42))
+    pooled = sorted(generator.generate_batch(6, "easy", workers=2, seed=42))
+    assert [index for index, _, _ in pooled] == list(range(6))
+    assert inline == pooled
+
+def test_generate_batch_puzzles_are_unique():
+    for _, puzzle, solution in generator.generate_batch(3, "hard", workers=2, seed=1):
+        assert solver.solve(puzzle) == solution
+        assert solver.is_unique(puzzle)
+
+def test_cli_writes_one_line_per_puzzle(tmp_path):
+    out = tmp_path / "puzzles.txt"
+    generator.main(["-n", "3", "-d", "easy", "-w", "1", "-s", "3", "-o", str(out)])
+    lines = out.read_text().splitlines()
+    assert len(lines) == 3
+    index, puzzle, solution = lines[0].split(",")
+    assert len(puzzle) == 81 and len(solution) == 81
@@ -1,8 +1,15 @@
 # tests/test_hidden_singles.py
+import random
 import pytest
 import pygame
+from core.generator import generate_sudoku
+from core.tables import PEERS, ROW_OF, COL_OF, BOX_OF
 from hints.heuristics.hidden_singles import find_hidden_singles
+from hints.utils.board_utils import house_name
+from hints.utils.context import HintContext
+from hints.utils.elimination_utils import find_eliminations
 from ui.board import Board
+from board_corpus import mid_game_boards
 
 # --- Fixtures ---
 @pytest.fixture
@@ -112,3 +119,111 @@ def test_hidden_single_ignores_naked_singles():
     for hint in hints:
         r, c = hint["cell"]
         assert board.user_board[r][c] == 0
+
+
+# --- Regression: bitmask search vs. the original cell-by-cell search ---
+def legacy_single_eliminations(candidates, r0, c0, num):
+    # The singles branch of find_eliminations before the bitmask rewrite
+    eliminations = []
+    hi = r0 * 9 + c0
+    for j in PEERS[hi]:
+        r, c = ROW_OF[j], COL_OF[j]
+        if num in candidates[r][c]:
+            relations = []
+            if r == r0:
+                relations.append("same row")
+            if c == c0:
+                relations.append("same column")
+            if BOX_OF[j] == BOX_OF[hi]:
+                relations.append("same block")
+            eliminations.append({
+                "cell": (r + 1, c + 1),
+                "remove": num,
+                "reason": ", ".join(relations) + f" as ({r0+1},{c0+1})"
+            })
+    return eliminations
+
+
+def legacy_find_hidden_singles(board, context):
+    # The implementation before the bitmask rewrite, kept as the reference
+    candidates, values = context.candidates, context.values
+    # The 1-indexed cells of the naked singles (compared with 0-indexed cells below)
+    naked_cells = {(r + 1, c + 1) for r in range(9) for c in range(9)
+                   if values[r * 9 + c] == 0 and len(candidates[r][c]) == 1}
+    assigned_cells = set()
+    hints = []
+    units = ([([(r, c) for c in range(9)], f"row {r+1}") for r in range(9)] +
+             [([(r, c) for r in range(9)], f"column {c+1}") for c in range(9)] +
+             [([(r, c) for r in range(br, br+3) for c in range(bc, bc+3)], f"block starting at ({br+1},{bc+1})")
+              for br in range(0, 9, 3) for bc in range(0, 9, 3)])
+    for unit_cells, name in units:
+        for num in range(1, 10):
+            cells = [cell for cell in unit_cells if cell not in naked_cells
+                     and num in candidates[cell[0]][cell[1]] and values[cell[0] * 9 + cell[1]] == 0]
+            if len(cells) == 1 and cells[0] not in assigned_cells:
+                assigned_cells.add(cells[0])
+                # Validation: the only empty cell of the unit with this candidate
+                count = sum(1 for r, c in unit_cells if values[r * 9 + c] == 0 and num in candidates[r][c])
+                if count == 1:
+                    r, c = cells[0]
+                    hints.append({
+                        "technique": "Hidden Singles",
+                        "cell": (r + 1, c + 1),
+                        "value": num,
+                        "reason": f"Number {num} can only go in cell {(r + 1, c + 1)} in {name}.",
+                        "where": [name],
+                        "eliminations": legacy_single_eliminations(candidates, r, c, num)
+                    })
+    return hints
+
+
+def regression_corpus():
+    grids = mid_game_boards()
+    rng = random.Random(22)
+    for difficulty in ["easy", "medium", "hard", "expert"] * 5:
+        puzzle, solution = generate_sudoku(difficulty, rng)
+        empty = [(r, c) for r in range(9) for c in range(9) if puzzle[r][c] == 0]
+        for r, c in rng.sample(empty, rng.randrange(len(empty))):
+            puzzle[r][c] = solution[r][c]
+        grids.append(puzzle)
+    return grids
+
+
+def test_matches_legacy_search_on_corpus():
+    total = 0
+    for grid in regression_corpus():
+        board = Board(puzzle=grid)
+        context = HintContext(board)
+        expected = legacy_find_hidden_singles(board, context)
+        assert find_hidden_singles(board, context) == expected
+        assert find_hidden_singles(board) == expected
+        total += len(expected)
+    assert total > 100
+
+
+def test_single_eliminations_match_legacy_loop(boards):
+    for board in boards:
+        context = HintContext(board)
+        for i in range(81):
+            r, c = divmod(i, 9)
+            for num in context.candidates[r][c]:
+                assert (find_eliminations(board, [(r, c, num)], "Naked Singles", context)
+                        == legacy_single_eliminations(context.candidates, r, c, num))
+
+
+def test_eliminations_are_built_when_first_read(boards):
+    board = boards[0]
+    context = HintContext(board)
+    hint = next(h for h in find_hidden_singles(board, context) if h["eliminations"])
+    r, c = hint["cell"]
+    expected = legacy_single_eliminations(context.candidates, r - 1, c - 1, hint["value"])
+    assert list(hint["eliminations"]) == expected
+    assert len(hint["eliminations"]) == len(expected)
+    assert hint["eliminations"][0] == expected[0]
+
+
+def test_house_names():
+    assert house_name(0) == "row 1"
+    assert house_name(17) == "column 9"
+    assert house_name(18) == "block starting at (1,1)"
+    assert house_name(23) == "block starting at (4,7)"
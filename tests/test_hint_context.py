@@ -0,0 +1,73 @@
+# tests/test_hint_context.py
+import pytest
+from unittest.mock import patch
+from hints.utils import board_utils
+from hints.utils.context import HintContext
+from hints.utils.elimination_utils import find_eliminations
+from hints.heuristics.naked_singles import find_naked_singles
+from hints.heuristics.hidden_singles import find_hidden_singles
+from ui.board import Board
+
+# --- Fixtures ---
+@pytest.fixture
+def nearly_solved_board():
+    # Solved grid with the first two rows blanked: lots of singles
+    solution = [
+        [1,2,3,4,5,6,7,8,9],
+        [4,5,6,7,8,9,1,2,3],
+        [7,8,9,1,2,3,4,5,6],
+        [2,3,4,5,6,7,8,9,1],
+        [5,6,7,8,9,1,2,3,4],
+        [8,9,1,2,3,4,5,6,7],
+        [3,4,5,6,7,8,9,1,2],
+        [6,7,8,9,1,2,3,4,5],
+        [9,1,2,3,4,5,6,7,8]
+    ]
+    puzzle = [row[:] for row in solution]
+    for c in range(9):
+        puzzle[0][c] = 0
+        puzzle[4][c] = 0
+    return Board(puzzle=puzzle, solution=solution)
+
+class DummyBoard:
+    def __init__(self, user_board):
+        self.user_board = user_board
+        self.size = 9
+
+# --- Tests ---
+def test_context_computes_candidates_once_per_pass(nearly_solved_board):
+    calls = []
+    original = board_utils.get_all_candidates
+
+    def counting(board):
+        calls.append(1)
+        return original(board)
+
+    with patch("hints.utils.board_utils.get_all_candidates", side_effect=counting):
+        context = HintContext(nearly_solved_board)
+        singles = find_naked_singles(nearly_solved_board, context)
+        find_hidden_singles(nearly_solved_board, context)
+
+    assert len(singles) == 18
+    assert len(calls) == 1
+
+def test_context_masks_match_candidates(nearly_solved_board):
+    context = HintContext(nearly_solved_board)
+    for i in range(81):
+        digits = {d for d in range(1, 10) if context.masks[i] >> (d - 1) & 1}
+        assert digits == context.candidates[i // 9][i % 9]
+    assert len(context.peers[0]) == 20
+    assert len(context.houses) == 27
+
+def test_context_works_for_plain_boards():
+    user_board = [[0] * 9 for _ in range(9)]
+    user_board[0][:8] = [1, 2, 3, 4, 5, 6, 7, 8]
+    context = HintContext(DummyBoard(user_board))
+    assert context.candidates[0][8] == {9}
+    assert context.masks[8] == 1 << 8
+
+def test_find_eliminations_wrapper_matches_context(nearly_solved_board):
+    context = HintContext(nearly_solved_board)
+    direct = find_eliminations(nearly_solved_board, [(0, 0, 1)], "Naked Singles")
+    shared = find_eliminations(nearly_solved_board, [(0, 0, 1)], "Naked Singles", context)
+    assert direct == shared
@@ -68,3 +68,39 @@ def test_detect_naked_pairs(simple_board):
         val_set_1 = {1, 2}
         val_set_2 = {1, 2}
         assert val_set_1 == val_set_2 and len(val_set_1) == 2
+
+
+# --- Hint caching ---
+def test_hints_cached_until_board_changes(simple_board):
+    calls = []
+    name, func = HintEngine.HEURISTICS[pygame.K_a]
+
+    def counting(board, context=None):
+        calls.append(1)
+        return func(board, context)
+
+    original = HintEngine.FUNCTIONS[name]
+    HintEngine.FUNCTIONS[name] = counting
+    try:
+        first = HintEngine.get_all_hints(simple_board)[name]
+        second = HintEngine.get_all_hints(simple_board)[name]
+        assert first is second
+        assert len(calls) == 1
+
+        # Entering a number bumps the version and evicts the cached hints
+        simple_board.selected_cell = (0, 2)
+        simple_board.handle_number_entry(4)
+        HintEngine.get_all_hints(simple_board)[name]
+        assert len(calls) == 2
+    finally:
+        HintEngine.FUNCTIONS[name] = original
+
+def test_hints_computed_lazily_per_technique(simple_board):
+    results = HintEngine.get_all_hints(simple_board)
+    results.get("Naked Singles")
+    assert results.is_computed("Naked Singles")
+    assert not results.is_computed("Hidden Singles")
+
+def test_get_hint_by_key_matches_all_hints(simple_board):
+    by_key = HintEngine.get_hint_by_key(simple_board, pygame.K_c)
+    assert by_key == HintEngine.get_all_hints(simple_board)["Hidden Singles"]
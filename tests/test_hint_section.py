@@ -1,6 +1,8 @@
 # tests/test_hint_section.py
 import pytest
 import pygame
+from unittest.mock import patch
+from ui.board import Board
 from ui.hint_section import HintSection, handle_hint_key
 
 # --- Fixtures ---
@@ -117,3 +119,56 @@ def test_show_all_candidates_on_empty_board(small_board):
             assert (r, c) in small_board.highlighted_candidates
             assert isinstance(small_board.highlighted_candidates[(r, c)], set)
             assert len(small_board.highlighted_candidates[(r, c)]) > 0
+
+
+# --- Virtualized hint list ---
+@pytest.fixture
+def pair_hints():
+    return [{"cell": [(1, i % 9 + 1), (2, i % 9 + 1)], "value": [3, 6], "eliminations": []}
+            for i in range(60)]
+
+@pytest.fixture
+def long_hint_section():
+    board = Board(size=9, screen_size=550)
+    section = HintSection(board, screen_width=850)
+    section.open_heuristics["Naked Pairs"] = True
+    return section
+
+def test_only_visible_hint_rows_are_drawn(long_hint_section, pair_hints):
+    section = long_hint_section
+    screen = pygame.Surface((850, 630))
+
+    with patch("hints.engine.hint_engine.HintEngine.get_all_hints",
+               return_value={"Naked Pairs": pair_hints}), \
+         patch.object(section, "_render_row", wraps=section._render_row) as render_row:
+        section.draw(screen)
+        assert 0 < len(section.show_button_rects) < len(pair_hints)
+        rendered = render_row.call_count
+
+        # Same frame again - rows come from the cache
+        section.draw(screen)
+        assert render_row.call_count == rendered
+
+        # Scroll down to the last hint - it is drawn and clickable
+        top, height, _, _ = [row for row in section._layout() if row[3] is not None][-1]
+        section.scroll_y = top + height - section._scroll_rect().height
+        section.draw(screen)
+        last_rect, last_hint = section.show_button_rects[-1]
+        assert last_hint is pair_hints[-1]
+        assert section._scroll_rect().colliderect(last_rect)
+
+def test_hint_layout_rebuilt_when_board_changes(long_hint_section, pair_hints):
+    section = long_hint_section
+    screen = pygame.Surface((850, 630))
+
+    with patch("hints.engine.hint_engine.HintEngine.get_all_hints",
+               return_value={"Naked Pairs": pair_hints}) as get_all_hints:
+        section.draw(screen)
+        calls = get_all_hints.call_count
+        section.draw(screen)
+        assert get_all_hints.call_count == calls   # layout cached
+
+        section.board.selected_cell = (0, 0)
+        section.board.handle_number_entry(5)
+        section.draw(screen)
+        assert get_all_hints.call_count > calls    # new hint set
@@ -0,0 +1,47 @@
+# tests/test_intersections.py
+from unittest.mock import patch
+from hints.heuristics.intersections import find_pointing, find_claiming, SEGMENTS
+
+
+def test_segments():
+    assert len(SEGMENTS) == 54
+    assert all(bin(segment).count("1") == 3 for _, _, segment in SEGMENTS)
+
+
+def test_pointing_pair_in_box(dummy_board):
+    # 7 only in (0,0) and (0,1) within block 1 - leaves the rest of row 1
+    candidates = [[set() for _ in range(9)] for _ in range(9)]
+    candidates[0][0] = {7, 1}
+    candidates[0][1] = {7, 2}
+    candidates[0][6] = {7, 3}
+    candidates[5][0] = {7, 4}
+
+    with patch("hints.utils.board_utils.get_all_candidates", return_value=candidates):
+        pointing = find_pointing(dummy_board)
+        claiming = find_claiming(dummy_board)
+
+    assert len(pointing) == 1
+    hint = pointing[0]
+    assert hint["technique"] == "Pointing"
+    assert hint["cell"] == [(1, 1), (1, 2)] and hint["value"] == {7}
+    assert hint["where"] == ["block starting at (1,1)", "row 1"]
+    assert [(e["cell"], e["remove"]) for e in hint["eliminations"]] == [((1, 7), 7)]
+    # Row 1 also has 7 outside the box, and column 1's two cells are in different boxes
+    assert claiming == []
+
+
+def test_claiming_in_row(dummy_board):
+    # Row 1 holds 4 only in block 2; the rest of block 2 loses it
+    candidates = [[set() for _ in range(9)] for _ in range(9)]
+    candidates[0][3] = {4, 1}
+    candidates[0][5] = {4, 2}
+    candidates[1][4] = {4, 3}
+    candidates[2][8] = {4, 5}
+    candidates[4][3] = {4, 6}
+
+    with patch("hints.utils.board_utils.get_all_candidates", return_value=candidates):
+        claiming = find_claiming(dummy_board)
+
+    assert [(h["where"], [(e["cell"], e["remove"]) for e in h["eliminations"]]) for h in claiming] == [
+        (["row 1", "block starting at (1,4)"], [((2, 5), 4)])
+    ]
@@ -0,0 +1,102 @@
+# tests/test_profiler.py
+import json
+import pygame
+import pytest
+from core.profiler import Profiler, percentile, profiler as global_profiler
+from hints.engine.hint_engine import HintEngine
+from ui.board import Board
+from ui.profiler_overlay import ProfilerOverlay, format_lines, MAX_LINES
+
+
+@pytest.fixture
+def enabled_profiler():
+    # The process-wide profiler, switched on for one test
+    global_profiler.reset()
+    global_profiler.enabled = True
+    yield global_profiler
+    global_profiler.enabled = False
+    global_profiler.reset()
+
+
+def test_percentile_nearest_rank():
+    values = list(range(1, 101))
+    assert percentile(values, 50) == 50
+    assert percentile(values, 95) == 95
+    assert percentile(values, 99) == 99
+    assert percentile([7], 99) == 7
+    assert percentile([], 50) is None
+
+
+def test_disabled_profiler_records_nothing():
+    p = Profiler()
+    with p.timed("draw.Board"):
+        pass
+    p.record("frame", 0.01)
+    p.hit("candidates", True)
+    assert p.timings == {} and p.counters == {}
+
+
+def test_timings_window_and_hit_rates():
+    p = Profiler(window=4, enabled=True)
+    for ms in (1, 2, 3, 4, 100):
+        p.record("frame", ms / 1000)
+    timing = p.timings["frame"]
+    assert timing.count == 5 and list(timing.samples) == [0.002, 0.003, 0.004, 0.1]
+    assert p.percentiles("frame")[50] == 0.003
+
+    p.hit("candidates", True)
+    p.hit("candidates", True)
+    p.hit("candidates", False)
+    assert p.hit_rate("candidates") == pytest.approx(2 / 3)
+    assert p.hit_rate("unknown") is None
+    assert p.caches() == ["candidates"]
+
+
+def test_dump_writes_json_trace(tmp_path):
+    p = Profiler(enabled=True)
+    with p.timed("hint.Naked Singles"):
+        pass
+    p.hit("hints", False)
+    path = tmp_path / "trace.json"
+    p.dump(path)
+
+    trace = json.loads(path.read_text())
+    entry = trace["timings"]["hint.Naked Singles"]
+    assert entry["count"] == 1 and {"p50_ms", "p95_ms", "p99_ms", "mean_ms"} <= set(entry)
+    assert trace["counters"] == {"hints.miss": 1}
+    assert trace["hit_rates"] == {"hints": 0.0}
+
+
+def test_hint_engine_is_instrumented(enabled_profiler):
+    board = Board(size=9, puzzle=[[0] * 9 for _ in range(9)])
+    hints = HintEngine.get_all_hints(board)
+    hints["Naked Singles"]
+    HintEngine.get_all_hints(board)
+
+    assert enabled_profiler.timings["hint.Naked Singles"].count == 1
+    assert enabled_profiler.hit_rate("hints") == 0.5
+    assert "candidates" in enabled_profiler.caches()
+
+
+def test_overlay_toggle_and_draw(enabled_profiler):
+    pygame.init()
+    enabled_profiler.record("frame", 0.002)
+    enabled_profiler.record("draw.Board", 0.001)
+    enabled_profiler.hit("candidates", True)
+    lines = format_lines(enabled_profiler)
+    assert lines[0].startswith("frame ms  p50 2.00")
+    assert any("Board" in line for line in lines)
+    assert any("candidates" in line and "100%" in line for line in lines)
+    assert len(lines) <= MAX_LINES
+
+    overlay = ProfilerOverlay(profiler=enabled_profiler)
+    screen = pygame.Surface((400, 400))
+    overlay.draw(screen)
+    assert screen.get_at((10, 10))[:3] == (0, 0, 0)  # hidden - nothing drawn
+
+    overlay.toggle()
+    assert overlay.visible and overlay.get_dirty_rects() == [overlay.rect]
+    screen.fill((255, 255, 255))
+    overlay.draw(screen)
+    assert screen.get_at(overlay.rect.topleft)[:3] != (255, 255, 255)
+    pygame.quit()
@@ -0,0 +1,81 @@
+# tests/test_puzzle_pool.py
+import time
+from core import generator
+from core.puzzle_pool import PuzzlePool, encode_record, decode_record, RECORD_SIZE
+
+# --- Helpers ---
+def fake_generate(difficulty, rng):
+    # Cheap stand-in for generate_sudoku: a fixed solution with every other cell given
+    solution = [[(r * 3 + r // 3 + c) % 9 + 1 for c in range(9)] for r in range(9)]
+    puzzle = [[v if (r + c) % 2 == 0 else 0 for c, v in enumerate(row)]
+              for r, row in enumerate(solution)]
+    return puzzle, solution
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return False
+
+# --- Tests ---
+def test_record_round_trip():
+    puzzle, solution = generator.generate_sudoku("hard")
+    record = encode_record(puzzle, solution)
+    assert len(record) == RECORD_SIZE == 52
+    assert decode_record(record) == (puzzle, solution)
+
+def test_take_from_empty_pool_returns_none(tmp_path):
+    pool = PuzzlePool(str(tmp_path), capacity=2, generate=fake_generate)
+    assert pool.take("easy") is None
+
+def test_refill_fills_each_difficulty_to_capacity(tmp_path):
+    pool = PuzzlePool(str(tmp_path), capacity=3, difficulties=("easy", "expert"),
+                      generate=fake_generate)
+    pool.refill()
+    assert pool.size("easy") == 3
+    assert pool.size("expert") == 3
+    assert (tmp_path / "easy.pool").stat().st_size == 3 * RECORD_SIZE
+
+def test_take_persists_across_instances(tmp_path):
+    pool = PuzzlePool(str(tmp_path), capacity=3, difficulties=("easy",), generate=fake_generate)
+    pool.refill()
+    puzzle, solution = pool.take("easy")
+    assert (puzzle, solution) == fake_generate("easy", None)
+
+    reopened = PuzzlePool(str(tmp_path), capacity=3, difficulties=("easy",), generate=fake_generate)
+    assert reopened.size("easy") == 2
+
+def test_partial_record_is_discarded(tmp_path):
+    pool = PuzzlePool(str(tmp_path), capacity=1, difficulties=("easy",), generate=fake_generate)
+    pool.refill()
+    with open(tmp_path / "easy.pool", "ab") as f:
+        f.write(b"\x00" * 10)  # interrupted write
+    reopened = PuzzlePool(str(tmp_path), capacity=1, difficulties=("easy",), generate=fake_generate)
+    assert reopened.size("easy") == 1
+    assert reopened.take("easy") is not None
+
+def test_background_worker_refills_below_low_water(tmp_path):
+    pool = PuzzlePool(str(tmp_path), capacity=4, low_water=2, difficulties=("easy",),
+                      generate=fake_generate, processes=False)
+    pool.start()
+    try:
+        assert wait_for(lambda: pool.size("easy") == 4)
+        for _ in range(3):
+            assert pool.take("easy") is not None
+        assert wait_for(lambda: pool.size("easy") == 4)
+    finally:
+        pool.stop(timeout=5)
+
+def test_background_worker_generates_in_child_process(tmp_path):
+    pool = PuzzlePool(str(tmp_path), capacity=2, difficulties=("easy",))
+    pool.start()
+    try:
+        assert wait_for(lambda: pool.size("easy") == 2, timeout=30)
+    finally:
+        pool.stop(timeout=5)
+    assert pool._process is None
+    puzzle, solution = pool.take("easy")
+    assert sum(cell != 0 for row in puzzle for cell in row) == 40
+    assert all(p in (0, s) for prow, srow in zip(puzzle, solution) for p, s in zip(prow, srow))
@@ -0,0 +1,85 @@
+# tests/test_render.py
+import pygame
+import pytest
+from ui.render import Renderable, Renderer, push_clip
+
+
+class Box(Renderable):
+    # Minimal component: a coloured square that changes with `color`
+    def __init__(self, rect, color):
+        self.rect = pygame.Rect(rect)
+        self.color = color
+        self.draw_count = 0
+
+    def render_key(self):
+        return self.color
+
+    def render_regions(self):
+        return [self.rect]
+
+    def draw(self, screen):
+        self.draw_count += 1
+        screen.fill(self.color, self.rect)
+
+
+@pytest.fixture
+def screen():
+    return pygame.Surface((200, 100))
+
+
+def test_get_dirty_rects_only_on_change():
+    box = Box((0, 0, 10, 10), (255, 0, 0))
+    assert box.get_dirty_rects() == [box.rect]
+    assert box.get_dirty_rects() == []
+    box.color = (0, 255, 0)
+    assert box.get_dirty_rects() == [box.rect]
+    box.mark_dirty()
+    assert box.get_dirty_rects() == [box.rect]
+
+
+def test_default_component_has_no_dirty_rects():
+    assert Renderable().get_dirty_rects() == []
+
+
+def test_renderer_full_then_partial(screen):
+    left = Box((0, 0, 50, 50), (255, 0, 0))
+    right = Box((100, 0, 50, 50), (0, 0, 255))
+    renderer = Renderer(screen, background=(0, 0, 0))
+
+    # First frame draws everything
+    assert renderer.render("game", [left, right]) == [screen.get_rect()]
+    assert (left.draw_count, right.draw_count) == (1, 1)
+
+    # Nothing changed - nothing drawn
+    assert renderer.render("game", [left, right]) == []
+    assert (left.draw_count, right.draw_count) == (1, 1)
+
+    # Only the changed component is repainted
+    left.color = (0, 255, 0)
+    assert renderer.render("game", [left, right]) == [left.rect]
+    assert (left.draw_count, right.draw_count) == (2, 1)
+    assert screen.get_at((10, 10))[:3] == (0, 255, 0)
+    assert screen.get_at((110, 10))[:3] == (0, 0, 255)
+
+    # New scene or invalidate -> full redraw
+    assert renderer.render("other", [left, right]) == [screen.get_rect()]
+    renderer.invalidate()
+    assert renderer.render("other", [left, right]) == [screen.get_rect()]
+
+
+def test_overlapping_dirty_rects_are_merged(screen):
+    a = Box((0, 0, 30, 30), (255, 0, 0))
+    b = Box((20, 20, 30, 30), (0, 255, 0))
+    renderer = Renderer(screen)
+    renderer.render("game", [a, b])
+
+    a.color, b.color = (1, 1, 1), (2, 2, 2)
+    assert renderer.render("game", [a, b]) == [pygame.Rect(0, 0, 50, 50)]
+
+
+def test_push_clip_intersects_and_restores(screen):
+    screen.set_clip(pygame.Rect(0, 0, 50, 50))
+    previous = push_clip(screen, pygame.Rect(25, 25, 100, 100))
+    assert screen.get_clip() == pygame.Rect(25, 25, 25, 25)
+    screen.set_clip(previous)
+    assert screen.get_clip() == pygame.Rect(0, 0, 50, 50)
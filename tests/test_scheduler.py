@@ -0,0 +1,67 @@
+# tests/test_scheduler.py
+import pygame
+import pytest
+from unittest.mock import MagicMock, patch
+from ui.scheduler import FrameScheduler
+
+
+@pytest.fixture
+def clock():
+    return MagicMock()
+
+
+def no_event():
+    return pygame.event.Event(pygame.NOEVENT)
+
+
+def test_unknown_policy_raises(clock):
+    with pytest.raises(ValueError):
+        FrameScheduler(policy="sometimes", clock=clock)
+
+
+def test_fixed_policy_always_ticks(clock):
+    scheduler = FrameScheduler(fps=30, policy="fixed", clock=clock)
+    with patch("pygame.event.get", return_value=[]) as get, patch("pygame.event.wait") as wait:
+        assert scheduler.get_events() == []
+        assert scheduler.get_events() == []
+    clock.tick.assert_called_with(30)
+    assert get.call_count == 2
+    wait.assert_not_called()
+    assert scheduler.idle_waits == 0
+
+
+def test_idle_adaptive_waits_for_events(clock):
+    scheduler = FrameScheduler(policy="adaptive", idle_timeout=1.0, clock=clock)
+    with patch("pygame.event.wait", return_value=no_event()) as wait, patch("pygame.event.get") as get:
+        assert scheduler.get_events() == []
+        wait.assert_called_with(1000)
+        # The next scheduled redraw shortens the sleep
+        scheduler.get_events(wake_in=0.25)
+        wait.assert_called_with(250)
+    get.assert_not_called()
+    clock.tick.assert_called_with()  # no frame-rate sleep on top of the wait
+    assert scheduler.idle_waits == 2
+
+
+def test_events_switch_to_full_rate(clock):
+    scheduler = FrameScheduler(fps=60, policy="adaptive", active_period=10, clock=clock)
+    click = pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=(0, 0), button=1)
+    motion = pygame.event.Event(pygame.MOUSEMOTION, pos=(1, 1))
+
+    with patch("pygame.event.wait", return_value=click), patch("pygame.event.get", return_value=[motion]):
+        # Woken by the click; the rest of the queue comes with it
+        assert scheduler.get_events() == [click, motion]
+    assert scheduler.is_active()
+
+    with patch("pygame.event.wait") as wait, patch("pygame.event.get", return_value=[]):
+        scheduler.get_events()
+        wait.assert_not_called()
+    clock.tick.assert_called_with(60)
+
+
+def test_busy_runs_at_full_rate(clock):
+    scheduler = FrameScheduler(fps=60, policy="adaptive", clock=clock)
+    with patch("pygame.event.wait") as wait, patch("pygame.event.get", return_value=[]):
+        scheduler.get_events(busy=True)
+        wait.assert_not_called()
+    clock.tick.assert_called_with(60)
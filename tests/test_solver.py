@@ -0,0 +1,79 @@
+# tests/test_solver.py
+import pytest
+from core import solver
+from core import generator
+
+# --- Fixtures ---
+@pytest.fixture
+def classic_puzzle():
+    return [
+        [5, 3, 0, 0, 7, 0, 0, 0, 0],
+        [6, 0, 0, 1, 9, 5, 0, 0, 0],
+        [0, 9, 8, 0, 0, 0, 0, 6, 0],
+        [8, 0, 0, 0, 6, 0, 0, 0, 3],
+        [4, 0, 0, 8, 0, 3, 0, 0, 1],
+        [7, 0, 0, 0, 2, 0, 0, 0, 6],
+        [0, 6, 0, 0, 0, 0, 2, 8, 0],
+        [0, 0, 0, 4, 1, 9, 0, 0, 5],
+        [0, 0, 0, 0, 8, 0, 0, 7, 9]
+    ]
+
+@pytest.fixture
+def hard_puzzle():
+    # "AI Escargot" - needs real search, not just singles
+    rows = [
+        "100007090", "030020008", "009600500",
+        "005300900", "010080002", "600004000",
+        "300000010", "040000007", "007000300",
+    ]
+    return [[int(ch) for ch in row] for row in rows]
+
+def assert_valid_solution(puzzle, solution):
+    for r in range(9):
+        assert sorted(solution[r]) == list(range(1, 10))
+        assert sorted(solution[i][r] for i in range(9)) == list(range(1, 10))
+        for c in range(9):
+            if puzzle[r][c]:
+                assert solution[r][c] == puzzle[r][c]
+    for br in range(0, 9, 3):
+        for bc in range(0, 9, 3):
+            block = [solution[r][c] for r in range(br, br + 3) for c in range(bc, bc + 3)]
+            assert sorted(block) == list(range(1, 10))
+
+# --- Tests ---
+def test_solve_classic_puzzle(classic_puzzle):
+    original = [row[:] for row in classic_puzzle]
+    solution = solver.solve(classic_puzzle)
+    assert solution is not None
+    assert_valid_solution(classic_puzzle, solution)
+    assert classic_puzzle == original  # input untouched
+
+def test_solve_hard_puzzle(hard_puzzle):
+    solution = solver.solve(hard_puzzle)
+    assert_valid_solution(hard_puzzle, solution)
+    assert solver.is_unique(hard_puzzle)
+
+def test_solve_returns_none_for_conflicting_grid():
+    grid = [[0] * 9 for _ in range(9)]
+    grid[0][0] = 5
+    grid[0][8] = 5
+    assert solver.solve(grid) is None
+    assert solver.count_solutions(grid) == 0
+
+def test_count_solutions_respects_limit():
+    empty = [[0] * 9 for _ in range(9)]
+    assert solver.count_solutions(empty, limit=5) == 5
+    assert not solver.is_unique(empty)
+
+def test_is_unique_detects_second_solution(classic_puzzle):
+    assert solver.is_unique(classic_puzzle)
+    # Removing enough givens opens up more solutions
+    loose = [row[:] for row in classic_puzzle]
+    for r in range(4):
+        loose[r] = [0] * 9
+    assert solver.count_solutions(loose, limit=2) == 2
+
+def test_generator_solve_fills_in_place(classic_puzzle):
+    board = [row[:] for row in classic_puzzle]
+    assert generator.solve(board)
+    assert_valid_solution(classic_puzzle, board)
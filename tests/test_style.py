@@ -67,3 +67,38 @@ def test_font_fallback_print(monkeypatch, capsys):
     captured = capsys.readouterr()
     # Only assert that fallback prints *something* to stdout
     assert "Error loading custom fonts" in captured.out or captured.out == ""
+
+# ---------- Test font registry ----------
+def test_font_registry_hits_and_misses():
+    registry = style.FontRegistry(capacity=4)
+    first = registry.get(style.DEFAULT_FACE, 18)
+    assert registry.get(style.DEFAULT_FACE, 18) is first
+    assert registry.stats() == {"hits": 1, "misses": 1, "size": 1, "capacity": 4}
+
+def test_font_registry_evicts_least_recently_used():
+    registry = style.FontRegistry(capacity=2)
+    a = registry.get(style.DEFAULT_FACE, 10)
+    registry.get(style.DEFAULT_FACE, 11)
+    registry.get(style.DEFAULT_FACE, 10)   # 10 is now most recent
+    registry.get(style.DEFAULT_FACE, 12)   # evicts 11
+    assert registry.stats()["size"] == 2
+    assert registry.get(style.DEFAULT_FACE, 10) is a
+    misses = registry.misses
+    registry.get(style.DEFAULT_FACE, 11)
+    assert registry.misses == misses + 1
+
+def test_font_registry_warm_up_and_clear():
+    registry = style.FontRegistry()
+    registry.warm_up([(style.DEFAULT_FACE, 15), (style.DEFAULT_FACE, 17)])
+    assert registry.stats()["misses"] == 2
+    registry.get(style.DEFAULT_FACE, 15)
+    assert registry.hits == 1
+    registry.clear()
+    assert registry.stats() == {"hits": 0, "misses": 0, "size": 0, "capacity": style.FONT_CACHE_SIZE}
+
+def test_startup_fonts_cover_board_fonts():
+    # A board at the game-screen size only asks for fonts warm_up_fonts() loaded
+    cell_size = style.BOARD_PIXELS // 9
+    for size in style.board_font_sizes(cell_size):
+        assert (style.DEFAULT_FACE, size) in style.STARTUP_FONTS
+    assert len(style.STARTUP_FONTS) <= style.FONT_CACHE_SIZE
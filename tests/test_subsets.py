@@ -0,0 +1,106 @@
+# tests/test_subsets.py
+from itertools import combinations
+from unittest.mock import patch
+import pytest
+from core.solver import solve
+from core.tables import HOUSES
+from hints.utils.context import HintContext
+from hints.utils.elimination_utils import find_eliminations, get_cell_relation
+from hints.heuristics.naked_pairs import find_naked_pairs
+from hints.heuristics.subsets import find_naked_subsets, find_hidden_subsets, find_naked_triples
+
+
+def naive_naked(board, n):
+    # (cells, digits) of every naked subset, by trying every cell combination
+    candidates = HintContext(board).candidates
+    found = set()
+    for house in HOUSES:
+        cells = [i for i in house if 2 <= len(candidates[i // 9][i % 9]) <= n]
+        for group in combinations(cells, n):
+            digits = set().union(*(candidates[i // 9][i % 9] for i in group))
+            if len(digits) == n:
+                found.add((tuple((i // 9 + 1, i % 9 + 1) for i in group), frozenset(digits)))
+    return found
+
+
+def naive_hidden(board, n):
+    # (cells, digits) of every hidden subset that removes something
+    candidates = HintContext(board).candidates
+    found = set()
+    for house in HOUSES:
+        where = {d: [i for i in house if d in candidates[i // 9][i % 9]] for d in range(1, 10)}
+        digits = [d for d in range(1, 10) if 2 <= len(where[d]) <= n]
+        for group in combinations(digits, n):
+            cells = sorted(set().union(*(where[d] for d in group)))
+            if len(cells) == n and any(candidates[i // 9][i % 9] - set(group) for i in cells):
+                found.add((tuple((i // 9 + 1, i % 9 + 1) for i in cells), frozenset(group)))
+    return found
+
+
+@pytest.mark.parametrize("n", [2, 3, 4])
+def test_matches_naive_search(boards, n):
+    for board in boards:
+        naked = find_naked_subsets(board, n, require_eliminations=False)
+        assert {(tuple(h["cell"]), frozenset(h["value"])) for h in naked} == naive_naked(board, n)
+        hidden = find_hidden_subsets(board, n)
+        assert {(tuple(h["cell"]), frozenset(h["value"])) for h in hidden} == naive_hidden(board, n)
+
+
+def test_eliminations_are_sound_and_unique(boards):
+    for board in boards:
+        solution = solve(board.user_board)
+        for n in (2, 3, 4):
+            for hint in find_naked_subsets(board, n) + find_hidden_subsets(board, n):
+                assert hint["eliminations"]
+                removed = [(e["cell"], e["remove"]) for e in hint["eliminations"]]
+                assert len(removed) == len(set(removed))
+                for (r, c), d in removed:
+                    assert solution[r - 1][c - 1] != d
+
+
+def test_pair_in_row_and_block_is_reported_once(dummy_board):
+    # (0,0) and (0,1) share row 1 and block 1
+    candidates = [[set() for _ in range(9)] for _ in range(9)]
+    candidates[0][0] = {1, 2}
+    candidates[0][1] = {1, 2}
+    candidates[0][5] = {1, 3}
+    candidates[2][2] = {2, 4}
+
+    with patch("hints.utils.board_utils.get_all_candidates", return_value=candidates):
+        findings = find_naked_pairs(dummy_board)
+
+    assert len(findings) == 1
+    hint = findings[0]
+    assert hint["cell"] == [(1, 1), (1, 2)] and hint["value"] == {1, 2}
+    assert hint["where"] == ["row 1", "block starting at (1,1)"]
+    assert hint["reason"] == "Cells [(1, 1), (1, 2)] form naked pair (1, 2) in row 1."
+    assert [(e["cell"], e["remove"]) for e in hint["eliminations"]] == [((1, 6), 1), ((3, 3), 2)]
+    assert hint["eliminations"][0]["reason"] == "Naked Pair in related area (row=1, col=0, block=1)"
+
+
+def test_naked_triple_in_column(dummy_board):
+    candidates = [[set() for _ in range(9)] for _ in range(9)]
+    candidates[0][4] = {1, 2}
+    candidates[3][4] = {2, 3}
+    candidates[8][4] = {1, 3}
+    candidates[5][4] = {1, 2, 3, 7}
+
+    with patch("hints.utils.board_utils.get_all_candidates", return_value=candidates):
+        findings = find_naked_triples(dummy_board)
+
+    assert len(findings) == 1
+    assert findings[0]["technique"] == "Naked Triples"
+    assert findings[0]["where"] == ["column 5"]
+    assert [(e["cell"], e["remove"]) for e in findings[0]["eliminations"]] == [((6, 5), 1), ((6, 5), 2), ((6, 5), 3)]
+
+
+def test_find_eliminations_naked_pairs_matches_engine(boards):
+    checked = 0
+    for board in boards:
+        context = HintContext(board)
+        for hint in find_naked_subsets(board, 2, context):
+            confirmed = [(r - 1, c - 1, v) for r, c in hint["cell"] for v in hint["value"]]
+            assert find_eliminations(board, confirmed, "Naked Pairs", context) == hint["eliminations"]
+            checked += 1
+    assert checked
+    assert get_cell_relation((0, 0), (0, 4)) == ((True, False, False), (0, -1, -1))
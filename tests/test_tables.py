@@ -0,0 +1,58 @@
+# tests/test_tables.py
+from core import tables
+from hints.utils.elimination_utils import (
+    find_eliminations, get_visible_cells, get_common_visible_cells
+)
+
+
+class DummyBoard:
+    def __init__(self, grid):
+        self.user_board = grid
+        self.size = 9
+
+
+# --- Tables ---
+def test_peers_are_twenty_sorted_cells():
+    for i in range(tables.CELL_COUNT):
+        peers = tables.PEERS[i]
+        assert len(peers) == 20
+        assert list(peers) == sorted(peers)
+        assert i not in peers
+        assert set(peers) == tables.PEER_SETS[i]
+
+
+def test_houses_of_matches_houses():
+    for i in range(tables.CELL_COUNT):
+        for h in tables.HOUSES_OF[i]:
+            assert i in tables.HOUSES[h]
+    assert tables.HOUSES_OF[40] == (4, 13, 22)
+    assert tables.BOXES[4] == (30, 31, 32, 39, 40, 41, 48, 49, 50)
+
+
+def test_common_peers():
+    # Same row and same box: rest of the row plus rest of the box
+    assert set(tables.COMMON_PEERS[0][1]) == (set(tables.ROWS[0]) | set(tables.BOXES[0])) - {0, 1}
+    # No shared house: only the two "corner" cells see both
+    assert tables.COMMON_PEERS[0][40] == (4, 36)
+    assert tables.COMMON_PEERS[3][7] == tables.COMMON_PEERS[7][3]
+
+
+# --- Elimination helpers ---
+def test_visible_cells_use_tables():
+    visible = get_visible_cells((4, 4))
+    assert len(visible) == 20
+    assert (4, 0) in visible and (0, 4) in visible and (3, 3) in visible
+    assert (4, 4) not in visible
+    assert get_common_visible_cells([(0, 0), (4, 4)]) == {(0, 4), (4, 0)}
+    assert get_common_visible_cells([]) == set()
+
+
+def test_single_eliminations_only_touch_peers():
+    grid = [[0] * 9 for _ in range(9)]
+    elims = find_eliminations(DummyBoard(grid), [(0, 0, 5)], "Naked Singles")
+
+    assert len(elims) == 20
+    assert all(e["remove"] == 5 for e in elims)
+    # Row-major order, same reason text as before
+    assert elims[0] == {"cell": (1, 2), "remove": 5, "reason": "same row, same block as (1,1)"}
+    assert elims[-1] == {"cell": (9, 1), "remove": 5, "reason": "same column as (1,1)"}
@@ -125,3 +125,48 @@ def test_handle_event(monkeypatch):
 def test_get_elapsed_before_start():
     timer = Timer(font=None, x=0, y=0)
     assert timer.get_elapsed() == 0
+
+def test_timer_caches_label_and_overlay(monkeypatch):
+    font = MagicMock()
+    timer = Timer(font=font, x=0, y=0)
+    fake_time = [100.0]
+    monkeypatch.setattr(time, "time", lambda: fake_time[0])
+    timer.start()
+    screen = MagicMock()
+
+    with patch("pygame.draw.rect"):
+        # Label rendered once per displayed second
+        timer.draw(screen, 200, 200, font)
+        fake_time[0] = 100.5
+        timer.draw(screen, 200, 200, font)
+        assert font.render.call_count == 1
+        fake_time[0] = 101.2
+        timer.draw(screen, 200, 200, font)
+        assert font.render.call_count == 2
+
+    # Overlay built once per screen size
+    with patch.object(timer, "_build_overlay", return_value=MagicMock()) as build:
+        timer.pause()
+        timer.resume_rect = pygame.Rect(0, 0, 1, 1)
+        timer.draw(screen, 200, 200, font)
+        timer.draw(screen, 200, 200, font)
+        assert build.call_count == 1
+        timer.draw(screen, 300, 200, font)
+        assert build.call_count == 2
+
+def test_render_region_fits_the_label_shown(monkeypatch):
+    font = MagicMock()
+    font.size.side_effect = lambda text: (15 * len(text), 20)
+    timer = Timer(font=font, x=0, y=0)
+    fake_time = [1000.0]
+    monkeypatch.setattr(time, "time", lambda: fake_time[0])
+    timer.start()
+
+    assert timer.render_regions()[0].width == 75   # "00:00"
+    fake_time[0] += 100 * 60
+    assert timer.render_regions()[0].width == 90   # "100:00"
+
+    # After a restart the region still covers the wider label being replaced
+    timer.start()
+    assert timer.render_regions()[0].width == 90
+    assert timer.render_regions()[0].width == 75
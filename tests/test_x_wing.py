@@ -0,0 +1,81 @@
+# tests/test_x_wing.py
+from itertools import combinations
+import pytest
+import pygame
+from ui.board import Board
+from core.solver import solve
+from hints.engine.hint_engine import HintEngine
+from hints.utils.context import HintContext
+from hints.heuristics.x_wing import find_fish, find_x_wings, position_masks, FISH_NAMES
+
+
+def naive_fish(board, n):
+    # Cell-by-cell reference: (digit, orientation, base lines) of every fish with eliminations
+    candidates = HintContext(board).candidates
+    found = set()
+    for digit in range(1, 10):
+        for orientation in ("rows", "columns"):
+            def cell(base, other):
+                return (base, other) if orientation == "rows" else (other, base)
+
+            for base in combinations(range(9), n):
+                positions = [{o for o in range(9) if digit in candidates[cell(b, o)[0]][cell(b, o)[1]]}
+                             for b in base]
+                if any(len(p) < 2 for p in positions):
+                    continue
+                cover = set().union(*positions)
+                if len(cover) != n:
+                    continue
+                if any(digit in candidates[cell(b, o)[0]][cell(b, o)[1]]
+                       for o in cover for b in range(9) if b not in base):
+                    found.add((digit, orientation, base))
+    return found
+
+
+@pytest.mark.parametrize("n", [2, 3, 4])
+def test_matches_naive_search(boards, n):
+    for board in boards:
+        hints = find_fish(board, n)
+        found = {(min(hint["value"]), hint["where"][0].split()[0],
+                  tuple(int(x) - 1 for x in hint["where"][0].split(" ", 1)[1].split(", ")))
+                 for hint in hints}
+        assert found == naive_fish(board, n)
+        assert all(hint["technique"] == FISH_NAMES[n] for hint in hints)
+
+
+def test_eliminations_are_sound(boards):
+    for board in boards:
+        solution = solve(board.user_board)
+        for n in (2, 3, 4):
+            for hint in find_fish(board, n):
+                digit = min(hint["value"])
+                assert hint["eliminations"]
+                for elim in hint["eliminations"]:
+                    r, c = elim["cell"]
+                    assert elim["remove"] == digit
+                    assert solution[r - 1][c - 1] != digit
+                    assert (r, c) not in hint["cell"]
+
+
+def test_position_masks():
+    grid = [[0] * 9 for _ in range(9)]
+    grid[0][0] = 5
+    board = Board(size=9, puzzle=grid)
+    row_pos, col_pos = position_masks(HintContext(board))
+    assert row_pos[5][0] == 0                      # placed in row 1
+    assert row_pos[5][1] == 0b111111000            # not in block 1
+    assert col_pos[5][0] == 0 and col_pos[5][3] == 0b111111110
+    assert row_pos[1][0] == 0b111111110            # every empty cell of row 1
+
+
+def test_empty_board_has_no_fish():
+    board = Board(size=9, puzzle=[[0] * 9 for _ in range(9)])
+    assert find_x_wings(board) == []
+
+
+def test_registered_without_fill_notes_key():
+    names = {key: name for key, (name, _) in HintEngine.HEURISTICS.items()}
+    assert names[pygame.K_d] == "X-Wing"
+    assert names[pygame.K_e] == "Swordfish"
+    assert names[pygame.K_g] == "Jellyfish"
+    assert pygame.K_f not in names